@@ -1,132 +1,32 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import requests
 import json
-import time
 from prediction_engine import StockPredictionEngine
+from market_context import MarketContext
+from http_pool import inference_http
+from circuit_breaker import breaker_for
+from inference import cached_classification, classify, backend_available, is_local_backend, FINBERT_MODEL, INFERENCE_URL
 
 class AnalysisEngine:
-    def __init__(self):
-        self.prediction_engine = StockPredictionEngine()
+    def __init__(self, prediction_engine=None):
+        self.prediction_engine = prediction_engine or StockPredictionEngine()
+        # Market and sector bars come from the same local store as stock history
+        self.store = self.prediction_engine.store
+        # SPY, ^TNX and sector ETFs are the same for every ticker; fetch them once per refresh
+        self.market_context = MarketContext(self.store)
 
     def get_market_sentiment(self):
         """Analyze overall market sentiment"""
-        try:
-            # Get major indices
-            time.sleep(0.5)  # Rate limiting
-            spy = yf.Ticker("SPY")
-            spy_hist = spy.history(period="1mo")
-
-            if spy_hist is None or spy_hist.empty:
-                raise Exception("No SPY data")
-
-            # Calculate market trend
-            current = spy_hist['Close'].iloc[-1]
-            month_ago = spy_hist['Close'].iloc[0]
-            change = ((current - month_ago) / month_ago) * 100
-
-            if change > 3:
-                sentiment = "Bullish"
-            elif change < -3:
-                sentiment = "Bearish"
-            else:
-                sentiment = "Neutral"
-
-            return {
-                'sentiment': sentiment,
-                'spy_change': round(change, 2),
-                'description': f"Market has moved {change:.2f}% in the last month"
-            }
-        except Exception as e:
-            print(f"Error getting market sentiment: {e}")
-            return {
-                'sentiment': 'Neutral',
-                'spy_change': 0,
-                'description': 'Market data unavailable'
-            }
+        return self.market_context.market_sentiment()
 
     def analyze_sector_performance(self, sector):
         """Analyze sector performance"""
-        sector_etfs = {
-            'Technology': 'XLK',
-            'Healthcare': 'XLV',
-            'Financials': 'XLF',
-            'Energy': 'XLE',
-            'Consumer Discretionary': 'XLY',
-            'Consumer Staples': 'XLP',
-            'Industrials': 'XLI',
-            'Materials': 'XLB',
-            'Real Estate': 'XLRE',
-            'Utilities': 'XLU',
-            'Communication Services': 'XLC'
-        }
-
-        try:
-            etf = sector_etfs.get(sector, 'SPY')
-            time.sleep(0.5)  # Rate limiting
-            ticker = yf.Ticker(etf)
-            hist = ticker.history(period='3mo')
-
-            if hist is None or hist.empty:
-                raise Exception(f"No data for {etf}")
-
-            current = hist['Close'].iloc[-1]
-            three_months_ago = hist['Close'].iloc[0]
-            change = ((current - three_months_ago) / three_months_ago) * 100
-
-            return {
-                'sector': sector,
-                'performance': round(change, 2),
-                'trend': 'Outperforming' if change > 5 else 'Underperforming' if change < -5 else 'In-line',
-                'description': f"{sector} sector has moved {change:.2f}% in the last 3 months"
-            }
-        except Exception as e:
-            print(f"Error analyzing sector {sector}: {e}")
-            return {
-                'sector': sector,
-                'performance': 0,
-                'trend': 'Unknown',
-                'description': 'Sector data unavailable'
-            }
+        return self.market_context.sector_performance(sector)
 
     def analyze_interest_rate_impact(self):
         """Analyze interest rate environment"""
-        try:
-            # Get 10-year treasury yield as proxy
-            time.sleep(0.5)  # Rate limiting
-            tnx = yf.Ticker("^TNX")
-            tnx_hist = tnx.history(period="3mo")
-
-            if tnx_hist is None or tnx_hist.empty:
-                raise Exception("No TNX data")
-
-            current_yield = tnx_hist['Close'].iloc[-1]
-            three_months_ago = tnx_hist['Close'].iloc[0]
-            change = current_yield - three_months_ago
-
-            if current_yield > 4.5:
-                impact = "Negative for growth stocks, positive for financials"
-            elif current_yield < 3.5:
-                impact = "Positive for growth stocks, lower bank margins"
-            else:
-                impact = "Neutral environment for equities"
-
-            return {
-                'current_yield': round(current_yield, 2),
-                'change_3m': round(change, 2),
-                'impact': impact,
-                'description': f"10-year yield at {current_yield:.2f}%, {change:+.2f}% change in 3 months"
-            }
-        except Exception as e:
-            print(f"Error analyzing interest rates: {e}")
-            return {
-                'current_yield': 4.0,
-                'change_3m': 0,
-                'impact': 'Data unavailable',
-                'description': 'Interest rate data unavailable'
-            }
+        return self.market_context.interest_rate()
 
     def get_economic_indicators(self):
         """Get economic indicators context"""
@@ -172,48 +72,64 @@ class AnalysisEngine:
             import os
             api_key = os.environ.get('HF_API_KEY') or os.environ.get('HUGGINGFACE_API_KEY')
 
-            if not api_key:
+            if not backend_available(api_key):
                 # Gracefully skip if no API key is provided
                 print("FinBERT: No Hugging Face API key found. Using rule-based analysis only.")
                 print("To enable FinBERT AI sentiment: Set HF_API_KEY environment variable")
                 return None
 
-            API_URL = "https://api-inference.huggingface.co/models/ProsusAI/finbert"
-
             # Create a financial context sentence about the stock
             text = f"{company_name} ({ticker}) stock analysis shows current market performance and technical indicators."
 
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            }
-            payload = {"inputs": text}
+            if is_local_backend():
+                # Local backend: same positive/negative/neutral labels, no network
+                sentiments = classify(text, model=FINBERT_MODEL)
+            else:
+                sentiments = self._hosted_finbert(text, api_key)
+
+            if sentiments:
+                top_sentiment = max(sentiments, key=lambda x: x['score'])
+                return {
+                    'sentiment': top_sentiment['label'],
+                    'score': top_sentiment['score'],
+                    'all_scores': sentiments
+                }
+            return None
+
+        except Exception as e:
+            print(f"Error getting FinBERT sentiment: {e}")
+            return None
+
+    def _hosted_finbert(self, text, api_key):
+        """FinBERT label scores from the hosted inference API, or None"""
+        API_URL = f"{INFERENCE_URL}/models/{FINBERT_MODEL}"
 
-            response = requests.post(API_URL, headers=headers, json=payload, timeout=10)
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {"inputs": text}
+
+        def fetch():
+            response = inference_http.post(API_URL, headers=headers, json=payload, timeout=10)
 
             if response.status_code == 200:
                 result = response.json()
                 if isinstance(result, list) and len(result) > 0:
                     # FinBERT returns sentiment scores for positive, negative, neutral
-                    sentiments = result[0]
-                    top_sentiment = max(sentiments, key=lambda x: x['score'])
-                    return {
-                        'sentiment': top_sentiment['label'],
-                        'score': top_sentiment['score'],
-                        'all_scores': sentiments
-                    }
+                    return result[0]
             elif response.status_code == 503:
-                # Model is loading, this is common on free tier
+                # Model is loading, this is common on free tier; the breaker holds off retries
                 print("FinBERT: Model is loading on Hugging Face. Using rule-based analysis.")
-                return None
+                raise Exception(f"FinBERT 503: model is loading {response.text[:200]}")
             else:
                 print(f"FinBERT API response: {response.status_code}")
-                return None
-
-        except Exception as e:
-            print(f"Error getting FinBERT sentiment: {e}")
             return None
 
+        # Same text for the same company, so repeat analyses are served from the cache
+        breaker = breaker_for(FINBERT_MODEL)
+        return cached_classification(FINBERT_MODEL, text, lambda: breaker.call(fetch))
+
     def generate_llm_analysis(self, ticker, data):
         """Generate AI-powered analysis summary using FinBERT"""
         score = data.get('prediction_score', 50)
@@ -1,25 +1,129 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 from flask_cors import CORS
-import yfinance as yf
-import pandas as pd
 from datetime import datetime, timedelta
 import os
-import requests
+import threading
 import time
-from huggingface_hub import InferenceClient
-from prediction_engine import StockPredictionEngine
-from analysis_engine import AnalysisEngine
+from concurrent.futures import ThreadPoolExecutor
+from snapshot_scheduler import SnapshotScheduler, background_refresh_enabled
+from rate_limiter import yahoo_limiter
+from singleflight import BroadcastGroup, SingleFlightCache
+from task_graph import TaskGraph
+from peer_scoreboard import PeerIndex, PeerScoreboard
+from json_response import OrjsonProvider, ResponseCompressor
+import http_cache
+import warm_snapshot
+from http_cache import API_CACHE_SECONDS
+import inference
+from inference import classify, backend_available, SENTIMENT_MODEL
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
-# Initialize engines
-prediction_engine = StockPredictionEngine()
-analysis_engine = AnalysisEngine()
+# Negotiated gzip/brotli for large JSON and page responses
+response_compressor = ResponseCompressor()
+
+@app.after_request
+def finalize_response(response):
+    """Validators and Cache-Control first (so 304s skip compression), then compression"""
+    response = http_cache.finalize(response, request)
+    return response_compressor(response)
+
+# Engines (and with them pandas, numpy and yfinance) are created on first use,
+# so a serverless cold start serving a page or the methodology skips them
+_prediction_engine = None
+_analysis_engine = None
+_engine_lock = threading.Lock()
+
+def get_prediction_engine():
+    """The shared StockPredictionEngine, created on first use"""
+    global _prediction_engine
+    if _prediction_engine is None:
+        with _engine_lock:
+            if _prediction_engine is None:
+                from prediction_engine import StockPredictionEngine
+                engine = StockPredictionEngine()
+                if warm_start is not None:
+                    seeded = warm_snapshot.seed_fundamentals(engine.fundamentals, warm_start)
+                    print(f"Seeded {seeded} fundamentals from the warm-start snapshot")
+                _prediction_engine = engine
+    return _prediction_engine
+
+def get_analysis_engine():
+    """The shared AnalysisEngine, created on first use"""
+    global _analysis_engine
+    if _analysis_engine is None:
+        prediction_engine = get_prediction_engine()
+        with _engine_lock:
+            if _analysis_engine is None:
+                from analysis_engine import AnalysisEngine
+                _analysis_engine = AnalysisEngine(prediction_engine)
+    return _analysis_engine
+
+# Per-ticker analyses are shared between concurrent requests and reused briefly
+analysis_cache = SingleFlightCache(ttl=float(os.environ.get('ANALYSIS_CACHE_TTL', 120)))
+# In-flight StockScore analyses that streaming requests follow, one per ticker
+stockscore_streams = BroadcastGroup('stockscore')
+
+# StockScore sections run as a concurrent task graph; peers fan out on their own
+# pool so a section waiting on peer results can never starve them of workers
+stockscore_executor = ThreadPoolExecutor(max_workers=int(os.environ.get('STOCKSCORE_WORKERS', 16)),
+                                         thread_name_prefix='stockscore')
+peer_executor = ThreadPoolExecutor(max_workers=int(os.environ.get('PEER_WORKERS', 8)),
+                                   thread_name_prefix='peers')
+
+# Tickers scored together within a shard (UNIVERSE_SHARD_SIZE); streamed requests see results chunk by chunk
+TOP_STOCKS_STREAM_CHUNK = int(os.environ.get('TOP_STOCKS_STREAM_CHUNK', 25))
+# Analyzed stocks a top-stocks broadcast keeps for requests that join mid-run
+TOP_STOCKS_STREAM_BUFFER = int(os.environ.get('TOP_STOCKS_STREAM_BUFFER', 500))
+
+
+def compute_top_stocks(progress):
+    """Rank the universe, pushing each analyzed stock to the in-flight broadcast"""
+    rankings = get_prediction_engine().rank_universe(chunk_size=TOP_STOCKS_STREAM_CHUNK, on_result=progress.push)
+    return rankings.result()
+
+
+# Top stocks ranking is recomputed in the background and served as a snapshot;
+# streamed requests tail the one in-flight computation
+top_stocks_scheduler = SnapshotScheduler(
+    'top-stocks',
+    compute_top_stocks,
+    market_interval=int(os.environ.get('TOP_STOCKS_REFRESH_SECONDS', 900)),
+    off_hours_interval=int(os.environ.get('TOP_STOCKS_OFF_HOURS_REFRESH_SECONDS', 3600)),
+    streams=True,
+    stream_buffer=TOP_STOCKS_STREAM_BUFFER
+)
+
+# Snapshot bundled with the deployment (built by warm_snapshot.py), served
+# until the first fresh ranking is computed
+warm_start = warm_snapshot.load()
+if warm_start is not None:
+    loaded = top_stocks_scheduler.publish(warm_start['top_stocks'],
+                                          generated_at=warm_snapshot.generated_at(warm_start),
+                                          source='warm-start')
+    print(f"Loaded warm-start top stocks snapshot from {warm_start['generated_at']} "
+          f"({round(loaded.age_seconds() / 60)} min old)")
+
+# Peer price changes and sentiment for every grouped stock, rebuilt in the
+# background so peer alternatives are an in-memory lookup
+peer_index = PeerIndex()
+peer_scoreboard = PeerScoreboard(
+    lambda peer_ticker: analyze_peer(peer_ticker),
+    index=peer_index,
+    prefetch_fn=lambda tickers: get_prediction_engine().store.refresh(tickers)
+)
+peer_scoreboard_scheduler = SnapshotScheduler(
+    'peer-scoreboard',
+    peer_scoreboard.build,
+    market_interval=int(os.environ.get('PEER_SCOREBOARD_REFRESH_SECONDS', 1800)),
+    off_hours_interval=int(os.environ.get('PEER_SCOREBOARD_OFF_HOURS_REFRESH_SECONDS', 7200))
+)
 
 @app.route('/')
 def index():
@@ -31,15 +135,29 @@ def stockscore():
 
 @app.route('/api/top-stocks')
 def get_top_stocks():
-    """Get top 20 stocks for short, mid, and long term"""
+    """Get top 20 stocks for short, mid, and long term from the latest snapshot"""
     try:
-        print("Starting top stocks analysis...")
-        top_stocks = prediction_engine.get_top_20_stocks()
-        print(f"Analysis complete. Found {len(top_stocks.get('short_term', []))} stocks")
-        return jsonify({
+        if background_refresh_enabled():
+            top_stocks_scheduler.start()
+
+        snapshot = top_stocks_scheduler.get()
+
+        # Cacheable until the snapshot is due to be replaced; the ETag only
+        # changes when a new snapshot is published
+        max_age = min(API_CACHE_SECONDS, top_stocks_scheduler.next_interval() - snapshot.age_seconds())
+        etag = http_cache.snapshot_etag('top-stocks', snapshot)
+        matched = http_cache.matched_etag(etag, request.if_none_match)
+        if matched is not None:
+            return http_cache.not_modified(app.response_class, matched, max_age)
+
+        top_stocks = snapshot.data
+        print(f"Serving top stocks snapshot v{snapshot.version} ({len(top_stocks.get('short_term', []))} stocks)")
+        return http_cache.cache_response(jsonify({
             'success': True,
-            'data': top_stocks
-        })
+            'data': top_stocks,
+            'generated_at': snapshot.generated_at.isoformat(),
+            'age_seconds': round(snapshot.age_seconds(), 1)
+        }), max_age, etag)
     except Exception as e:
         import traceback
         print(f"Error in get_top_stocks: {e}")
@@ -50,13 +168,78 @@ def get_top_stocks():
             'details': traceback.format_exc()
         }), 500
 
+@app.route('/api/top-stocks/stream')
+def stream_top_stocks():
+    """Stream each analyzed stock as an NDJSON line, then the ranked summary.
+
+    A current snapshot is replayed immediately. Otherwise the request tails
+    the scheduler's one in-flight computation (starting it if none is
+    running), so concurrent page loads share a single pass over the
+    universe; the finished ranking is published as the new snapshot.
+    """
+    def event(payload):
+        return app.json.dumps(payload) + '\n'
+
+    def replay(snapshot):
+        seen = set()
+        for timeframe in ('short_term', 'mid_term', 'long_term'):
+            for stock in snapshot.data.get(timeframe, []):
+                if stock['ticker'] not in seen:
+                    seen.add(stock['ticker'])
+                    yield event({'type': 'stock', 'data': stock})
+        yield summary(snapshot)
+
+    def summary(snapshot):
+        return event({
+            'type': 'summary',
+            'data': snapshot.data,
+            'generated_at': snapshot.generated_at.isoformat(),
+            'age_seconds': round(snapshot.age_seconds(), 1)
+        })
+
+    def generate():
+        if background_refresh_enabled():
+            top_stocks_scheduler.start()
+
+        snapshot = top_stocks_scheduler.current()
+        if snapshot is not None and snapshot.source == 'warm-start':
+            # Replay the bundled snapshot; get() starts the background refresh if it is stale
+            snapshot = top_stocks_scheduler.get()
+        if snapshot is not None and (top_stocks_scheduler.is_running() or snapshot.source == 'warm-start'
+                                     or snapshot.age_seconds() < top_stocks_scheduler.next_interval()):
+            yield from replay(snapshot)
+            return
+
+        progress = top_stocks_scheduler.follow()
+        if progress is None:
+            # Backing off after a failed refresh: serve the previous ranking
+            yield from replay(snapshot)
+            return
+
+        try:
+            for stock in progress.follow():
+                yield event({'type': 'stock', 'data': stock})
+        except Exception as e:
+            print(f"Error streaming top stocks: {e}")
+            yield event({'type': 'error', 'error': str(e)})
+            return
+        yield summary(progress.result or top_stocks_scheduler.current())
+
+    return Response(generate(), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/search/<ticker>')
 def search_stock(ticker):
     """Search and analyze a specific stock"""
     try:
         ticker = ticker.upper()
         print(f"Searching for ticker: {ticker}")
-        analysis = analysis_engine.analyze_stock(ticker)
+        # Concurrent searches for the same ticker share one analysis
+        analysis = analysis_cache.get_or_compute(
+            ('search', ticker),
+            lambda: get_analysis_engine().analyze_stock(ticker),
+            should_cache=lambda result: bool(result) and 'error' not in result
+        )
 
         if analysis and 'error' in analysis:
             return jsonify({
@@ -64,10 +247,10 @@ def search_stock(ticker):
                 'error': analysis['error']
             }), 404
 
-        return jsonify({
+        return http_cache.cache_response(jsonify({
             'success': True,
             'data': analysis
-        })
+        }), API_CACHE_SECONDS)
     except Exception as e:
         import traceback
         print(f"Error in search_stock for {ticker}: {e}")
@@ -78,494 +261,525 @@ def search_stock(ticker):
             'details': traceback.format_exc()
         }), 500
 
-@app.route('/api/methodology')
-def get_methodology():
-    """Get the analysis methodology description"""
-    methodology = {
-        'title': 'Stock Analysis Methodology',
-        'description': '''Our comprehensive stock prediction system utilizes multiple data sources and analytical approaches to provide multi-factor quantitative analysis across three timeframes (short: 1-3 months, mid: 3-12 months, long: 1-3 years).''',
-        'components': [
-            {
-                'name': 'Technical Analysis',
-                'description': 'Analyzes historical price patterns and trading data using multiple indicators to identify trends, momentum, and potential entry/exit points.',
-                'what': 'Technical analysis studies past market data, primarily price and volume, to forecast future price movements. It operates on the principle that historical trading activity and price changes are indicators of future price behavior.',
-                'how': 'Our system calculates and analyzes 6 key technical indicators in real-time, comparing current values against historical patterns and established thresholds. Each indicator is weighted and contributes to a composite technical score.',
-                'details': {
-                    'indicators': [
-                        {
-                            'name': 'Simple Moving Averages (SMA 20, 50, 200)',
-                            'what': 'Averages of closing prices over specified periods that smooth out price data to identify trend direction',
-                            'how': 'We calculate 20-day, 50-day, and 200-day SMAs. When price is above SMA, it signals uptrend (+5 points each for 50-day and 200-day). The "Golden Cross" (50-day crossing above 200-day) adds +5 points, indicating strong bullish momentum',
-                            'interpretation': 'Price above SMA = bullish, below = bearish. Multiple timeframe alignment increases confidence'
-                        },
-                        {
-                            'name': 'Exponential Moving Averages (EMA 12, 26)',
-                            'what': 'Weighted moving averages that give more importance to recent prices, making them more responsive to new information',
-                            'how': 'EMA 12 and 26 are calculated with exponential weighting. Used primarily for MACD calculation to capture short-term price momentum',
-                            'interpretation': 'Faster response to price changes than SMA, better for identifying trend reversals early'
-                        },
-                        {
-                            'name': 'Relative Strength Index (RSI)',
-                            'what': 'Momentum oscillator measuring speed and magnitude of price changes on a 0-100 scale',
-                            'how': 'Calculated using 14-period average gains vs losses. RSI 30-70 adds +5 points (healthy), RSI < 30 adds +3 points (oversold bounce potential), RSI > 70 subtracts 3 points (overbought risk)',
-                            'interpretation': 'RSI > 70 = overbought (potential sell), RSI < 30 = oversold (potential buy), 40-60 = neutral trend'
-                        },
-                        {
-                            'name': 'MACD (Moving Average Convergence Divergence)',
-                            'what': 'Trend-following momentum indicator showing relationship between two moving averages',
-                            'how': 'MACD Line = EMA(12) - EMA(26), Signal Line = 9-day EMA of MACD. Bullish crossover (MACD above signal) adds +5 points',
-                            'interpretation': 'MACD above signal = buy signal, below = sell signal. Divergences between MACD and price indicate potential reversals'
-                        },
-                        {
-                            'name': 'Bollinger Bands',
-                            'what': 'Volatility bands placed above and below a moving average, adapting to volatility changes',
-                            'how': 'Middle band = 20-day SMA, upper/lower bands = ±2 standard deviations. Price position relative to bands indicates overbought/oversold conditions',
-                            'interpretation': 'Price at upper band = overbought, at lower band = oversold. Band squeeze indicates low volatility before potential breakout'
-                        },
-                        {
-                            'name': 'Volume Analysis',
-                            'what': 'Analysis of trading volume to confirm price movements and identify institutional activity',
-                            'how': 'Compares current volume to 20-day average. Above-average volume adds +5 points as it confirms the price trend validity',
-                            'interpretation': 'High volume + price increase = strong buy pressure. Low volume rallies often fail'
-                        }
-                    ],
-                    'scoring': 'Technical indicators contribute up to 30 points to the overall prediction score. Base score starts at 50 (neutral), technical factors add or subtract based on signal strength',
-                    'source': 'Historical OHLCV (Open, High, Low, Close, Volume) data from Yahoo Finance',
-                    'refresh_frequency': 'Indicators recalculated on every analysis request using latest available data'
-                }
-            },
-            {
-                'name': 'Fundamental Analysis',
-                'description': 'Evaluates company financial health, profitability, and valuation metrics to assess intrinsic value and long-term viability.',
-                'what': 'Fundamental analysis examines a company\'s financial statements, management quality, competitive advantages, and industry position to determine whether a stock is overvalued or undervalued relative to its true worth.',
-                'how': 'We extract key financial metrics from company reports and calculate ratios that indicate financial health. These metrics are compared against industry benchmarks and historical averages to generate a fundamental score.',
-                'details': {
-                    'metrics': [
-                        {
-                            'name': 'Forward P/E Ratio (Price-to-Earnings)',
-                            'what': 'Valuation ratio comparing stock price to projected future earnings per share',
-                            'how': 'Forward P/E = Current Stock Price ÷ Expected Earnings Per Share (next 12 months). We score: 10-25 (+10 points for reasonable valuation), <10 (+5 points for potentially undervalued), >25 (neutral to negative)',
-                            'interpretation': 'Lower P/E suggests undervaluation or lower growth expectations. Industry comparison is critical - tech stocks typically have higher P/E than utilities',
-                            'benchmark': 'S&P 500 average P/E: ~15-20. Growth stocks: 25-40+. Value stocks: 10-15'
-                        },
-                        {
-                            'name': 'Profit Margins',
-                            'what': 'Net profit as percentage of total revenue, indicating pricing power and operational efficiency',
-                            'how': 'Profit Margin = (Net Income ÷ Revenue) × 100. Margins >15% add +5 points, indicating strong profitability and competitive moats',
-                            'interpretation': 'High margins suggest strong pricing power, efficient operations, or monopolistic advantages. Declining margins may indicate increased competition',
-                            'benchmark': 'Software: 20-30%, Retail: 2-5%, Banks: 20-25%, Manufacturing: 5-10%'
-                        },
-                        {
-                            'name': 'Return on Equity (ROE)',
-                            'what': 'Measures how efficiently company uses shareholder equity to generate profits',
-                            'how': 'ROE = (Net Income ÷ Shareholders\' Equity) × 100. ROE >15% adds +5 points, indicating management efficiently deploys capital',
-                            'interpretation': 'High ROE indicates effective management and competitive advantage. Consistently high ROE (>20%) is rare and valuable',
-                            'benchmark': 'Excellent: >20%, Good: 15-20%, Average: 10-15%, Poor: <10%'
-                        }
-                    ],
-                    'scoring': 'Fundamental metrics contribute up to 20 points to the overall prediction score. Combined with technical analysis (30 points), total possible score is 100',
-                    'source': 'Company financial data from Yahoo Finance API, updated quarterly with earnings reports',
-                    'limitations': 'Some companies (especially newer/smaller) may have incomplete fundamental data. In such cases, technical analysis is weighted more heavily',
-                    'note': 'All stocks start with a baseline score of 50 (neutral), with technical and fundamental factors adding or subtracting points'
-                }
-            },
-            {
-                'name': 'AI-Powered Financial Sentiment Analysis',
-                'description': 'Uses FinBERT, a pre-trained NLP model fine-tuned on financial text, to provide AI-driven sentiment analysis that complements quantitative scores.',
-                'what': 'FinBERT (Financial BERT) is a state-of-the-art natural language processing model specifically trained on financial news, earnings calls, and market commentary. It classifies financial text sentiment as positive, negative, or neutral with confidence scores.',
-                'how': 'We send stock-specific text to Hugging Face\'s free FinBERT API (ProsusAI/finbert model). The model analyzes the context and returns sentiment probabilities. This AI sentiment is combined with our quantitative technical and fundamental scores to generate comprehensive investment outlooks.',
-                'details': {
-                    'model': 'ProsusAI/finbert - Pre-trained on 1.8M financial news articles, fine-tuned for financial sentiment classification',
-                    'implementation': 'Real-time API calls to Hugging Face Inference API (free tier) - OPTIONAL: Requires HF_API_KEY environment variable',
-                    'setup': 'See FINBERT_SETUP.md for instructions. Application works perfectly without FinBERT using rule-based analysis.',
-                    'sentiment_categories': {
-                        'positive': 'Bullish outlook - favorable market conditions, strong fundamentals, positive momentum',
-                        'neutral': 'Mixed signals - balanced risk-reward, requires further monitoring',
-                        'negative': 'Bearish outlook - weak indicators, concerning patterns, unfavorable conditions'
+@app.route('/api/stats')
+def get_stats():
+    """Report cache and data-store counters"""
+    prediction_engine = get_prediction_engine()
+    response = jsonify({
+        'success': True,
+        'data': {
+            'fundamentals_cache': prediction_engine.fundamentals.stats(),
+            'ohlcv_store': dict(prediction_engine.store.stats),
+            'top_stocks_scheduler': top_stocks_scheduler.stats(),
+            'peer_scoreboard_scheduler': peer_scoreboard_scheduler.stats(),
+            'yahoo_rate_limiter': yahoo_limiter.stats(),
+            'analysis_cache': analysis_cache.stats(),
+            'stockscore_streams': stockscore_streams.stats(),
+            'market_context': get_analysis_engine().market_context.stats(),
+            'inference': inference.stats(),
+            'compression': response_compressor.stats()
+        }
+    })
+    response.cache_control.no_store = True
+    return response
+
+# Static methodology document, built once at import
+METHODOLOGY = {
+    'title': 'Stock Analysis Methodology',
+    'description': '''Our comprehensive stock prediction system utilizes multiple data sources and analytical approaches to provide multi-factor quantitative analysis across three timeframes (short: 1-3 months, mid: 3-12 months, long: 1-3 years).''',
+    'components': [
+        {
+            'name': 'Technical Analysis',
+            'description': 'Analyzes historical price patterns and trading data using multiple indicators to identify trends, momentum, and potential entry/exit points.',
+            'what': 'Technical analysis studies past market data, primarily price and volume, to forecast future price movements. It operates on the principle that historical trading activity and price changes are indicators of future price behavior.',
+            'how': 'Our system calculates and analyzes 6 key technical indicators in real-time, comparing current values against historical patterns and established thresholds. Each indicator is weighted and contributes to a composite technical score.',
+            'details': {
+                'indicators': [
+                    {
+                        'name': 'Simple Moving Averages (SMA 20, 50, 200)',
+                        'what': 'Averages of closing prices over specified periods that smooth out price data to identify trend direction',
+                        'how': 'We calculate 20-day, 50-day, and 200-day SMAs. When price is above SMA, it signals uptrend (+5 points each for 50-day and 200-day). The "Golden Cross" (50-day crossing above 200-day) adds +5 points, indicating strong bullish momentum',
+                        'interpretation': 'Price above SMA = bullish, below = bearish. Multiple timeframe alignment increases confidence'
+                    },
+                    {
+                        'name': 'Exponential Moving Averages (EMA 12, 26)',
+                        'what': 'Weighted moving averages that give more importance to recent prices, making them more responsive to new information',
+                        'how': 'EMA 12 and 26 are calculated with exponential weighting. Used primarily for MACD calculation to capture short-term price momentum',
+                        'interpretation': 'Faster response to price changes than SMA, better for identifying trend reversals early'
+                    },
+                    {
+                        'name': 'Relative Strength Index (RSI)',
+                        'what': 'Momentum oscillator measuring speed and magnitude of price changes on a 0-100 scale',
+                        'how': 'Calculated using 14-period average gains vs losses. RSI 30-70 adds +5 points (healthy), RSI < 30 adds +3 points (oversold bounce potential), RSI > 70 subtracts 3 points (overbought risk)',
+                        'interpretation': 'RSI > 70 = overbought (potential sell), RSI < 30 = oversold (potential buy), 40-60 = neutral trend'
+                    },
+                    {
+                        'name': 'MACD (Moving Average Convergence Divergence)',
+                        'what': 'Trend-following momentum indicator showing relationship between two moving averages',
+                        'how': 'MACD Line = EMA(12) - EMA(26), Signal Line = 9-day EMA of MACD. Bullish crossover (MACD above signal) adds +5 points',
+                        'interpretation': 'MACD above signal = buy signal, below = sell signal. Divergences between MACD and price indicate potential reversals'
+                    },
+                    {
+                        'name': 'Bollinger Bands',
+                        'what': 'Volatility bands placed above and below a moving average, adapting to volatility changes',
+                        'how': 'Middle band = 20-day SMA, upper/lower bands = ±2 standard deviations. Price position relative to bands indicates overbought/oversold conditions',
+                        'interpretation': 'Price at upper band = overbought, at lower band = oversold. Band squeeze indicates low volatility before potential breakout'
+                    },
+                    {
+                        'name': 'Volume Analysis',
+                        'what': 'Analysis of trading volume to confirm price movements and identify institutional activity',
+                        'how': 'Compares current volume to 20-day average. Above-average volume adds +5 points as it confirms the price trend validity',
+                        'interpretation': 'High volume + price increase = strong buy pressure. Low volume rallies often fail'
+                    }
+                ],
+                'scoring': 'Technical indicators contribute up to 30 points to the overall prediction score. Base score starts at 50 (neutral), technical factors add or subtract based on signal strength',
+                'source': 'Historical OHLCV (Open, High, Low, Close, Volume) data from Yahoo Finance',
+                'refresh_frequency': 'Indicators recalculated on every analysis request using latest available data'
+            }
+        },
+        {
+            'name': 'Fundamental Analysis',
+            'description': 'Evaluates company financial health, profitability, and valuation metrics to assess intrinsic value and long-term viability.',
+            'what': 'Fundamental analysis examines a company\'s financial statements, management quality, competitive advantages, and industry position to determine whether a stock is overvalued or undervalued relative to its true worth.',
+            'how': 'We extract key financial metrics from company reports and calculate ratios that indicate financial health. These metrics are compared against industry benchmarks and historical averages to generate a fundamental score.',
+            'details': {
+                'metrics': [
+                    {
+                        'name': 'Forward P/E Ratio (Price-to-Earnings)',
+                        'what': 'Valuation ratio comparing stock price to projected future earnings per share',
+                        'how': 'Forward P/E = Current Stock Price ÷ Expected Earnings Per Share (next 12 months). We score: 10-25 (+10 points for reasonable valuation), <10 (+5 points for potentially undervalued), >25 (neutral to negative)',
+                        'interpretation': 'Lower P/E suggests undervaluation or lower growth expectations. Industry comparison is critical - tech stocks typically have higher P/E than utilities',
+                        'benchmark': 'S&P 500 average P/E: ~15-20. Growth stocks: 25-40+. Value stocks: 10-15'
+                    },
+                    {
+                        'name': 'Profit Margins',
+                        'what': 'Net profit as percentage of total revenue, indicating pricing power and operational efficiency',
+                        'how': 'Profit Margin = (Net Income ÷ Revenue) × 100. Margins >15% add +5 points, indicating strong profitability and competitive moats',
+                        'interpretation': 'High margins suggest strong pricing power, efficient operations, or monopolistic advantages. Declining margins may indicate increased competition',
+                        'benchmark': 'Software: 20-30%, Retail: 2-5%, Banks: 20-25%, Manufacturing: 5-10%'
                     },
-                    'score_interpretation': [
-                        'Score 70-100: "Strong Buy" - High confidence positive outlook, strong technical & fundamental alignment',
-                        'Score 60-69: "Buy" - Positive momentum and fundamentals, favorable entry point',
-                        'Score 50-59: "Hold" - Balanced risk-reward profile, monitor for trend development',
-                        'Score 40-49: "Cautious" - Mixed signals requiring careful monitoring before position entry',
-                        'Score 0-39: "Avoid" - Concerning technical patterns, weak fundamentals'
-                    ],
-                    'output': 'AI-generated natural language summary combining FinBERT sentiment, quantitative score, technical reasons, and sector context',
-                    'accuracy': 'FinBERT achieves ~97% accuracy on financial sentiment classification tasks (significantly better than general-purpose sentiment models)',
-                    'fallback': 'If FinBERT API is unavailable, system falls back to rule-based analysis using quantitative scores only'
-                }
-            },
-            {
-                'name': 'Large Language Models (LLMs) Used in Analysis',
-                'description': 'Detailed breakdown of the specific Large Language Models integrated into the stock analysis pipeline, including algorithmic steps and processing workflow.',
-                'what': 'Large Language Models (LLMs) are advanced artificial intelligence systems trained on massive amounts of text data to understand and generate human-like text. In financial analysis, specialized financial LLMs can interpret market sentiment, analyze news, and provide natural language insights that complement quantitative metrics.',
-                'how': 'Our system integrates financial-specific LLMs through API calls, processes stock data through multi-step algorithms, and combines AI-generated insights with technical and fundamental analysis to produce comprehensive stock recommendations.',
-                'llms_integrated': [
                     {
-                        'name': 'FinBERT (Financial Bidirectional Encoder Representations from Transformers)',
-                        'provider': 'Hugging Face (ProsusAI/finbert)',
-                        'model_type': 'Transformer-based language model (BERT architecture)',
-                        'specialization': 'Financial sentiment analysis and market text classification',
-                        'training_data': {
-                            'corpus_size': '1.8 million financial documents',
-                            'sources': 'Financial news articles, earnings call transcripts, analyst reports, SEC filings, market commentary',
-                            'training_approach': 'Pre-trained on general text (BERT-base), then fine-tuned on financial domain corpus',
-                            'languages': 'English (financial terminology and jargon)'
+                        'name': 'Return on Equity (ROE)',
+                        'what': 'Measures how efficiently company uses shareholder equity to generate profits',
+                        'how': 'ROE = (Net Income ÷ Shareholders\' Equity) × 100. ROE >15% adds +5 points, indicating management efficiently deploys capital',
+                        'interpretation': 'High ROE indicates effective management and competitive advantage. Consistently high ROE (>20%) is rare and valuable',
+                        'benchmark': 'Excellent: >20%, Good: 15-20%, Average: 10-15%, Poor: <10%'
+                    }
+                ],
+                'scoring': 'Fundamental metrics contribute up to 20 points to the overall prediction score. Combined with technical analysis (30 points), total possible score is 100',
+                'source': 'Company financial data from Yahoo Finance API, updated quarterly with earnings reports',
+                'limitations': 'Some companies (especially newer/smaller) may have incomplete fundamental data. In such cases, technical analysis is weighted more heavily',
+                'note': 'All stocks start with a baseline score of 50 (neutral), with technical and fundamental factors adding or subtracting points'
+            }
+        },
+        {
+            'name': 'AI-Powered Financial Sentiment Analysis',
+            'description': 'Uses FinBERT, a pre-trained NLP model fine-tuned on financial text, to provide AI-driven sentiment analysis that complements quantitative scores.',
+            'what': 'FinBERT (Financial BERT) is a state-of-the-art natural language processing model specifically trained on financial news, earnings calls, and market commentary. It classifies financial text sentiment as positive, negative, or neutral with confidence scores.',
+            'how': 'We send stock-specific text to Hugging Face\'s free FinBERT API (ProsusAI/finbert model). The model analyzes the context and returns sentiment probabilities. This AI sentiment is combined with our quantitative technical and fundamental scores to generate comprehensive investment outlooks.',
+            'details': {
+                'model': 'ProsusAI/finbert - Pre-trained on 1.8M financial news articles, fine-tuned for financial sentiment classification',
+                'implementation': 'Real-time API calls to Hugging Face Inference API (free tier) - OPTIONAL: Requires HF_API_KEY environment variable',
+                'setup': 'See FINBERT_SETUP.md for instructions. Application works perfectly without FinBERT using rule-based analysis.',
+                'sentiment_categories': {
+                    'positive': 'Bullish outlook - favorable market conditions, strong fundamentals, positive momentum',
+                    'neutral': 'Mixed signals - balanced risk-reward, requires further monitoring',
+                    'negative': 'Bearish outlook - weak indicators, concerning patterns, unfavorable conditions'
+                },
+                'score_interpretation': [
+                    'Score 70-100: "Strong Buy" - High confidence positive outlook, strong technical & fundamental alignment',
+                    'Score 60-69: "Buy" - Positive momentum and fundamentals, favorable entry point',
+                    'Score 50-59: "Hold" - Balanced risk-reward profile, monitor for trend development',
+                    'Score 40-49: "Cautious" - Mixed signals requiring careful monitoring before position entry',
+                    'Score 0-39: "Avoid" - Concerning technical patterns, weak fundamentals'
+                ],
+                'output': 'AI-generated natural language summary combining FinBERT sentiment, quantitative score, technical reasons, and sector context',
+                'accuracy': 'FinBERT achieves ~97% accuracy on financial sentiment classification tasks (significantly better than general-purpose sentiment models)',
+                'fallback': 'If FinBERT API is unavailable, system falls back to rule-based analysis using quantitative scores only'
+            }
+        },
+        {
+            'name': 'Large Language Models (LLMs) Used in Analysis',
+            'description': 'Detailed breakdown of the specific Large Language Models integrated into the stock analysis pipeline, including algorithmic steps and processing workflow.',
+            'what': 'Large Language Models (LLMs) are advanced artificial intelligence systems trained on massive amounts of text data to understand and generate human-like text. In financial analysis, specialized financial LLMs can interpret market sentiment, analyze news, and provide natural language insights that complement quantitative metrics.',
+            'how': 'Our system integrates financial-specific LLMs through API calls, processes stock data through multi-step algorithms, and combines AI-generated insights with technical and fundamental analysis to produce comprehensive stock recommendations.',
+            'llms_integrated': [
+                {
+                    'name': 'FinBERT (Financial Bidirectional Encoder Representations from Transformers)',
+                    'provider': 'Hugging Face (ProsusAI/finbert)',
+                    'model_type': 'Transformer-based language model (BERT architecture)',
+                    'specialization': 'Financial sentiment analysis and market text classification',
+                    'training_data': {
+                        'corpus_size': '1.8 million financial documents',
+                        'sources': 'Financial news articles, earnings call transcripts, analyst reports, SEC filings, market commentary',
+                        'training_approach': 'Pre-trained on general text (BERT-base), then fine-tuned on financial domain corpus',
+                        'languages': 'English (financial terminology and jargon)'
+                    },
+                    'capabilities': {
+                        'sentiment_classification': 'Classifies financial text into positive, negative, or neutral sentiment categories',
+                        'confidence_scoring': 'Provides probability scores for each sentiment class (0.0 to 1.0)',
+                        'context_understanding': 'Understands financial context (e.g., "beat earnings" is positive, "missed guidance" is negative)',
+                        'domain_expertise': 'Trained specifically on financial language patterns and market terminology'
+                    },
+                    'technical_specifications': {
+                        'architecture': 'BERT-base (12 transformer layers, 768 hidden units, 12 attention heads)',
+                        'parameters': '110 million trainable parameters',
+                        'input_length': 'Up to 512 tokens (approximately 350-400 words)',
+                        'output': 'Three-class probability distribution: [positive, negative, neutral]',
+                        'accuracy': '97% on financial sentiment classification benchmarks',
+                        'inference_speed': 'Typically 50-200ms per request (after model warm-up)'
+                    },
+                    'algorithm_detailed_steps': {
+                        'step_1_data_preparation': {
+                            'description': 'Construct financial context sentence for the stock being analyzed',
+                            'process': 'Combine ticker symbol, company name, and current analysis metrics into natural language text',
+                            'example': '"Apple Inc (AAPL) stock analysis shows current market performance and technical indicators."',
+                            'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 184'
                         },
-                        'capabilities': {
-                            'sentiment_classification': 'Classifies financial text into positive, negative, or neutral sentiment categories',
-                            'confidence_scoring': 'Provides probability scores for each sentiment class (0.0 to 1.0)',
-                            'context_understanding': 'Understands financial context (e.g., "beat earnings" is positive, "missed guidance" is negative)',
-                            'domain_expertise': 'Trained specifically on financial language patterns and market terminology'
+                        'step_2_api_request': {
+                            'description': 'Send text to Hugging Face FinBERT API endpoint',
+                            'endpoint': 'https://router.huggingface.co/hf-inference/models/ProsusAI/finbert',
+                            'authentication': 'Bearer token (HF_API_KEY environment variable)',
+                            'request_format': 'JSON payload with "inputs" field containing text to analyze',
+                            'timeout': '10 seconds maximum wait time',
+                            'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 192'
                         },
-                        'technical_specifications': {
-                            'architecture': 'BERT-base (12 transformer layers, 768 hidden units, 12 attention heads)',
-                            'parameters': '110 million trainable parameters',
-                            'input_length': 'Up to 512 tokens (approximately 350-400 words)',
-                            'output': 'Three-class probability distribution: [positive, negative, neutral]',
-                            'accuracy': '97% on financial sentiment classification benchmarks',
-                            'inference_speed': 'Typically 50-200ms per request (after model warm-up)'
+                        'step_3_tokenization': {
+                            'description': 'FinBERT tokenizes input text (happens server-side at Hugging Face)',
+                            'process': 'Text is split into subword tokens using WordPiece tokenization',
+                            'special_tokens': '[CLS] added at start, [SEP] at end for BERT input format',
+                            'example': '"Apple" → ["App", "##le"], "stock" → ["stock"]',
+                            'padding': 'Sequences padded/truncated to 512 tokens'
                         },
-                        'algorithm_detailed_steps': {
-                            'step_1_data_preparation': {
-                                'description': 'Construct financial context sentence for the stock being analyzed',
-                                'process': 'Combine ticker symbol, company name, and current analysis metrics into natural language text',
-                                'example': '"Apple Inc (AAPL) stock analysis shows current market performance and technical indicators."',
-                                'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 184'
-                            },
-                            'step_2_api_request': {
-                                'description': 'Send text to Hugging Face FinBERT API endpoint',
-                                'endpoint': 'https://api-inference.huggingface.co/models/ProsusAI/finbert',
-                                'authentication': 'Bearer token (HF_API_KEY environment variable)',
-                                'request_format': 'JSON payload with "inputs" field containing text to analyze',
-                                'timeout': '10 seconds maximum wait time',
-                                'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 192'
-                            },
-                            'step_3_tokenization': {
-                                'description': 'FinBERT tokenizes input text (happens server-side at Hugging Face)',
-                                'process': 'Text is split into subword tokens using WordPiece tokenization',
-                                'special_tokens': '[CLS] added at start, [SEP] at end for BERT input format',
-                                'example': '"Apple" → ["App", "##le"], "stock" → ["stock"]',
-                                'padding': 'Sequences padded/truncated to 512 tokens'
-                            },
-                            'step_4_embedding': {
-                                'description': 'Tokens converted to dense vector representations (happens server-side)',
-                                'embedding_dimension': '768-dimensional vectors for each token',
-                                'embedding_types': 'Token embeddings + Position embeddings + Segment embeddings',
-                                'output': 'Sequence of 768-dimensional vectors representing input text'
-                            },
-                            'step_5_transformer_processing': {
-                                'description': 'FinBERT processes embeddings through 12 transformer layers (happens server-side)',
-                                'attention_mechanism': 'Self-attention allows model to weigh importance of different words in context',
-                                'layer_processing': 'Each layer applies attention, feed-forward networks, and normalization',
-                                'contextual_understanding': 'Model builds rich contextual representations understanding financial terms',
-                                'example': 'Model learns "bullish" has positive sentiment in financial context'
-                            },
-                            'step_6_classification': {
-                                'description': 'Final layer outputs probability distribution over sentiment classes (happens server-side)',
-                                'classification_head': 'Dense layer maps final hidden state to 3 classes',
-                                'softmax_activation': 'Converts logits to probabilities summing to 1.0',
-                                'output_format': '[{"label": "positive", "score": 0.78}, {"label": "negative", "score": 0.15}, {"label": "neutral", "score": 0.07}]'
-                            },
-                            'step_7_response_parsing': {
-                                'description': 'Extract sentiment classification from API response',
-                                'process': 'Parse JSON response, extract highest probability sentiment',
-                                'selection': 'Choose sentiment class with maximum score as primary prediction',
-                                'validation': 'Verify response format and handle errors gracefully',
-                                'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 194-204'
-                            },
-                            'step_8_integration': {
-                                'description': 'Combine FinBERT sentiment with quantitative analysis scores',
-                                'weighting': 'FinBERT sentiment provides qualitative context to quantitative scores',
-                                'synthesis': 'Generate natural language summary incorporating AI sentiment + technical score + fundamental metrics',
-                                'example': '"AAPL shows strong technical indicators. AI Financial Sentiment Analysis indicates a positive outlook (confidence: 78%). Key factors: Price above 50-day MA..."',
-                                'code_location': 'analysis_engine.py → generate_llm_analysis() → Line 217-243'
-                            },
-                            'step_9_fallback_handling': {
-                                'description': 'Handle cases where FinBERT API is unavailable',
-                                'scenarios': 'No API key provided, API timeout, rate limiting, model loading',
-                                'fallback_behavior': 'Switch to rule-based sentiment analysis using quantitative scores',
-                                'user_experience': 'Seamless - users receive analysis regardless of LLM availability',
-                                'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 175-179, 205-215'
-                            }
+                        'step_4_embedding': {
+                            'description': 'Tokens converted to dense vector representations (happens server-side)',
+                            'embedding_dimension': '768-dimensional vectors for each token',
+                            'embedding_types': 'Token embeddings + Position embeddings + Segment embeddings',
+                            'output': 'Sequence of 768-dimensional vectors representing input text'
                         },
-                        'integration_workflow': {
-                            'trigger': 'Stock analysis request via /api/search/<ticker> endpoint',
-                            'pipeline': [
-                                '1. User searches for stock (e.g., AAPL)',
-                                '2. System fetches historical data and calculates technical indicators',
-                                '3. System calculates fundamental metrics (P/E, margins, ROE)',
-                                '4. System generates quantitative prediction score (0-100)',
-                                '5. System calls get_financial_sentiment() with ticker and company name',
-                                '6. FinBERT API analyzes financial context and returns sentiment',
-                                '7. System calls generate_llm_analysis() to create comprehensive summary',
-                                '8. AI sentiment + quantitative score + sector context = final recommendation',
-                                '9. Natural language summary returned to user with outlook (Strong Buy/Buy/Hold/Cautious/Avoid)'
-                            ]
+                        'step_5_transformer_processing': {
+                            'description': 'FinBERT processes embeddings through 12 transformer layers (happens server-side)',
+                            'attention_mechanism': 'Self-attention allows model to weigh importance of different words in context',
+                            'layer_processing': 'Each layer applies attention, feed-forward networks, and normalization',
+                            'contextual_understanding': 'Model builds rich contextual representations understanding financial terms',
+                            'example': 'Model learns "bullish" has positive sentiment in financial context'
                         },
-                        'advantages_over_traditional_methods': {
-                            'contextual_understanding': 'Unlike keyword matching, FinBERT understands context and nuance in financial language',
-                            'domain_specificity': 'Trained on financial text, understands "beat" means exceeding estimates, not physical violence',
-                            'confidence_quantification': 'Provides probability scores, not just binary positive/negative',
-                            'handles_complexity': 'Can process complex sentences with multiple clauses and financial jargon',
-                            'complementary': 'Adds qualitative sentiment layer to quantitative technical/fundamental analysis'
+                        'step_6_classification': {
+                            'description': 'Final layer outputs probability distribution over sentiment classes (happens server-side)',
+                            'classification_head': 'Dense layer maps final hidden state to 3 classes',
+                            'softmax_activation': 'Converts logits to probabilities summing to 1.0',
+                            'output_format': '[{"label": "positive", "score": 0.78}, {"label": "negative", "score": 0.15}, {"label": "neutral", "score": 0.07}]'
                         },
-                        'limitations_and_considerations': {
-                            'requires_authentication': 'Free Hugging Face API key required (optional - system works without it)',
-                            'rate_limits': 'Free tier has usage limits (~30,000 characters/month)',
-                            'cold_start_latency': 'First request may take 20-30 seconds while model loads',
-                            'text_based_only': 'Analyzes text context, not actual news articles or earnings transcripts (future enhancement)',
-                            'not_predictive_alone': 'Sentiment is one factor - combined with technical/fundamental for final recommendation'
+                        'step_7_response_parsing': {
+                            'description': 'Extract sentiment classification from API response',
+                            'process': 'Parse JSON response, extract highest probability sentiment',
+                            'selection': 'Choose sentiment class with maximum score as primary prediction',
+                            'validation': 'Verify response format and handle errors gracefully',
+                            'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 194-204'
                         },
-                        'setup_requirements': {
-                            'api_key': 'HF_API_KEY or HUGGINGFACE_API_KEY environment variable',
-                            'obtaining_key': 'Free account at huggingface.co, generate token at /settings/tokens',
-                            'configuration': 'Set environment variable in deployment platform (Vercel, Heroku, etc.)',
-                            'documentation': 'See FINBERT_SETUP.md for detailed setup instructions'
+                        'step_8_integration': {
+                            'description': 'Combine FinBERT sentiment with quantitative analysis scores',
+                            'weighting': 'FinBERT sentiment provides qualitative context to quantitative scores',
+                            'synthesis': 'Generate natural language summary incorporating AI sentiment + technical score + fundamental metrics',
+                            'example': '"AAPL shows strong technical indicators. AI Financial Sentiment Analysis indicates a positive outlook (confidence: 78%). Key factors: Price above 50-day MA..."',
+                            'code_location': 'analysis_engine.py → generate_llm_analysis() → Line 217-243'
+                        },
+                        'step_9_fallback_handling': {
+                            'description': 'Handle cases where FinBERT API is unavailable',
+                            'scenarios': 'No API key provided, API timeout, rate limiting, model loading',
+                            'fallback_behavior': 'Switch to rule-based sentiment analysis using quantitative scores',
+                            'user_experience': 'Seamless - users receive analysis regardless of LLM availability',
+                            'code_location': 'analysis_engine.py → get_financial_sentiment() → Line 175-179, 205-215'
                         }
-                    }
-                ],
-                'future_llm_enhancements': {
-                    'planned_models': [
-                        'GPT-4 or Claude for deeper financial analysis and reasoning',
-                        'News sentiment analysis using FinBERT on recent articles',
-                        'Earnings transcript analysis for management tone and guidance',
-                        'SEC filing analysis for risk factor identification'
-                    ],
-                    'api_integrations': [
-                        'NewsAPI or Finnhub for real-time news fetching',
-                        'SEC EDGAR API for regulatory filing analysis',
-                        'Twitter/X API for social sentiment (retail investor mood)',
-                        'Reddit API for WallStreetBets sentiment tracking'
-                    ]
-                },
-                'comparison_to_non_llm_methods': {
-                    'traditional_sentiment': 'Keyword counting (count "good" vs "bad" words) - lacks context understanding',
-                    'finbert_advantage': 'Understands "stock dropped on good news" (profit-taking) vs "stock dropped on bad news" (fundamentals)',
-                    'rule_based_fallback': 'Our system uses rule-based analysis (score thresholds) when LLM unavailable',
-                    'hybrid_approach': 'Best results: LLM sentiment + quantitative scores + sector context'
-                }
-            },
-            {
-                'name': 'Sector & Industry Analysis',
-                'description': 'Evaluates performance of stock sectors relative to overall market to identify sector rotation trends and relative strength.',
-                'what': 'Sector analysis examines the performance of industry groups to understand which areas of the economy are in favor. Sector rotation is the movement of investment dollars from one industry sector to another as investors anticipate different phases of the economic cycle.',
-                'how': 'We track 11 major S&P sectors using their corresponding SPDR Select Sector ETFs as proxies. Each sector ETF\'s 3-month performance is calculated and compared to the overall market (SPY). Stocks in outperforming sectors receive positive bias.',
-                'details': {
-                    'sectors_tracked': {
-                        'XLK': 'Technology - Software, hardware, semiconductors, IT services',
-                        'XLV': 'Healthcare - Pharmaceuticals, biotechnology, medical devices, healthcare providers',
-                        'XLF': 'Financials - Banks, insurance, investment firms, real estate finance',
-                        'XLE': 'Energy - Oil & gas exploration, production, refining, equipment',
-                        'XLY': 'Consumer Discretionary - Retail, automotive, hotels, restaurants',
-                        'XLP': 'Consumer Staples - Food, beverages, household products, tobacco',
-                        'XLI': 'Industrials - Aerospace, defense, construction, machinery',
-                        'XLB': 'Materials - Chemicals, metals & mining, packaging, paper',
-                        'XLRE': 'Real Estate - REITs, real estate management, development',
-                        'XLU': 'Utilities - Electric, gas, water utilities, independent power producers',
-                        'XLC': 'Communication Services - Telecom, media, entertainment'
                     },
-                    'calculation': 'Performance = ((Current Price - Price 3 Months Ago) / Price 3 Months Ago) × 100',
-                    'classification': {
-                        'Outperforming': '>+5% relative performance - Strong sector momentum, institutional buying',
-                        'In-line': '-5% to +5% - Neutral sector trend, tracking broader market',
-                        'Underperforming': '<-5% relative performance - Weak sector, potential rotation away'
+                    'integration_workflow': {
+                        'trigger': 'Stock analysis request via /api/search/<ticker> endpoint',
+                        'pipeline': [
+                            '1. User searches for stock (e.g., AAPL)',
+                            '2. System fetches historical data and calculates technical indicators',
+                            '3. System calculates fundamental metrics (P/E, margins, ROE)',
+                            '4. System generates quantitative prediction score (0-100)',
+                            '5. System calls get_financial_sentiment() with ticker and company name',
+                            '6. FinBERT API analyzes financial context and returns sentiment',
+                            '7. System calls generate_llm_analysis() to create comprehensive summary',
+                            '8. AI sentiment + quantitative score + sector context = final recommendation',
+                            '9. Natural language summary returned to user with outlook (Strong Buy/Buy/Hold/Cautious/Avoid)'
+                        ]
                     },
-                    'impact': 'Individual stocks tend to move with their sector. A great company in a weak sector faces headwinds. A mediocre company in a strong sector gets tailwinds.',
-                    'use_case': 'Identify sector rotation opportunities (shift from defensive to cyclical sectors during expansion, etc.) and avoid stocks in systematically weak sectors',
-                    'economic_cycle': 'Early cycle: Financials, Tech. Mid cycle: Industrials, Materials. Late cycle: Energy, Staples. Recession: Utilities, Healthcare'
-                }
-            },
-            {
-                'name': 'Market Sentiment Analysis',
-                'description': 'Assesses overall market conditions and investor psychology using major indices to determine market regime and risk appetite.',
-                'what': 'Market sentiment represents the overall attitude of investors toward a particular security or financial market. It is the "mood" of the market - whether investors are feeling bullish (optimistic) or bearish (pessimistic).',
-                'how': 'We calculate the 1-month performance of SPY (S&P 500 ETF) as our primary market sentiment gauge. The S&P 500 represents ~80% of US market capitalization, making it the best proxy for overall market health. Performance is categorized into three regimes that influence individual stock recommendations.',
-                'details': {
-                    'primary_indicator': 'SPY (S&P 500 ETF) - Tracks 500 largest US companies, market-cap weighted',
-                    'calculation': 'Monthly Change = ((Current SPY Price - Price 1 Month Ago) / Price 1 Month Ago) × 100',
-                    'classification': {
-                        'Bullish Market': '>+3% monthly change - Risk-on environment, investors favoring growth stocks, high-beta names, and speculative plays. Positive momentum broadly across sectors',
-                        'Neutral Market': '-3% to +3% monthly change - Balanced market where stock-specific factors (earnings, guidance, product launches) dominate. Stock picking matters most',
-                        'Bearish Market': '<-3% monthly change - Risk-off environment, flight to safety. Favor defensive stocks (staples, utilities, healthcare), quality over growth, dividend payers'
+                    'advantages_over_traditional_methods': {
+                        'contextual_understanding': 'Unlike keyword matching, FinBERT understands context and nuance in financial language',
+                        'domain_specificity': 'Trained on financial text, understands "beat" means exceeding estimates, not physical violence',
+                        'confidence_quantification': 'Provides probability scores, not just binary positive/negative',
+                        'handles_complexity': 'Can process complex sentences with multiple clauses and financial jargon',
+                        'complementary': 'Adds qualitative sentiment layer to quantitative technical/fundamental analysis'
                     },
-                    'application': 'Market sentiment provides crucial context for individual stock recommendations. In bearish markets, even technically strong stocks face selling pressure. In bullish markets, mediocre stocks can rally on momentum.',
-                    'impact_on_recommendations': {
-                        'Bullish': 'Increases confidence in "Buy" ratings, favorable for momentum and growth stocks',
-                        'Neutral': 'Recommendations based primarily on stock-specific technical and fundamental factors',
-                        'Bearish': 'Increases caution, raises bar for "Buy" ratings, favors defensive positioning'
+                    'limitations_and_considerations': {
+                        'requires_authentication': 'Free Hugging Face API key required (optional - system works without it)',
+                        'rate_limits': 'Free tier has usage limits (~30,000 characters/month)',
+                        'cold_start_latency': 'First request may take 20-30 seconds while model loads',
+                        'text_based_only': 'Analyzes text context, not actual news articles or earnings transcripts (future enhancement)',
+                        'not_predictive_alone': 'Sentiment is one factor - combined with technical/fundamental for final recommendation'
                     },
-                    'additional_context': 'While SPY is primary indicator, we also consider volatility (VIX), market breadth, and sector rotation patterns',
-                    'refresh_rate': 'Recalculated with each analysis request using latest closing prices'
+                    'setup_requirements': {
+                        'api_key': 'HF_API_KEY or HUGGINGFACE_API_KEY environment variable',
+                        'obtaining_key': 'Free account at huggingface.co, generate token at /settings/tokens',
+                        'configuration': 'Set environment variable in deployment platform (Vercel, Heroku, etc.)',
+                        'documentation': 'See FINBERT_SETUP.md for detailed setup instructions'
+                    }
                 }
+            ],
+            'future_llm_enhancements': {
+                'planned_models': [
+                    'GPT-4 or Claude for deeper financial analysis and reasoning',
+                    'News sentiment analysis using FinBERT on recent articles',
+                    'Earnings transcript analysis for management tone and guidance',
+                    'SEC filing analysis for risk factor identification'
+                ],
+                'api_integrations': [
+                    'NewsAPI or Finnhub for real-time news fetching',
+                    'SEC EDGAR API for regulatory filing analysis',
+                    'Twitter/X API for social sentiment (retail investor mood)',
+                    'Reddit API for WallStreetBets sentiment tracking'
+                ]
             },
-            {
-                'name': 'Interest Rate Analysis',
-                'description': 'Monitors interest rate environment and its impact on equity valuations, sector preferences, and overall market dynamics.',
-                'what': 'Interest rates are the cost of borrowing money, set by Federal Reserve policy and reflected in Treasury yields. They are one of the most important drivers of stock valuations because they affect: (1) discount rates for future cash flows, (2) corporate borrowing costs, (3) consumer spending, and (4) alternative investment attractiveness.',
-                'how': 'We track the 10-Year Treasury Yield (^TNX) as our primary interest rate proxy. This is considered the "risk-free rate" used in valuation models. We analyze both the current level and the 3-month trend to determine if rates are rising, falling, or stable, then assess sector-specific impacts.',
-                'details': {
-                    'data_source': '10-Year Treasury Yield (^TNX) - Most widely watched bond yield, benchmark for mortgage rates and corporate bonds',
-                    'calculation': 'Track current yield level and calculate 3-month change to identify trend',
-                    'rate_environments': {
-                        'High Rates (>4.5%)': {
-                            'negative_for': 'Growth stocks (high P/E tech), Real Estate (REITs), Utilities (bond proxies), High-debt companies',
-                            'positive_for': 'Financials (higher net interest margins for banks), Value stocks (lower duration)',
-                            'rationale': 'High rates increase discount rates, making far-future earnings less valuable. Bonds become attractive alternative to stocks'
-                        },
-                        'Low Rates (<3.5%)': {
-                            'negative_for': 'Financials (banks earn less on deposits), Value stocks',
-                            'positive_for': 'Growth stocks (future earnings more valuable), Tech, Real Estate (cheap mortgages), High-growth companies',
-                            'rationale': 'Low rates make bonds unattractive, pushing money into stocks. Future cash flows worth more when discounted at low rates'
-                        },
-                        'Moderate Rates (3.5-4.5%)': {
-                            'impact': 'Neutral environment where stock-specific factors (earnings growth, margins, competitive position) dominate',
-                            'note': 'This is often the "goldilocks" zone - not too hot, not too cold'
-                        }
-                    },
-                    'trend_analysis': {
-                        'Rising Rates': 'Generally negative for stocks short-term (compression of multiples), but may signal strong economy. Sector rotation from growth to value',
-                        'Falling Rates': 'Generally positive for stocks (multiple expansion), but may signal economic weakness. Favor growth over value',
-                        'Stable Rates': 'Allows focus on fundamentals and earnings growth rather than macro factors'
+            'comparison_to_non_llm_methods': {
+                'traditional_sentiment': 'Keyword counting (count "good" vs "bad" words) - lacks context understanding',
+                'finbert_advantage': 'Understands "stock dropped on good news" (profit-taking) vs "stock dropped on bad news" (fundamentals)',
+                'rule_based_fallback': 'Our system uses rule-based analysis (score thresholds) when LLM unavailable',
+                'hybrid_approach': 'Best results: LLM sentiment + quantitative scores + sector context'
+            }
+        },
+        {
+            'name': 'Sector & Industry Analysis',
+            'description': 'Evaluates performance of stock sectors relative to overall market to identify sector rotation trends and relative strength.',
+            'what': 'Sector analysis examines the performance of industry groups to understand which areas of the economy are in favor. Sector rotation is the movement of investment dollars from one industry sector to another as investors anticipate different phases of the economic cycle.',
+            'how': 'We track 11 major S&P sectors using their corresponding SPDR Select Sector ETFs as proxies. Each sector ETF\'s 3-month performance is calculated and compared to the overall market (SPY). Stocks in outperforming sectors receive positive bias.',
+            'details': {
+                'sectors_tracked': {
+                    'XLK': 'Technology - Software, hardware, semiconductors, IT services',
+                    'XLV': 'Healthcare - Pharmaceuticals, biotechnology, medical devices, healthcare providers',
+                    'XLF': 'Financials - Banks, insurance, investment firms, real estate finance',
+                    'XLE': 'Energy - Oil & gas exploration, production, refining, equipment',
+                    'XLY': 'Consumer Discretionary - Retail, automotive, hotels, restaurants',
+                    'XLP': 'Consumer Staples - Food, beverages, household products, tobacco',
+                    'XLI': 'Industrials - Aerospace, defense, construction, machinery',
+                    'XLB': 'Materials - Chemicals, metals & mining, packaging, paper',
+                    'XLRE': 'Real Estate - REITs, real estate management, development',
+                    'XLU': 'Utilities - Electric, gas, water utilities, independent power producers',
+                    'XLC': 'Communication Services - Telecom, media, entertainment'
+                },
+                'calculation': 'Performance = ((Current Price - Price 3 Months Ago) / Price 3 Months Ago) × 100',
+                'classification': {
+                    'Outperforming': '>+5% relative performance - Strong sector momentum, institutional buying',
+                    'In-line': '-5% to +5% - Neutral sector trend, tracking broader market',
+                    'Underperforming': '<-5% relative performance - Weak sector, potential rotation away'
+                },
+                'impact': 'Individual stocks tend to move with their sector. A great company in a weak sector faces headwinds. A mediocre company in a strong sector gets tailwinds.',
+                'use_case': 'Identify sector rotation opportunities (shift from defensive to cyclical sectors during expansion, etc.) and avoid stocks in systematically weak sectors',
+                'economic_cycle': 'Early cycle: Financials, Tech. Mid cycle: Industrials, Materials. Late cycle: Energy, Staples. Recession: Utilities, Healthcare'
+            }
+        },
+        {
+            'name': 'Market Sentiment Analysis',
+            'description': 'Assesses overall market conditions and investor psychology using major indices to determine market regime and risk appetite.',
+            'what': 'Market sentiment represents the overall attitude of investors toward a particular security or financial market. It is the "mood" of the market - whether investors are feeling bullish (optimistic) or bearish (pessimistic).',
+            'how': 'We calculate the 1-month performance of SPY (S&P 500 ETF) as our primary market sentiment gauge. The S&P 500 represents ~80% of US market capitalization, making it the best proxy for overall market health. Performance is categorized into three regimes that influence individual stock recommendations.',
+            'details': {
+                'primary_indicator': 'SPY (S&P 500 ETF) - Tracks 500 largest US companies, market-cap weighted',
+                'calculation': 'Monthly Change = ((Current SPY Price - Price 1 Month Ago) / Price 1 Month Ago) × 100',
+                'classification': {
+                    'Bullish Market': '>+3% monthly change - Risk-on environment, investors favoring growth stocks, high-beta names, and speculative plays. Positive momentum broadly across sectors',
+                    'Neutral Market': '-3% to +3% monthly change - Balanced market where stock-specific factors (earnings, guidance, product launches) dominate. Stock picking matters most',
+                    'Bearish Market': '<-3% monthly change - Risk-off environment, flight to safety. Favor defensive stocks (staples, utilities, healthcare), quality over growth, dividend payers'
+                },
+                'application': 'Market sentiment provides crucial context for individual stock recommendations. In bearish markets, even technically strong stocks face selling pressure. In bullish markets, mediocre stocks can rally on momentum.',
+                'impact_on_recommendations': {
+                    'Bullish': 'Increases confidence in "Buy" ratings, favorable for momentum and growth stocks',
+                    'Neutral': 'Recommendations based primarily on stock-specific technical and fundamental factors',
+                    'Bearish': 'Increases caution, raises bar for "Buy" ratings, favors defensive positioning'
+                },
+                'additional_context': 'While SPY is primary indicator, we also consider volatility (VIX), market breadth, and sector rotation patterns',
+                'refresh_rate': 'Recalculated with each analysis request using latest closing prices'
+            }
+        },
+        {
+            'name': 'Interest Rate Analysis',
+            'description': 'Monitors interest rate environment and its impact on equity valuations, sector preferences, and overall market dynamics.',
+            'what': 'Interest rates are the cost of borrowing money, set by Federal Reserve policy and reflected in Treasury yields. They are one of the most important drivers of stock valuations because they affect: (1) discount rates for future cash flows, (2) corporate borrowing costs, (3) consumer spending, and (4) alternative investment attractiveness.',
+            'how': 'We track the 10-Year Treasury Yield (^TNX) as our primary interest rate proxy. This is considered the "risk-free rate" used in valuation models. We analyze both the current level and the 3-month trend to determine if rates are rising, falling, or stable, then assess sector-specific impacts.',
+            'details': {
+                'data_source': '10-Year Treasury Yield (^TNX) - Most widely watched bond yield, benchmark for mortgage rates and corporate bonds',
+                'calculation': 'Track current yield level and calculate 3-month change to identify trend',
+                'rate_environments': {
+                    'High Rates (>4.5%)': {
+                        'negative_for': 'Growth stocks (high P/E tech), Real Estate (REITs), Utilities (bond proxies), High-debt companies',
+                        'positive_for': 'Financials (higher net interest margins for banks), Value stocks (lower duration)',
+                        'rationale': 'High rates increase discount rates, making far-future earnings less valuable. Bonds become attractive alternative to stocks'
                     },
-                    'valuation_impact': 'Stock Price = Future Cash Flows ÷ (1 + discount rate)^years. Higher rates = higher discount rate = lower present value',
-                    'practical_example': 'A growth stock trading at 40x P/E with earnings 5 years out is hurt much more by rising rates than a value stock at 12x P/E with current earnings'
-                }
-            },
-            {
-                'name': 'Economic Indicators',
-                'description': 'Provides contextual framework for macroeconomic conditions that drive corporate earnings, consumer behavior, and market valuations.',
-                'what': 'Economic indicators are statistics about economic activities that help analysts understand the current state and future direction of the economy. They fall into three categories: leading (predict future), coincident (current state), and lagging (confirm patterns).',
-                'how': 'Currently, we provide qualitative assessment of key economic indicators based on recent trends and Fed commentary. Each indicator\'s status (improving/stable/deteriorating) and impact on equities is evaluated to provide macro context for stock recommendations.',
-                'details': {
-                    'current_implementation': 'Qualitative assessment framework based on recent economic trends, Fed policy statements, and market consensus',
-                    'indicators_analyzed': {
-                        'Inflation (CPI/PPI)': {
-                            'what': 'Consumer Price Index measures price changes in basket of consumer goods. Producer Price Index tracks wholesale prices',
-                            'why_it_matters': 'High inflation erodes corporate profit margins and purchasing power. Moderating inflation allows Fed to ease policy, supporting stock multiples',
-                            'impact_on_stocks': 'Rising inflation → Fed tightening → higher rates → lower P/E multiples. Moderating inflation → potential rate cuts → multiple expansion',
-                            'current_status': 'Moderating from recent highs - Positive for equity valuations'
-                        },
-                        'GDP Growth': {
-                            'what': 'Gross Domestic Product measures total economic output - the broadest measure of economic health',
-                            'why_it_matters': 'GDP growth drives corporate revenue growth. Strong GDP = strong earnings. Negative GDP (recession) = earnings contraction',
-                            'impact_on_stocks': 'Positive GDP growth (2-3% ideal) supports earnings. >4% may cause Fed tightening. Negative GDP triggers defensive positioning',
-                            'current_status': 'Stable positive growth - Supportive for corporate earnings'
-                        },
-                        'Unemployment Rate': {
-                            'what': 'Percentage of labor force actively seeking employment',
-                            'why_it_matters': 'Low unemployment = strong consumer spending (70% of GDP). Also indicates tight labor market which can push wages higher',
-                            'impact_on_stocks': 'Low unemployment (<4%) = strong consumer spending, supports retail/discretionary. Very low (<3.5%) may cause wage inflation concerns',
-                            'current_status': 'Near historic lows - Strong consumer spending support'
-                        }
+                    'Low Rates (<3.5%)': {
+                        'negative_for': 'Financials (banks earn less on deposits), Value stocks',
+                        'positive_for': 'Growth stocks (future earnings more valuable), Tech, Real Estate (cheap mortgages), High-growth companies',
+                        'rationale': 'Low rates make bonds unattractive, pushing money into stocks. Future cash flows worth more when discounted at low rates'
                     },
-                    'future_enhancement': 'Integration with FRED API (Federal Reserve Economic Data) for real-time automated economic data ingestion. Will include ISM PMI, retail sales, housing starts, durable goods orders.',
-                    'usage': 'Economic indicators provide top-down macro context that influences: (1) Sector selection (cyclicals vs defensives), (2) Growth vs value tilt, (3) Risk appetite calibration',
-                    'investment_implications': {
-                        'Strong Economy': 'Favor cyclicals (industrials, materials, discretionary), small-caps, higher-risk growth',
-                        'Weak Economy': 'Favor defensives (staples, utilities, healthcare), large-caps, dividend aristocrats',
-                        'Recovery': 'Favor financials, industrials, materials - early cycle beneficiaries'
+                    'Moderate Rates (3.5-4.5%)': {
+                        'impact': 'Neutral environment where stock-specific factors (earnings growth, margins, competitive position) dominate',
+                        'note': 'This is often the "goldilocks" zone - not too hot, not too cold'
                     }
-                }
-            },
-            {
-                'name': 'Geopolitical Analysis',
-                'description': 'Assesses global risk factors, policy changes, and international events that can create market volatility or sector-specific opportunities/risks.',
-                'what': 'Geopolitical analysis examines how political events, international relations, conflicts, and policy decisions affect financial markets. These "exogenous shocks" can override fundamental analysis temporarily and create sudden market moves.',
-                'how': 'We evaluate current geopolitical landscape across multiple dimensions (trade policy, conflicts, policy divergence, political stability) and assign a qualitative risk level. This risk assessment influences: (1) Overall market risk appetite, (2) Sector preferences (defensive vs cyclical), (3) Geographic/currency exposure considerations.',
-                'details': {
-                    'risk_framework': 'Three-tier assessment (Low/Moderate/High) based on probability and magnitude of market-impacting geopolitical events',
-                    'factors_monitored': {
-                        'Global Trade Relations': {
-                            'what': 'Tariffs, trade agreements, export/import restrictions, trade wars',
-                            'impact': 'Affects multinational companies, supply chains, input costs. Tariffs reduce global trade flows and corporate margins',
-                            'affected_sectors': 'Technology (global supply chains), Industrials (exports), Materials (commodities), Agriculture'
-                        },
-                        'Regional Conflicts': {
-                            'what': 'Military conflicts, territorial disputes, sanctions, embargoes',
-                            'impact': 'Disrupts energy/commodity supplies, creates flight-to-safety flows, increases risk premiums',
-                            'affected_sectors': 'Energy (supply disruptions), Defense (government contracts), Safe havens (gold, Treasuries)'
-                        },
-                        'Central Bank Policy Divergence': {
-                            'what': 'Different central banks pursuing different monetary policies (tightening vs easing)',
-                            'impact': 'Creates currency fluctuations affecting multinationals\' overseas earnings, changes relative attractiveness of markets',
-                            'affected_sectors': 'Exporters (weak home currency helps), Importers (strong home currency helps), Multinationals (translation risk)'
-                        },
-                        'Political Stability & Elections': {
-                            'what': 'Election outcomes, policy shifts, regulatory changes, government stability',
-                            'impact': 'Affects fiscal policy (taxes, spending), regulations, business confidence, policy continuity',
-                            'affected_sectors': 'Sector-specific based on party platform (renewable energy, healthcare, defense, finance)'
-                        }
-                    },
-                    'risk_level_implications': {
-                        'Low Risk': 'Favorable environment for risk assets. Favor growth stocks, emerging markets, cyclicals, higher-beta names. Normal risk-taking appropriate',
-                        'Moderate Risk': 'Current environment (Oct 2025). Selective approach recommended. Balance growth with quality. Maintain diversification across geographies and sectors',
-                        'High Risk': 'Defensive positioning critical. Favor domestic large-caps, utilities, consumer staples, healthcare, dividend aristocrats. Reduce emerging market exposure'
+                },
+                'trend_analysis': {
+                    'Rising Rates': 'Generally negative for stocks short-term (compression of multiples), but may signal strong economy. Sector rotation from growth to value',
+                    'Falling Rates': 'Generally positive for stocks (multiple expansion), but may signal economic weakness. Favor growth over value',
+                    'Stable Rates': 'Allows focus on fundamentals and earnings growth rather than macro factors'
+                },
+                'valuation_impact': 'Stock Price = Future Cash Flows ÷ (1 + discount rate)^years. Higher rates = higher discount rate = lower present value',
+                'practical_example': 'A growth stock trading at 40x P/E with earnings 5 years out is hurt much more by rising rates than a value stock at 12x P/E with current earnings'
+            }
+        },
+        {
+            'name': 'Economic Indicators',
+            'description': 'Provides contextual framework for macroeconomic conditions that drive corporate earnings, consumer behavior, and market valuations.',
+            'what': 'Economic indicators are statistics about economic activities that help analysts understand the current state and future direction of the economy. They fall into three categories: leading (predict future), coincident (current state), and lagging (confirm patterns).',
+            'how': 'Currently, we provide qualitative assessment of key economic indicators based on recent trends and Fed commentary. Each indicator\'s status (improving/stable/deteriorating) and impact on equities is evaluated to provide macro context for stock recommendations.',
+            'details': {
+                'current_implementation': 'Qualitative assessment framework based on recent economic trends, Fed policy statements, and market consensus',
+                'indicators_analyzed': {
+                    'Inflation (CPI/PPI)': {
+                        'what': 'Consumer Price Index measures price changes in basket of consumer goods. Producer Price Index tracks wholesale prices',
+                        'why_it_matters': 'High inflation erodes corporate profit margins and purchasing power. Moderating inflation allows Fed to ease policy, supporting stock multiples',
+                        'impact_on_stocks': 'Rising inflation → Fed tightening → higher rates → lower P/E multiples. Moderating inflation → potential rate cuts → multiple expansion',
+                        'current_status': 'Moderating from recent highs - Positive for equity valuations'
                     },
-                    'current_assessment': {
-                        'risk_level': 'Moderate',
-                        'key_factors': [
-                            'Global trade relations remain complex with ongoing negotiations',
-                            'Regional conflicts affecting energy markets and supply chain reliability',
-                            'Central bank policies diverging globally (Fed vs ECB vs BoJ)',
-                            'Currency fluctuations impacting multinational corporate earnings'
-                        ],
-                        'recommendation': 'Diversification across geographies and sectors recommended. Focus on companies with pricing power and resilient supply chains'
+                    'GDP Growth': {
+                        'what': 'Gross Domestic Product measures total economic output - the broadest measure of economic health',
+                        'why_it_matters': 'GDP growth drives corporate revenue growth. Strong GDP = strong earnings. Negative GDP (recession) = earnings contraction',
+                        'impact_on_stocks': 'Positive GDP growth (2-3% ideal) supports earnings. >4% may cause Fed tightening. Negative GDP triggers defensive positioning',
+                        'current_status': 'Stable positive growth - Supportive for corporate earnings'
                     },
-                    'future_enhancement': 'Integration with news APIs (NewsAPI, Finnhub, Bloomberg) for real-time event detection and sentiment analysis of geopolitical developments',
-                    'historical_examples': 'COVID-19 (2020): Massive flight to safety. Brexit (2016): UK market volatility. US-China Trade War (2018-19): Tech/industrials weakness'
+                    'Unemployment Rate': {
+                        'what': 'Percentage of labor force actively seeking employment',
+                        'why_it_matters': 'Low unemployment = strong consumer spending (70% of GDP). Also indicates tight labor market which can push wages higher',
+                        'impact_on_stocks': 'Low unemployment (<4%) = strong consumer spending, supports retail/discretionary. Very low (<3.5%) may cause wage inflation concerns',
+                        'current_status': 'Near historic lows - Strong consumer spending support'
+                    }
+                },
+                'future_enhancement': 'Integration with FRED API (Federal Reserve Economic Data) for real-time automated economic data ingestion. Will include ISM PMI, retail sales, housing starts, durable goods orders.',
+                'usage': 'Economic indicators provide top-down macro context that influences: (1) Sector selection (cyclicals vs defensives), (2) Growth vs value tilt, (3) Risk appetite calibration',
+                'investment_implications': {
+                    'Strong Economy': 'Favor cyclicals (industrials, materials, discretionary), small-caps, higher-risk growth',
+                    'Weak Economy': 'Favor defensives (staples, utilities, healthcare), large-caps, dividend aristocrats',
+                    'Recovery': 'Favor financials, industrials, materials - early cycle beneficiaries'
                 }
             }
-        ],
-        'prediction_algorithms': {
-            'short_term': {
-                'timeframe': '1-3 months',
-                'primary_factor': 'Momentum and technical indicators',
-                'methodology': 'RSI-based prediction: Oversold stocks (RSI<40) predicted +8%, strong momentum (RSI>60) predicted +5%, neutral RSI uses mean reversion to 20-day SMA',
-                'focus': 'Technical indicators, momentum patterns, and immediate catalysts'
-            },
-            'mid_term': {
-                'timeframe': '3-12 months',
-                'primary_factor': 'Trend continuation',
-                'methodology': 'Extrapolates 60-day price trend forward with 1.5x multiplier, assuming trend continuation with moderation',
-                'focus': 'Balance of technical and fundamental factors, sector trends, earnings growth trajectory'
-            },
-            'long_term': {
-                'timeframe': '1-3 years',
-                'primary_factor': 'Historical returns and fundamentals',
-                'methodology': 'Uses 1-year historical return as baseline, applies 2x multiplier for multi-year projection with mean reversion assumption',
-                'focus': 'Fundamental strength, competitive position, industry growth trends, macroeconomic factors'
-            }
         },
-        'scoring_system': {
-            'total_range': '0-100 points',
-            'baseline': 50,
-            'technical_points': 30,
-            'fundamental_points': 20,
-            'interpretation': {
-                '70-100': 'Strong Buy - High confidence positive outlook',
-                '60-69': 'Buy - Positive momentum and fundamentals',
-                '50-59': 'Hold - Balanced risk-reward',
-                '40-49': 'Cautious - Mixed signals',
-                '0-39': 'Avoid - Concerning patterns'
+        {
+            'name': 'Geopolitical Analysis',
+            'description': 'Assesses global risk factors, policy changes, and international events that can create market volatility or sector-specific opportunities/risks.',
+            'what': 'Geopolitical analysis examines how political events, international relations, conflicts, and policy decisions affect financial markets. These "exogenous shocks" can override fundamental analysis temporarily and create sudden market moves.',
+            'how': 'We evaluate current geopolitical landscape across multiple dimensions (trade policy, conflicts, policy divergence, political stability) and assign a qualitative risk level. This risk assessment influences: (1) Overall market risk appetite, (2) Sector preferences (defensive vs cyclical), (3) Geographic/currency exposure considerations.',
+            'details': {
+                'risk_framework': 'Three-tier assessment (Low/Moderate/High) based on probability and magnitude of market-impacting geopolitical events',
+                'factors_monitored': {
+                    'Global Trade Relations': {
+                        'what': 'Tariffs, trade agreements, export/import restrictions, trade wars',
+                        'impact': 'Affects multinational companies, supply chains, input costs. Tariffs reduce global trade flows and corporate margins',
+                        'affected_sectors': 'Technology (global supply chains), Industrials (exports), Materials (commodities), Agriculture'
+                    },
+                    'Regional Conflicts': {
+                        'what': 'Military conflicts, territorial disputes, sanctions, embargoes',
+                        'impact': 'Disrupts energy/commodity supplies, creates flight-to-safety flows, increases risk premiums',
+                        'affected_sectors': 'Energy (supply disruptions), Defense (government contracts), Safe havens (gold, Treasuries)'
+                    },
+                    'Central Bank Policy Divergence': {
+                        'what': 'Different central banks pursuing different monetary policies (tightening vs easing)',
+                        'impact': 'Creates currency fluctuations affecting multinationals\' overseas earnings, changes relative attractiveness of markets',
+                        'affected_sectors': 'Exporters (weak home currency helps), Importers (strong home currency helps), Multinationals (translation risk)'
+                    },
+                    'Political Stability & Elections': {
+                        'what': 'Election outcomes, policy shifts, regulatory changes, government stability',
+                        'impact': 'Affects fiscal policy (taxes, spending), regulations, business confidence, policy continuity',
+                        'affected_sectors': 'Sector-specific based on party platform (renewable energy, healthcare, defense, finance)'
+                    }
+                },
+                'risk_level_implications': {
+                    'Low Risk': 'Favorable environment for risk assets. Favor growth stocks, emerging markets, cyclicals, higher-beta names. Normal risk-taking appropriate',
+                    'Moderate Risk': 'Current environment (Oct 2025). Selective approach recommended. Balance growth with quality. Maintain diversification across geographies and sectors',
+                    'High Risk': 'Defensive positioning critical. Favor domestic large-caps, utilities, consumer staples, healthcare, dividend aristocrats. Reduce emerging market exposure'
+                },
+                'current_assessment': {
+                    'risk_level': 'Moderate',
+                    'key_factors': [
+                        'Global trade relations remain complex with ongoing negotiations',
+                        'Regional conflicts affecting energy markets and supply chain reliability',
+                        'Central bank policies diverging globally (Fed vs ECB vs BoJ)',
+                        'Currency fluctuations impacting multinational corporate earnings'
+                    ],
+                    'recommendation': 'Diversification across geographies and sectors recommended. Focus on companies with pricing power and resilient supply chains'
+                },
+                'future_enhancement': 'Integration with news APIs (NewsAPI, Finnhub, Bloomberg) for real-time event detection and sentiment analysis of geopolitical developments',
+                'historical_examples': 'COVID-19 (2020): Massive flight to safety. Brexit (2016): UK market volatility. US-China Trade War (2018-19): Tech/industrials weakness'
             }
+        }
+    ],
+    'prediction_algorithms': {
+        'short_term': {
+            'timeframe': '1-3 months',
+            'primary_factor': 'Momentum and technical indicators',
+            'methodology': 'RSI-based prediction: Oversold stocks (RSI<40) predicted +8%, strong momentum (RSI>60) predicted +5%, neutral RSI uses mean reversion to 20-day SMA',
+            'focus': 'Technical indicators, momentum patterns, and immediate catalysts'
         },
-        'data_sources': {
-            'primary': 'Yahoo Finance (yfinance library) - Free, no API key required',
-            'data_types': 'Historical OHLCV data, company fundamentals, sector ETFs, market indices',
-            'limitations': '15-20 minute delay during market hours, free tier rate limiting may apply',
-            'update_frequency': 'Real-time analysis on each request using latest available data'
+        'mid_term': {
+            'timeframe': '3-12 months',
+            'primary_factor': 'Trend continuation',
+            'methodology': 'Extrapolates 60-day price trend forward with 1.5x multiplier, assuming trend continuation with moderation',
+            'focus': 'Balance of technical and fundamental factors, sector trends, earnings growth trajectory'
         },
-        'disclaimer': 'This analysis is for educational and informational purposes only. It does NOT constitute financial advice and should NOT be the sole basis for investment decisions. Past performance does NOT guarantee future results. Users should conduct independent research and consult with licensed financial advisors before making any investment decisions. The system uses historical data and technical indicators which have inherent limitations and may not predict future market movements accurately.'
-    }
-    return jsonify(methodology)
+        'long_term': {
+            'timeframe': '1-3 years',
+            'primary_factor': 'Historical returns and fundamentals',
+            'methodology': 'Uses 1-year historical return as baseline, applies 2x multiplier for multi-year projection with mean reversion assumption',
+            'focus': 'Fundamental strength, competitive position, industry growth trends, macroeconomic factors'
+        }
+    },
+    'scoring_system': {
+        'total_range': '0-100 points',
+        'baseline': 50,
+        'technical_points': 30,
+        'fundamental_points': 20,
+        'interpretation': {
+            '70-100': 'Strong Buy - High confidence positive outlook',
+            '60-69': 'Buy - Positive momentum and fundamentals',
+            '50-59': 'Hold - Balanced risk-reward',
+            '40-49': 'Cautious - Mixed signals',
+            '0-39': 'Avoid - Concerning patterns'
+        }
+    },
+    'data_sources': {
+        'primary': 'Yahoo Finance (yfinance library) - Free, no API key required',
+        'data_types': 'Historical OHLCV data, company fundamentals, sector ETFs, market indices',
+        'limitations': '15-20 minute delay during market hours, free tier rate limiting may apply',
+        'update_frequency': 'Real-time analysis on each request using latest available data'
+    },
+    'disclaimer': 'This analysis is for educational and informational purposes only. It does NOT constitute financial advice and should NOT be the sole basis for investment decisions. Past performance does NOT guarantee future results. Users should conduct independent research and consult with licensed financial advisors before making any investment decisions. The system uses historical data and technical indicators which have inherent limitations and may not predict future market movements accurately.'
+}
+
+# Changes only when the document does, i.e. on deploy
+METHODOLOGY_ETAG = http_cache.content_etag(app.json.dumps_bytes(METHODOLOGY))
+METHODOLOGY_CACHE_SECONDS = int(os.environ.get('METHODOLOGY_CACHE_SECONDS', 3600))
+
+@app.route('/api/methodology')
+def get_methodology():
+    """Get the analysis methodology description"""
+    matched = http_cache.matched_etag(METHODOLOGY_ETAG, request.if_none_match)
+    if matched is not None:
+        return http_cache.not_modified(app.response_class, matched, METHODOLOGY_CACHE_SECONDS)
+    return http_cache.cache_response(jsonify(METHODOLOGY), METHODOLOGY_CACHE_SECONDS, METHODOLOGY_ETAG)
 
 # Helper functions for StockScore LLM integrations
 def call_fingpt_sentiment(ticker, company_name, current_price, news_context=""):
     """Call FinGPT LLM for sentiment analysis and price movement prediction"""
     api_key = os.environ.get('HF_API_KEY') or os.environ.get('HUGGINGFACE_API_KEY')
 
-    if not api_key:
+    if not backend_available(api_key):
         # Fallback to rule-based analysis
         print(f"FinGPT: No API key found for {ticker}")
         return {
@@ -575,13 +789,10 @@ def call_fingpt_sentiment(ticker, company_name, current_price, news_context=""):
             'summary': f'Technical analysis suggests {ticker} is showing mixed signals. Rule-based analysis (no LLM API key) indicates neutral positioning.'
         }
 
-    print(f"FinGPT: API key found (length: {len(api_key)})")
+    if api_key:
+        print(f"FinGPT: API key found (length: {len(api_key)})")
 
     try:
-        # Use new InferenceClient with timeout
-        # 30 seconds for localhost development, reduce to 8 for Vercel deployment
-        client = InferenceClient(token=api_key, timeout=30)
-
         # Create context text for analysis - use provided context or create basic one
         if news_context and len(news_context.strip()) > 50:
             text = f"{news_context} Overall sentiment and price prediction analysis."
@@ -592,10 +803,8 @@ def call_fingpt_sentiment(ticker, company_name, current_price, news_context=""):
 
         try:
             # Use faster sentiment model (cardiffnlp is more responsive than ProsusAI/finbert)
-            result = client.text_classification(
-                text,
-                model="cardiffnlp/twitter-roberta-base-sentiment"
-            )
+            # 30 second timeout for localhost development, reduce to 8 for Vercel deployment
+            result = classify(text, model=SENTIMENT_MODEL, token=api_key, timeout=30)
             print(f"FinGPT: API Success! Result: {result}")
 
         except Exception as api_error:
@@ -668,7 +877,7 @@ def call_finbert_news(ticker, company_name, current_price):
     """Call FinBERT LLM for news classification and impact assessment"""
     api_key = os.environ.get('HF_API_KEY') or os.environ.get('HUGGINGFACE_API_KEY')
 
-    if not api_key:
+    if not backend_available(api_key):
         return {
             'sentiment': 'neutral',
             'score': 0.50,
@@ -677,20 +886,14 @@ def call_finbert_news(ticker, company_name, current_price):
         }
 
     try:
-        # Use new InferenceClient with timeout
-        # 30 seconds for localhost development, reduce to 8 for Vercel deployment
-        client = InferenceClient(token=api_key, timeout=30)
-
         text = f"Latest news and market developments for {company_name} ({ticker}). Stock trading at ${current_price}. Evaluating news impact and market sentiment."
 
         print(f"FinBERT: Calling Hugging Face InferenceClient for {ticker}...")
 
         try:
             # Use faster sentiment model (cardiffnlp is more responsive than ProsusAI/finbert)
-            result = client.text_classification(
-                text,
-                model="cardiffnlp/twitter-roberta-base-sentiment"
-            )
+            # 30 second timeout for localhost development, reduce to 8 for Vercel deployment
+            result = classify(text, model=SENTIMENT_MODEL, token=api_key, timeout=30)
             print(f"FinBERT: API Success! Result: {result}")
 
         except Exception as api_error:
@@ -811,7 +1014,7 @@ def call_finma_prediction(ticker, company_name, current_price):
     """Call Open FinMA LLM for stock movement prediction analysis"""
     api_key = os.environ.get('HF_API_KEY') or os.environ.get('HUGGINGFACE_API_KEY')
 
-    if not api_key:
+    if not backend_available(api_key):
         return {
             'movement_direction': 'Neutral',
             'confidence_score': 0.50,
@@ -823,20 +1026,14 @@ def call_finma_prediction(ticker, company_name, current_price):
         }
 
     try:
-        # Use new InferenceClient with timeout
-        # 30 seconds for localhost development, reduce to 8 for Vercel deployment
-        client = InferenceClient(token=api_key, timeout=30)
-
         text = f"Stock movement prediction for {company_name} ({ticker}) currently trading at ${current_price}. Analyze technical patterns, market momentum, and provide price target range for next 30 days."
 
         print(f"FinMA: Calling Hugging Face InferenceClient for {ticker}...")
 
         try:
             # Use faster sentiment model (cardiffnlp is more responsive than ProsusAI/finbert)
-            result = client.text_classification(
-                text,
-                model="cardiffnlp/twitter-roberta-base-sentiment"
-            )
+            # 30 second timeout for localhost development, reduce to 8 for Vercel deployment
+            result = classify(text, model=SENTIMENT_MODEL, token=api_key, timeout=30)
             print(f"FinMA: API Success! Result: {result}")
 
         except Exception as api_error:
@@ -931,81 +1128,17 @@ def call_finma_prediction(ticker, company_name, current_price):
 
 def analyze_industry_peers(ticker, sector, industry, current_recommendation):
     """Analyze industry peer stocks and find better alternatives"""
-    try:
-        # Define industry peer groups by specific industry (more granular than sector)
-        # First try to match by specific industry keywords, then fall back to sector
-        industry_groups = {
-            # Technology sub-industries
-            'Semiconductors': ['NVDA', 'AMD', 'INTC', 'QCOM', 'AVGO', 'TXN', 'MU', 'AMAT'],
-            'Software': ['MSFT', 'ORCL', 'CRM', 'ADBE', 'INTU', 'NOW', 'WDAY', 'TEAM'],
-            'Consumer Electronics': ['AAPL', 'SONY', 'DELL', 'HPQ'],
-            'Internet': ['GOOGL', 'GOOG', 'META', 'AMZN', 'NFLX', 'SNAP', 'PINS', 'UBER'],
-
-            # Automotive
-            'Auto Manufacturers': ['TSLA', 'F', 'GM', 'TM', 'HMC', 'RIVN', 'LCID'],
-
-            # Healthcare sub-industries
-            'Drug Manufacturers': ['PFE', 'JNJ', 'ABBV', 'MRK', 'LLY', 'BMY', 'GILD', 'AMGN'],
-            'Health Insurance': ['UNH', 'CVS', 'CI', 'HUM', 'ANTM', 'CNC'],
-            'Medical Devices': ['TMO', 'ABT', 'DHR', 'MDT', 'SYK', 'BSX', 'EW'],
-
-            # Retail
-            'E-commerce': ['AMZN', 'SHOP', 'EBAY', 'ETSY', 'W'],
-            'Home Improvement': ['HD', 'LOW'],
-            'Restaurants': ['MCD', 'SBUX', 'YUM', 'QSR', 'CMG', 'DPZ'],
-            'Apparel': ['NKE', 'LULU', 'UAA', 'VFC'],
-            'Discount Stores': ['WMT', 'TGT', 'COST', 'DG', 'DLTR'],
-
-            # Financial Services
-            'Banks': ['JPM', 'BAC', 'WFC', 'C', 'USB', 'PNC', 'TFC'],
-            'Investment Banks': ['GS', 'MS', 'SCHW', 'BLK', 'BX', 'KKR'],
-
-            # Communication Services
-            'Telecom': ['T', 'VZ', 'TMUS', 'CHTR'],
-            'Media': ['DIS', 'NFLX', 'CMCSA', 'PARA', 'WBD'],
-
-            # Energy
-            'Oil & Gas': ['XOM', 'CVX', 'COP', 'SLB', 'EOG', 'MPC', 'PSX', 'OXY'],
-
-            # Industrials
-            'Aerospace': ['BA', 'LMT', 'RTX', 'GD', 'NOC'],
-            'Industrial Conglomerates': ['HON', 'GE', 'MMM', 'CAT', 'DE'],
-            'Logistics': ['UPS', 'FDX', 'XPO'],
-
-            # Consumer Defensive
-            'Beverages': ['KO', 'PEP', 'MNST', 'STZ'],
-            'Household Products': ['PG', 'CL', 'KMB', 'CLX'],
-            'Tobacco': ['PM', 'MO', 'BTI'],
-
-            # Broad sector fallbacks (if specific industry not found)
-            'Technology': ['AAPL', 'MSFT', 'GOOGL', 'META', 'NVDA', 'AMD', 'INTC', 'ORCL', 'CRM', 'ADBE'],
-            'Healthcare': ['UNH', 'JNJ', 'PFE', 'ABBV', 'MRK', 'TMO', 'LLY', 'ABT', 'DHR', 'CVS'],
-            'Financial Services': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'BLK', 'SCHW'],
-            'Consumer Cyclical': ['AMZN', 'HD', 'MCD', 'NKE', 'SBUX', 'TGT', 'LOW'],
-            'Consumer Defensive': ['WMT', 'PG', 'KO', 'PEP', 'COST'],
-            'Communication Services': ['GOOGL', 'META', 'DIS', 'NFLX', 'T', 'VZ'],
-            'Energy': ['XOM', 'CVX', 'COP', 'SLB', 'EOG'],
-            'Industrials': ['UPS', 'HON', 'BA', 'CAT', 'GE'],
-            'Basic Materials': ['LIN', 'APD', 'ECL', 'DD', 'NEM'],
-            'Real Estate': ['AMT', 'PLD', 'CCI', 'EQIX', 'PSA'],
-            'Utilities': ['NEE', 'DUK', 'SO', 'D', 'AEP']
-        }
+    return select_peer_alternatives(collect_peer_analyses(ticker, sector, industry), current_recommendation)
 
-        # Try to find peers by specific industry first, then fall back to sector
-        peers = []
+def collect_peer_analyses(ticker, sector, industry):
+    """Find a stock's industry peers with their price changes and sentiment.
 
-        # Check if industry contains key terms that match our groups
-        for group_name, group_stocks in industry_groups.items():
-            if group_name.lower() in industry.lower() or industry.lower() in group_name.lower():
-                peers = group_stocks.copy()
-                break
-
-        # If no specific industry match, try sector
-        if not peers:
-            peers = industry_groups.get(sector, []).copy()
-
-        # Remove the current stock from peers (important: work on a copy!)
-        peers = [p for p in peers if p != ticker and p != ticker.replace('GOOGL', 'GOOG') and p != ticker.replace('GOOG', 'GOOGL')]
+    This part does not depend on the stock's own recommendation, so it can
+    run alongside the other StockScore sections.
+    """
+    try:
+        # Peers by specific industry first, then sector (memoized index lookup)
+        peers = peer_index.peers_for(ticker, industry, sector)
 
         if not peers or len(peers) < 3:
             return {
@@ -1013,97 +1146,15 @@ def analyze_industry_peers(ticker, sector, industry, current_recommendation):
                 'message': f'Insufficient peer data available for {industry} sector analysis.'
             }
 
-        # Analyze up to 3 peer stocks (quick analysis)
-        peer_analyses = []
-        for peer_ticker in peers[:3]:
-            try:
-                peer_stock = yf.Ticker(peer_ticker)
-                peer_info = peer_stock.info
-                peer_price = peer_info.get('currentPrice') or peer_info.get('regularMarketPrice', 0)
-                peer_name = peer_info.get('shortName', peer_ticker)
-
-                if not peer_price or peer_price == 0:
-                    continue
-
-                # Get price history for narrative context
-                peer_hist = peer_stock.history(period='1mo')
-
-                # Calculate price changes
-                price_change_1d = ((peer_price - peer_hist['Close'].iloc[-2]) / peer_hist['Close'].iloc[-2] * 100) if len(peer_hist) > 1 else 0
-                price_change_1w = ((peer_price - peer_hist['Close'].iloc[-5]) / peer_hist['Close'].iloc[-5] * 100) if len(peer_hist) > 5 else 0
-                price_change_1m = ((peer_price - peer_hist['Close'].iloc[0]) / peer_hist['Close'].iloc[0] * 100) if len(peer_hist) > 0 else 0
-
-                # Get analyst recommendation
-                peer_recommendation = peer_info.get('recommendationKey', 'none')
-                peer_target_price = peer_info.get('targetMeanPrice', 0)
-
-                # Create rich narrative for peer (simplified version)
-                narrative_parts = []
-
-                # Price movement
-                if price_change_1d > 3:
-                    narrative_parts.append(f"{peer_ticker} surged {price_change_1d:.1f}% with strong momentum")
-                elif price_change_1d > 1:
-                    narrative_parts.append(f"{peer_ticker} gained {price_change_1d:.1f}% showing strength")
-                elif price_change_1d < -3:
-                    narrative_parts.append(f"{peer_ticker} dropped {abs(price_change_1d):.1f}% facing pressure")
-                elif price_change_1d < -1:
-                    narrative_parts.append(f"{peer_ticker} declined {abs(price_change_1d):.1f}%")
-                else:
-                    narrative_parts.append(f"{peer_ticker} trading steady")
-
-                # Weekly trend
-                if price_change_1w > 5:
-                    narrative_parts.append(f"rallied {price_change_1w:.1f}% this week")
-                elif price_change_1w < -5:
-                    narrative_parts.append(f"fell {abs(price_change_1w):.1f}% this week")
-
-                # Monthly performance
-                if price_change_1m > 10:
-                    narrative_parts.append(f"up {price_change_1m:.1f}% this month, outperforming")
-                elif price_change_1m < -10:
-                    narrative_parts.append(f"down {abs(price_change_1m):.1f}% this month, underperforming")
-
-                # Analyst view
-                if peer_recommendation in ['strong_buy', 'buy']:
-                    narrative_parts.append(f"Analysts recommend buying {peer_ticker}")
-                elif peer_recommendation in ['sell', 'strong_sell']:
-                    narrative_parts.append(f"Analysts recommend selling {peer_ticker}")
-
-                # Target price upside
-                if peer_target_price > 0:
-                    upside = ((peer_target_price - peer_price) / peer_price) * 100
-                    if upside > 15:
-                        narrative_parts.append(f"with {upside:.1f}% upside potential")
-                    elif upside < -10:
-                        narrative_parts.append(f"with {abs(upside):.1f}% downside risk")
-
-                peer_text = ". ".join(narrative_parts) if narrative_parts else f"{peer_name} trading at ${peer_price}"
-
-                # Get quick sentiment (reuse existing HF client)
-                api_key = os.environ.get('HF_API_KEY') or os.environ.get('HUGGINGFACE_API_KEY')
-                if api_key:
-                    client = InferenceClient(token=api_key, timeout=10)
-                    result = client.text_classification(peer_text, model="cardiffnlp/twitter-roberta-base-sentiment")
-
-                    if result and len(result) > 0:
-                        top_sentiment = max(result, key=lambda x: x['score'])
-                        label = top_sentiment['label']
-
-                        sentiment = 'positive' if label == 'LABEL_2' else 'negative' if label == 'LABEL_0' else 'neutral'
-                        score = top_sentiment['score']
-
-                        peer_analyses.append({
-                            'ticker': peer_ticker,
-                            'name': peer_name,
-                            'price': round(peer_price, 2),
-                            'sentiment': sentiment,
-                            'score': score
-                        })
-
-            except Exception as e:
-                print(f"Error analyzing peer {peer_ticker}: {e}")
-                continue
+        # Analyze up to 3 peer stocks: read them from the scoreboard when one has
+        # been published, and analyze any it lacks live, all at once
+        if background_refresh_enabled():
+            peer_scoreboard_scheduler.start()
+        board = peer_scoreboard_scheduler.current()
+        on_board = board.data if board is not None else {}
+        missing = PeerScoreboard.missing(on_board, peers[:3])
+        live = dict(zip(missing, peer_executor.map(analyze_peer, missing)))
+        peer_analyses = [peer for peer in (on_board.get(p) or live.get(p) for p in peers[:3]) if peer]
 
         if not peer_analyses:
             return {
@@ -1111,24 +1162,7 @@ def analyze_industry_peers(ticker, sector, industry, current_recommendation):
                 'message': 'Unable to analyze industry peers at this time.'
             }
 
-        # Find better alternatives (higher scores, positive sentiment)
-        better_alternatives = []
-        for peer in peer_analyses:
-            if current_recommendation == 'SELL' or current_recommendation == 'HOLD':
-                # If current stock is SELL/HOLD, recommend peers with positive sentiment
-                if peer['sentiment'] == 'positive' and peer['score'] > 0.6:
-                    better_alternatives.append(peer)
-            elif current_recommendation == 'BUY':
-                # If current stock is BUY, show peers with strong positive signals (relaxed from 0.75 to 0.65)
-                if peer['sentiment'] == 'positive' and peer['score'] > 0.65:
-                    better_alternatives.append(peer)
-
-        # Sort by sentiment score
-        better_alternatives.sort(key=lambda x: x['score'], reverse=True)
-
         return {
-            'has_alternatives': len(better_alternatives) > 0,
-            'alternatives': better_alternatives[:2],  # Top 2 alternatives
             'all_peers': peer_analyses,
             'sector': sector,
             'industry': industry
@@ -1141,6 +1175,134 @@ def analyze_industry_peers(ticker, sector, industry, current_recommendation):
             'message': f'Error analyzing industry peers: {str(e)}'
         }
 
+def analyze_peer(peer_ticker):
+    """Quick narrative and sentiment read on one peer stock; None if unavailable"""
+    try:
+        import pandas as pd
+        prediction_engine = get_prediction_engine()
+
+        # Get price history for narrative context; the price is the latest stored bar
+        peer_hist = prediction_engine.store.get_history(peer_ticker, period='1mo')
+        quote = prediction_engine.store.latest_quote(peer_ticker)
+        peer_price = round(quote['price'], 2) if quote else 0
+        if not peer_price or peer_price == 0:
+            return None
+        if peer_hist is None:
+            peer_hist = pd.DataFrame(columns=['Close'])
+
+        # Slow-moving fields come from the fundamentals TTL cache
+        peer_info = prediction_engine.fundamentals.get(peer_ticker)
+        peer_name = peer_info.get('shortName', peer_ticker)
+
+        # Calculate price changes
+        price_change_1d = ((peer_price - peer_hist['Close'].iloc[-2]) / peer_hist['Close'].iloc[-2] * 100) if len(peer_hist) > 1 else 0
+        price_change_1w = ((peer_price - peer_hist['Close'].iloc[-5]) / peer_hist['Close'].iloc[-5] * 100) if len(peer_hist) > 5 else 0
+        price_change_1m = ((peer_price - peer_hist['Close'].iloc[0]) / peer_hist['Close'].iloc[0] * 100) if len(peer_hist) > 0 else 0
+
+        # Get analyst recommendation
+        peer_recommendation = peer_info.get('recommendationKey', 'none')
+        peer_target_price = peer_info.get('targetMeanPrice', 0)
+
+        # Create rich narrative for peer (simplified version)
+        narrative_parts = []
+
+        # Price movement
+        if price_change_1d > 3:
+            narrative_parts.append(f"{peer_ticker} surged {price_change_1d:.1f}% with strong momentum")
+        elif price_change_1d > 1:
+            narrative_parts.append(f"{peer_ticker} gained {price_change_1d:.1f}% showing strength")
+        elif price_change_1d < -3:
+            narrative_parts.append(f"{peer_ticker} dropped {abs(price_change_1d):.1f}% facing pressure")
+        elif price_change_1d < -1:
+            narrative_parts.append(f"{peer_ticker} declined {abs(price_change_1d):.1f}%")
+        else:
+            narrative_parts.append(f"{peer_ticker} trading steady")
+
+        # Weekly trend
+        if price_change_1w > 5:
+            narrative_parts.append(f"rallied {price_change_1w:.1f}% this week")
+        elif price_change_1w < -5:
+            narrative_parts.append(f"fell {abs(price_change_1w):.1f}% this week")
+
+        # Monthly performance
+        if price_change_1m > 10:
+            narrative_parts.append(f"up {price_change_1m:.1f}% this month, outperforming")
+        elif price_change_1m < -10:
+            narrative_parts.append(f"down {abs(price_change_1m):.1f}% this month, underperforming")
+
+        # Analyst view
+        if peer_recommendation in ['strong_buy', 'buy']:
+            narrative_parts.append(f"Analysts recommend buying {peer_ticker}")
+        elif peer_recommendation in ['sell', 'strong_sell']:
+            narrative_parts.append(f"Analysts recommend selling {peer_ticker}")
+
+        # Target price upside
+        if peer_target_price > 0:
+            upside = ((peer_target_price - peer_price) / peer_price) * 100
+            if upside > 15:
+                narrative_parts.append(f"with {upside:.1f}% upside potential")
+            elif upside < -10:
+                narrative_parts.append(f"with {abs(upside):.1f}% downside risk")
+
+        peer_text = ". ".join(narrative_parts) if narrative_parts else f"{peer_name} trading at ${peer_price}"
+
+        # Get quick sentiment (reuse existing HF client)
+        api_key = os.environ.get('HF_API_KEY') or os.environ.get('HUGGINGFACE_API_KEY')
+        if backend_available(api_key):
+            result = classify(peer_text, model=SENTIMENT_MODEL, token=api_key, timeout=10)
+
+            if result and len(result) > 0:
+                top_sentiment = max(result, key=lambda x: x['score'])
+                label = top_sentiment['label']
+
+                sentiment = 'positive' if label == 'LABEL_2' else 'negative' if label == 'LABEL_0' else 'neutral'
+                score = top_sentiment['score']
+
+                return {
+                    'ticker': peer_ticker,
+                    'name': peer_name,
+                    'price': round(peer_price, 2),
+                    'price_change_1d': round(float(price_change_1d), 2),
+                    'price_change_1w': round(float(price_change_1w), 2),
+                    'price_change_1m': round(float(price_change_1m), 2),
+                    'sentiment': sentiment,
+                    'score': score
+                }
+
+    except Exception as e:
+        print(f"Error analyzing peer {peer_ticker}: {e}")
+    return None
+
+def select_peer_alternatives(peer_result, current_recommendation):
+    """Pick better alternatives from collected peer analyses given the stock's recommendation"""
+    if 'all_peers' not in peer_result:
+        return peer_result
+
+    peer_analyses = peer_result['all_peers']
+
+    # Find better alternatives (higher scores, positive sentiment)
+    better_alternatives = []
+    for peer in peer_analyses:
+        if current_recommendation == 'SELL' or current_recommendation == 'HOLD':
+            # If current stock is SELL/HOLD, recommend peers with positive sentiment
+            if peer['sentiment'] == 'positive' and peer['score'] > 0.6:
+                better_alternatives.append(peer)
+        elif current_recommendation == 'BUY':
+            # If current stock is BUY, show peers with strong positive signals (relaxed from 0.75 to 0.65)
+            if peer['sentiment'] == 'positive' and peer['score'] > 0.65:
+                better_alternatives.append(peer)
+
+    # Sort by sentiment score
+    better_alternatives.sort(key=lambda x: x['score'], reverse=True)
+
+    return {
+        'has_alternatives': len(better_alternatives) > 0,
+        'alternatives': better_alternatives[:2],  # Top 2 alternatives
+        'all_peers': peer_analyses,
+        'sector': peer_result['sector'],
+        'industry': peer_result['industry']
+    }
+
 def generate_consolidated_summary(ticker, company_name, current_price, fingpt_analysis, finbert_analysis, finllm_decision, finma_prediction, industry_alternatives=None):
     """Generate comprehensive consolidated summary based on all LLM analyses"""
 
@@ -1262,167 +1424,226 @@ def generate_consolidated_summary(ticker, company_name, current_price, fingpt_an
         'industry_alternatives': industry_alternatives
     }
 
+def stockscore_graph(ticker, company_name, current_price, stock_context, sector, industry):
+    """Task graph of the StockScore sections, wired by their data dependencies"""
+    graph = TaskGraph(stockscore_executor)
+    graph.add('fingpt_analysis',
+              lambda: call_fingpt_sentiment(ticker, company_name, current_price, stock_context))
+    graph.add('finbert_analysis',
+              lambda: call_finbert_news(ticker, company_name, current_price))
+    graph.add('finma_prediction',
+              lambda: call_finma_prediction(ticker, company_name, current_price))
+    graph.add('peer_analyses',
+              lambda: collect_peer_analyses(ticker, sector, industry))
+    graph.add('finllm_decision',
+              lambda fingpt, finbert: call_finllm_decision(ticker, company_name, current_price, fingpt, finbert),
+              deps=('fingpt_analysis', 'finbert_analysis'))
+    graph.add('industry_alternatives',
+              lambda peers, decision: select_peer_alternatives(peers, decision.get('recommendation', 'HOLD')),
+              deps=('peer_analyses', 'finllm_decision'))
+    graph.add('consolidated_summary',
+              lambda fingpt, finbert, decision, finma, alternatives: generate_consolidated_summary(
+                  ticker, company_name, current_price, fingpt, finbert, decision, finma, alternatives),
+              deps=('fingpt_analysis', 'finbert_analysis', 'finllm_decision', 'finma_prediction',
+                    'industry_alternatives'))
+    return graph
+
+# Sections sent to streaming clients, in the order the full response lists them
+STOCKSCORE_SECTIONS = ('fingpt_analysis', 'finbert_analysis', 'finma_prediction', 'finllm_decision',
+                       'industry_alternatives', 'consolidated_summary')
+
+def prepare_stockscore(ticker):
+    """Gather the inputs of the StockScore graph; returns None if the ticker has no price"""
+    import pandas as pd
+    print(f"StockScore analysis for: {ticker}")
+    prediction_engine = get_prediction_engine()
+
+    # Gather comprehensive stock data for analysis (served from the local bar store)
+    hist = prediction_engine.store.get_history(ticker, period='1mo')
+
+    # Price and volume come from the latest stored bar, which refreshes intraday
+    quote = prediction_engine.store.latest_quote(ticker)
+    current_price = round(quote['price'], 2) if quote else 0
+    if not current_price or current_price == 0:
+        return None
+    if hist is None:
+        hist = pd.DataFrame(columns=['Close'])
+
+    # Slow-moving fields come from the compact fundamentals, cached with a TTL
+    info = prediction_engine.fundamentals.get(ticker)
+    company_name = info.get('longName') or info.get('shortName', ticker)
+
+    # Calculate key metrics
+    price_change_1d = ((current_price - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100) if len(hist) > 1 else 0
+    price_change_1w = ((current_price - hist['Close'].iloc[-5]) / hist['Close'].iloc[-5] * 100) if len(hist) > 5 else 0
+    price_change_1m = ((current_price - hist['Close'].iloc[0]) / hist['Close'].iloc[0] * 100) if len(hist) > 0 else 0
+
+    # Get additional metrics
+    pe_ratio = info.get('trailingPE', 'N/A')
+    market_cap = info.get('marketCap', 0)
+    volume = quote['volume']
+    avg_volume = quote['average_volume']
+    volume_ratio = volume / avg_volume if avg_volume > 0 else 1
+
+    recommendation = info.get('recommendationKey', 'none')
+    target_price = info.get('targetMeanPrice', 0)
+
+    # Create rich narrative context for sentiment analysis
+    market_cap_str = f"${market_cap:,}" if market_cap > 0 else 'N/A'
+
+    # Generate sentiment-rich narrative based on actual metrics
+    narrative_parts = []
+
+    # Price movement narrative
+    if price_change_1d > 3:
+        narrative_parts.append(f"{ticker} surged {price_change_1d:.1f}% today, showing strong bullish momentum and investor confidence")
+    elif price_change_1d > 1:
+        narrative_parts.append(f"{ticker} gained {price_change_1d:.1f}% today with positive buying pressure")
+    elif price_change_1d < -3:
+        narrative_parts.append(f"{ticker} plummeted {abs(price_change_1d):.1f}% today amid heavy selling and bearish sentiment")
+    elif price_change_1d < -1:
+        narrative_parts.append(f"{ticker} declined {abs(price_change_1d):.1f}% today facing selling pressure")
+    else:
+        narrative_parts.append(f"{ticker} traded relatively flat with minimal price action")
+
+    # Weekly trend narrative
+    if price_change_1w > 5:
+        narrative_parts.append(f"The stock rallied {price_change_1w:.1f}% over the past week showing exceptional strength")
+    elif price_change_1w > 2:
+        narrative_parts.append(f"gaining {price_change_1w:.1f}% this week with improving technicals")
+    elif price_change_1w < -5:
+        narrative_parts.append(f"The stock crashed {abs(price_change_1w):.1f}% this week with deteriorating sentiment")
+    elif price_change_1w < -2:
+        narrative_parts.append(f"dropping {abs(price_change_1w):.1f}% this week amid weakness")
+
+    # Monthly performance narrative
+    if price_change_1m > 10:
+        narrative_parts.append(f"Over the past month, {company_name} skyrocketed {price_change_1m:.1f}%, greatly outperforming the market")
+    elif price_change_1m > 5:
+        narrative_parts.append(f"The stock rose {price_change_1m:.1f}% over the past month, beating market expectations")
+    elif price_change_1m < -10:
+        narrative_parts.append(f"Over the past month, {ticker} collapsed {abs(price_change_1m):.1f}%, severely underperforming")
+    elif price_change_1m < -5:
+        narrative_parts.append(f"declining {abs(price_change_1m):.1f}% over the month with bearish trends")
+
+    # Volume narrative
+    if volume_ratio > 2:
+        narrative_parts.append(f"Trading volume exploded to {volume_ratio:.1f}x normal levels, indicating intense interest")
+    elif volume_ratio > 1.5:
+        narrative_parts.append(f"with elevated volume at {volume_ratio:.1f}x average showing increased activity")
+    elif volume_ratio < 0.5:
+        narrative_parts.append(f"but volume dried up to just {volume_ratio:.1f}x average suggesting low conviction")
+
+    # Analyst recommendation narrative
+    if recommendation == 'strong_buy':
+        narrative_parts.append(f"Analysts strongly recommend buying {ticker} with high conviction")
+    elif recommendation == 'buy':
+        narrative_parts.append(f"Wall Street analysts recommend buying {ticker}")
+    elif recommendation == 'hold':
+        narrative_parts.append(f"Analysts maintain neutral stance advising hold")
+    elif recommendation == 'sell':
+        narrative_parts.append(f"Analysts recommend selling {ticker} citing concerns")
+    elif recommendation == 'strong_sell':
+        narrative_parts.append(f"Analysts issue strong sell rating with major red flags")
+
+    # Target price narrative
+    if target_price > 0:
+        upside = ((target_price - current_price) / current_price) * 100
+        if upside > 20:
+            narrative_parts.append(f"Analyst price targets suggest massive {upside:.1f}% upside potential to ${target_price:.2f}")
+        elif upside > 10:
+            narrative_parts.append(f"with significant {upside:.1f}% upside to analyst target of ${target_price:.2f}")
+        elif upside > 0:
+            narrative_parts.append(f"with moderate {upside:.1f}% upside to ${target_price:.2f} target")
+        elif upside < -10:
+            narrative_parts.append(f"but analyst targets imply {abs(upside):.1f}% downside to ${target_price:.2f}")
+
+    stock_context = ". ".join(narrative_parts) + f". {company_name} trades at ${current_price}."
+
+    print(f"DEBUG: Stock context for {ticker}:")
+    print(stock_context)
+
+    return {
+        'ticker': ticker,
+        'company_name': company_name,
+        'current_price': current_price,
+        'stock_context': stock_context,
+        'sector': info.get('sector', 'Technology'),
+        'industry': info.get('industry', 'Technology')
+    }
+
+def stockscore_header(context):
+    return {
+        'ticker': context['ticker'],
+        'company_name': context['company_name'],
+        'current_price': round(context['current_price'], 2),
+        'last_updated': datetime.now().isoformat()
+    }
+
+def stockscore_response(header, results):
+    return {
+        **header,
+        'consolidated_summary': results['consolidated_summary'],
+        'fingpt_analysis': results['fingpt_analysis'],
+        'finbert_analysis': results['finbert_analysis'],
+        'finllm_decision': results['finllm_decision'],
+        'finma_prediction': results['finma_prediction']
+    }
+
+def build_stockscore(ticker, progress=None):
+    """Run the full StockScore analysis; returns None if the ticker has no price.
+
+    With a Broadcast, ('meta', header) and then ('section', name, data) for
+    each streamed section are pushed as soon as they are ready.
+    """
+    context = prepare_stockscore(ticker)
+    if context is None:
+        return None
+
+    header = stockscore_header(context)
+    if progress is not None:
+        progress.push(('meta', header))
+
+    # FinGPT, FinBERT, FinMA and the peer fan-out are independent and run at
+    # once; FinLLM waits only for its two inputs, so latency tracks the slowest call
+    print(f"Running StockScore analyses for {ticker} concurrently...")
+    results = {}
+    for name, result in stockscore_graph(**context).run():
+        results[name] = result
+        if progress is not None and name in STOCKSCORE_SECTIONS:
+            progress.push(('section', name, result))
+    response_data = stockscore_response(header, results)
+
+    print(f"StockScore analysis complete for {ticker}")
+    return response_data
+
+def stockscore_analysis(ticker, progress=None):
+    """The ticker's StockScore result, shared with concurrent requests and cached briefly"""
+    return analysis_cache.get_or_compute(
+        ('stockscore', ticker),
+        lambda: build_stockscore(ticker, progress),
+        should_cache=lambda result: result is not None
+    )
+
 @app.route('/api/stockscore/<ticker>')
 def get_stockscore(ticker):
     """Get real-time AI LLM analysis for a specific stock"""
     try:
         ticker = ticker.upper()
-        print(f"StockScore analysis for: {ticker}")
-
-        # Fetch basic stock data
-        stock = yf.Ticker(ticker)
-        info = stock.info
 
-        # Get current price and company name
-        current_price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
-        company_name = info.get('longName') or info.get('shortName', ticker)
+        # Concurrent requests for the same ticker (streamed or not) share one analysis
+        response_data = stockscore_analysis(ticker)
 
-        if not current_price or current_price == 0:
+        if response_data is None:
             return jsonify({
                 'success': False,
                 'error': f'Could not fetch data for {ticker}. Please check the ticker symbol.'
             }), 404
 
-        # Gather comprehensive stock data for analysis
-        hist = stock.history(period='1mo')
-
-        # Calculate key metrics
-        price_change_1d = ((current_price - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100) if len(hist) > 1 else 0
-        price_change_1w = ((current_price - hist['Close'].iloc[-5]) / hist['Close'].iloc[-5] * 100) if len(hist) > 5 else 0
-        price_change_1m = ((current_price - hist['Close'].iloc[0]) / hist['Close'].iloc[0] * 100) if len(hist) > 0 else 0
-
-        # Get additional metrics
-        pe_ratio = info.get('trailingPE', 'N/A')
-        market_cap = info.get('marketCap', 0)
-        volume = info.get('volume', 0)
-        avg_volume = info.get('averageVolume', 1)
-        volume_ratio = volume / avg_volume if avg_volume > 0 else 1
-
-        recommendation = info.get('recommendationKey', 'none')
-        target_price = info.get('targetMeanPrice', 0)
-
-        # Create rich narrative context for sentiment analysis
-        market_cap_str = f"${market_cap:,}" if market_cap > 0 else 'N/A'
-
-        # Generate sentiment-rich narrative based on actual metrics
-        narrative_parts = []
-
-        # Price movement narrative
-        if price_change_1d > 3:
-            narrative_parts.append(f"{ticker} surged {price_change_1d:.1f}% today, showing strong bullish momentum and investor confidence")
-        elif price_change_1d > 1:
-            narrative_parts.append(f"{ticker} gained {price_change_1d:.1f}% today with positive buying pressure")
-        elif price_change_1d < -3:
-            narrative_parts.append(f"{ticker} plummeted {abs(price_change_1d):.1f}% today amid heavy selling and bearish sentiment")
-        elif price_change_1d < -1:
-            narrative_parts.append(f"{ticker} declined {abs(price_change_1d):.1f}% today facing selling pressure")
-        else:
-            narrative_parts.append(f"{ticker} traded relatively flat with minimal price action")
-
-        # Weekly trend narrative
-        if price_change_1w > 5:
-            narrative_parts.append(f"The stock rallied {price_change_1w:.1f}% over the past week showing exceptional strength")
-        elif price_change_1w > 2:
-            narrative_parts.append(f"gaining {price_change_1w:.1f}% this week with improving technicals")
-        elif price_change_1w < -5:
-            narrative_parts.append(f"The stock crashed {abs(price_change_1w):.1f}% this week with deteriorating sentiment")
-        elif price_change_1w < -2:
-            narrative_parts.append(f"dropping {abs(price_change_1w):.1f}% this week amid weakness")
-
-        # Monthly performance narrative
-        if price_change_1m > 10:
-            narrative_parts.append(f"Over the past month, {company_name} skyrocketed {price_change_1m:.1f}%, greatly outperforming the market")
-        elif price_change_1m > 5:
-            narrative_parts.append(f"The stock rose {price_change_1m:.1f}% over the past month, beating market expectations")
-        elif price_change_1m < -10:
-            narrative_parts.append(f"Over the past month, {ticker} collapsed {abs(price_change_1m):.1f}%, severely underperforming")
-        elif price_change_1m < -5:
-            narrative_parts.append(f"declining {abs(price_change_1m):.1f}% over the month with bearish trends")
-
-        # Volume narrative
-        if volume_ratio > 2:
-            narrative_parts.append(f"Trading volume exploded to {volume_ratio:.1f}x normal levels, indicating intense interest")
-        elif volume_ratio > 1.5:
-            narrative_parts.append(f"with elevated volume at {volume_ratio:.1f}x average showing increased activity")
-        elif volume_ratio < 0.5:
-            narrative_parts.append(f"but volume dried up to just {volume_ratio:.1f}x average suggesting low conviction")
-
-        # Analyst recommendation narrative
-        if recommendation == 'strong_buy':
-            narrative_parts.append(f"Analysts strongly recommend buying {ticker} with high conviction")
-        elif recommendation == 'buy':
-            narrative_parts.append(f"Wall Street analysts recommend buying {ticker}")
-        elif recommendation == 'hold':
-            narrative_parts.append(f"Analysts maintain neutral stance advising hold")
-        elif recommendation == 'sell':
-            narrative_parts.append(f"Analysts recommend selling {ticker} citing concerns")
-        elif recommendation == 'strong_sell':
-            narrative_parts.append(f"Analysts issue strong sell rating with major red flags")
-
-        # Target price narrative
-        if target_price > 0:
-            upside = ((target_price - current_price) / current_price) * 100
-            if upside > 20:
-                narrative_parts.append(f"Analyst price targets suggest massive {upside:.1f}% upside potential to ${target_price:.2f}")
-            elif upside > 10:
-                narrative_parts.append(f"with significant {upside:.1f}% upside to analyst target of ${target_price:.2f}")
-            elif upside > 0:
-                narrative_parts.append(f"with moderate {upside:.1f}% upside to ${target_price:.2f} target")
-            elif upside < -10:
-                narrative_parts.append(f"but analyst targets imply {abs(upside):.1f}% downside to ${target_price:.2f}")
-
-        stock_context = ". ".join(narrative_parts) + f". {company_name} trades at ${current_price}."
-
-        print(f"DEBUG: Stock context for {ticker}:")
-        print(stock_context)
-
-        # Call the four LLMs with rich context
-        print(f"Calling FinGPT for {ticker}...")
-        fingpt_analysis = call_fingpt_sentiment(ticker, company_name, current_price, stock_context)
-
-        print(f"Calling FinBERT for {ticker}...")
-        finbert_analysis = call_finbert_news(ticker, company_name, current_price)
-
-        print(f"Calling FinLLM for {ticker}...")
-        finllm_decision = call_finllm_decision(ticker, company_name, current_price, fingpt_analysis, finbert_analysis)
-
-        print(f"Calling FinMA for {ticker}...")
-        finma_prediction = call_finma_prediction(ticker, company_name, current_price)
-
-        # Analyze industry peers for alternatives
-        print(f"Analyzing industry peers for {ticker}...")
-        sector = info.get('sector', 'Technology')
-        industry = info.get('industry', 'Technology')
-        industry_alternatives = analyze_industry_peers(
-            ticker, sector, industry,
-            finllm_decision.get('recommendation', 'HOLD')
-        )
-
-        # Generate consolidated summary
-        print(f"Generating consolidated summary for {ticker}...")
-        consolidated_summary = generate_consolidated_summary(
-            ticker, company_name, current_price,
-            fingpt_analysis, finbert_analysis, finllm_decision, finma_prediction,
-            industry_alternatives
-        )
-
-        response_data = {
-            'ticker': ticker,
-            'company_name': company_name,
-            'current_price': round(current_price, 2),
-            'last_updated': datetime.now().isoformat(),
-            'consolidated_summary': consolidated_summary,
-            'fingpt_analysis': fingpt_analysis,
-            'finbert_analysis': finbert_analysis,
-            'finllm_decision': finllm_decision,
-            'finma_prediction': finma_prediction
-        }
-
-        print(f"StockScore analysis complete for {ticker}")
-        return jsonify({
+        return http_cache.cache_response(jsonify({
             'success': True,
             'data': response_data
-        })
+        }), API_CACHE_SECONDS)
 
     except Exception as e:
         import traceback
@@ -1434,6 +1655,58 @@ def get_stockscore(ticker):
             'details': traceback.format_exc()
         }), 500
 
+@app.route('/api/stockscore/<ticker>/stream')
+def stream_stockscore(ticker):
+    """Server-sent events for a StockScore analysis.
+
+    Sends `meta` (ticker, name, price) first, then one `section` event per
+    model section as soon as it completes, then `complete` with the same
+    payload /api/stockscore returns. Failures are sent as `failed` (the
+    browser reserves `error` for connection errors). Concurrent requests
+    for a ticker follow one shared analysis.
+    """
+    ticker = ticker.upper()
+
+    def event(name, payload):
+        return f"event: {name}\ndata: {app.json.dumps(payload)}\n\n"
+
+    def replay(result):
+        yield event('meta', {key: result[key] for key in ('ticker', 'company_name', 'current_price', 'last_updated')})
+        for name in STOCKSCORE_SECTIONS:
+            data = result['consolidated_summary'].get(name) if name == 'industry_alternatives' else result[name]
+            yield event('section', {'name': name, 'data': data})
+        yield event('complete', result)
+
+    def generate():
+        cached = analysis_cache.peek(('stockscore', ticker))
+        if cached is not None:
+            yield from replay(cached)
+            return
+
+        try:
+            progress = stockscore_streams.join(ticker, lambda progress: stockscore_analysis(ticker, progress))
+            streamed = False
+            for item in progress.follow():
+                streamed = True
+                if item[0] == 'meta':
+                    yield event('meta', item[1])
+                else:
+                    yield event('section', {'name': item[1], 'data': item[2]})
+
+            if progress.result is None:
+                yield event('failed', {'error': f'Could not fetch data for {ticker}. Please check the ticker symbol.'})
+            elif streamed:
+                yield event('complete', progress.result)
+            else:
+                # Joined an analysis a plain /api/stockscore request was already running
+                yield from replay(progress.result)
+        except Exception as e:
+            print(f"Error in stream_stockscore for {ticker}: {e}")
+            yield event('failed', {'error': str(e)})
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=True)
@@ -0,0 +1,100 @@
+"""
+Benchmark JSON serialization and response compression for the largest API payloads.
+
+Compares Flask's default stdlib encoder with the orjson provider, and bytes on
+the wire uncompressed, gzipped and (if installed) brotli-compressed. Runs
+offline on synthetic price history.
+
+Usage: python benchmarks/bench_json.py [--stocks 60] [--repeat 200]
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask.json.provider import DefaultJSONProvider
+import json_response
+from json_response import OrjsonProvider
+
+
+def synthetic_stocks(engine, count, seed=7):
+    """Per-stock results for random-walk histories (no network access)"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=pd.Timestamp.now().normalize(), periods=260, freq='B')
+    stocks = []
+    for i in range(count):
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, len(index))))
+        hist = pd.DataFrame({
+            'Open': close * (1 + rng.normal(0, 0.005, len(index))),
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': rng.integers(1_000_000, 50_000_000, len(index)).astype(float)
+        }, index=index)
+        info = {
+            'longName': f'Synthetic Company {i}', 'sector': 'Technology', 'industry': 'Software',
+            'forwardPE': float(rng.uniform(8, 40)), 'profitMargins': float(rng.uniform(-0.1, 0.4)),
+            'returnOnEquity': float(rng.uniform(-0.1, 0.5)), 'debtToEquity': float(rng.uniform(0, 200)),
+            'revenueGrowth': float(rng.uniform(-0.2, 0.5)), 'currentPrice': float(close[-1])
+        }
+        result = engine.analyze_single_stock(f'SYN{i}', hist=hist, info=info)
+        if result is not None:
+            stocks.append(result)
+    return stocks
+
+
+def time_per_call(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stocks', type=int, default=60)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    import app as application
+
+    engine = application.get_prediction_engine()
+    top_stocks = engine.rank_top_stocks(synthetic_stocks(engine, args.stocks))
+    with application.app.test_request_context():
+        methodology = application.get_methodology().get_json()
+
+    payloads = {
+        '/api/top-stocks': {'success': True, 'data': top_stocks},
+        '/api/methodology': methodology
+    }
+
+    stdlib = DefaultJSONProvider(application.app)
+    fast = OrjsonProvider(application.app)
+
+    print(f"orjson: {json_response.ORJSON_AVAILABLE}  brotli: {json_response.BROTLI_AVAILABLE}\n")
+    for name, payload in payloads.items():
+        before = stdlib.dumps(payload).encode('utf-8')
+        after = fast.dumps_bytes(payload)
+
+        print(name)
+        print(f"  serialize   stdlib {time_per_call(lambda: stdlib.dumps(payload), args.repeat):8.3f} ms"
+              f"   orjson {time_per_call(lambda: fast.dumps_bytes(payload), args.repeat):8.3f} ms")
+        print(f"  bytes       stdlib {len(before):8d}      orjson {len(after):8d}")
+        print(f"  gzip        {len(gzip.compress(after, json_response.GZIP_LEVEL)):8d} bytes"
+              f"  ({time_per_call(lambda: json_response.compress(after, 'gzip'), args.repeat):.3f} ms)")
+        if json_response.BROTLI_AVAILABLE:
+            print(f"  brotli      {len(json_response.compress(after, 'br')):8d} bytes"
+                  f"  ({time_per_call(lambda: json_response.compress(after, 'br'), args.repeat):.3f} ms)")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
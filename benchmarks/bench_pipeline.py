@@ -0,0 +1,244 @@
+"""
+Benchmark the prediction pipeline offline, against recorded Yahoo fixtures and a local inference stand-in.
+
+Measures throughput and latency percentiles of the engine entry points and
+the StockScore route, and writes them to a JSON results file (by default
+benchmarks/results/pipeline-<commit>.json) so runs can be compared across
+commits. Tickers without a recorded fixture get deterministic synthetic
+bars, so the suite runs with an empty fixture directory too.
+
+Replays run with the Yahoo rate limiter disabled so the timings show the
+pipeline itself; the wait the default limiter adds to a cold start is
+printed and saved with the results (--real-rate-limit keeps the limiter).
+
+Record real Yahoo responses once (needs network access):
+
+    python benchmarks/bench_pipeline.py --record
+
+Then replay:
+
+    python benchmarks/bench_pipeline.py [--iterations 3] [--compare benchmarks/results/pipeline-<old>.json]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+STOCKSCORE_TICKERS = ('AAPL', 'MSFT', 'JPM', 'XOM', 'UNH')
+
+
+def git_commit():
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    try:
+        return git('rev-parse', '--short', 'HEAD') or 'unknown', bool(git('status', '--porcelain', '--untracked-files=no'))
+    except OSError:
+        return 'unknown', False
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * q
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(samples):
+    """Latency percentiles (ms) and throughput (calls/s) for per-call durations in seconds"""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    ms = lambda value: round(value * 1000, 3) if value is not None else None
+    return {
+        'calls': len(ordered),
+        'throughput_per_s': round(len(ordered) / total, 2) if total else None,
+        'mean_ms': ms(total / len(ordered)) if ordered else None,
+        'p50_ms': ms(percentile(ordered, 0.50)),
+        'p90_ms': ms(percentile(ordered, 0.90)),
+        'p99_ms': ms(percentile(ordered, 0.99)),
+        'max_ms': ms(ordered[-1]) if ordered else None
+    }
+
+
+def measure(fn, args_list, iterations, before=None):
+    """Call fn(*args) for every args tuple, `iterations` times; returns per-call seconds"""
+    samples = []
+    for _ in range(iterations):
+        for args in args_list:
+            if before is not None:
+                before(*args)
+            start = time.perf_counter()
+            fn(*args)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(args):
+    """Import the app against the fixtures and time every target; returns ({name: stats}, universe size)"""
+    import inference
+    import app
+    from ohlcv_store import OHLCVStore
+    from indicator_state import IndicatorStateStore
+
+    engine = app.get_prediction_engine()
+    analysis_engine = app.get_analysis_engine()
+    tickers = list(engine.stock_universe)
+    client = app.app.test_client()
+    results = {}
+
+    def report(name, samples):
+        results[name] = summarize(samples)
+        stats = results[name]
+        # stdout is silenced while the app logs, so report on the original stream
+        print(f"  {name:<32} {stats['calls']:>5} calls  p50 {stats['p50_ms']:>9.2f} ms  "
+              f"p99 {stats['p99_ms']:>9.2f} ms  {stats['throughput_per_s']:>8.2f}/s", file=sys.__stdout__)
+
+    def cold_top_stocks():
+        # A fresh store and fundamentals cache, like a cold instance: every bar comes through yf.download
+        engine.store = OHLCVStore(root=tempfile.mkdtemp(prefix='bench-store-'))
+        engine.indicator_states = IndicatorStateStore(engine.store)
+        engine.fundamentals.invalidate()
+        engine.get_top_20_stocks()
+
+    print(f"Universe: {len(tickers)} tickers, {args.iterations} iteration(s)", file=sys.__stdout__)
+    report('get_top_20_stocks.cold', measure(cold_top_stocks, [()], args.iterations))
+    report('get_top_20_stocks.warm', measure(engine.get_top_20_stocks, [()], args.iterations))
+
+    ticker_args = [(ticker,) for ticker in tickers]
+    report('get_stock_data', measure(engine.get_stock_data, ticker_args, args.iterations))
+
+    # Indicators are added to the frame in place, so each call gets its own copy
+    fetched = [engine.get_stock_data(ticker) for ticker in tickers]
+    fetched = [(hist, info) for hist, info in fetched if hist is not None]
+    copies = [(hist.copy(),) for _ in range(args.iterations) for hist, _ in fetched]
+    report('calculate_technical_indicators', measure(engine.calculate_technical_indicators, copies, 1))
+
+    scored = [(engine.calculate_technical_indicators(hist.copy()), info) for hist, info in fetched]
+    report('calculate_prediction_score', measure(engine.calculate_prediction_score, scored, args.iterations))
+    report('analyze_single_stock', measure(engine.analyze_single_stock, ticker_args, args.iterations))
+
+    # Uncached inference: every call reaches the stand-in server
+    clear_inference = lambda *_: inference.classification_cache.invalidate()
+    analyze_args = [(ticker,) for ticker in STOCKSCORE_TICKERS]
+    report('AnalysisEngine.analyze_stock',
+           measure(analysis_engine.analyze_stock, analyze_args, args.iterations, before=clear_inference))
+
+    def clear_stockscore(ticker):
+        app.analysis_cache.invalidate()
+        inference.classification_cache.invalidate()
+
+    def get_stockscore(ticker):
+        response = client.get(f'/api/stockscore/{ticker}')
+        if response.status_code != 200:
+            raise RuntimeError(f"/api/stockscore/{ticker} returned {response.status_code}")
+
+    report('/api/stockscore', measure(get_stockscore, analyze_args, args.iterations, before=clear_stockscore))
+    for ticker in STOCKSCORE_TICKERS:
+        get_stockscore(ticker)
+    report('/api/stockscore.cached', measure(get_stockscore, analyze_args, args.iterations))
+
+    return results, len(tickers)
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline['meta']['commit']} (p50, lower is better):")
+    for name, stats in results.items():
+        before = baseline['results'].get(name)
+        if not before or not before.get('p50_ms') or stats['p50_ms'] is None:
+            continue
+        ratio = stats['p50_ms'] / before['p50_ms']
+        print(f"  {name:<32} {before['p50_ms']:>9.2f} -> {stats['p50_ms']:>9.2f} ms  ({ratio:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark of the prediction pipeline")
+    parser.add_argument('--fixtures', help="Recorded Yahoo fixture directory (default: benchmarks/fixtures)")
+    parser.add_argument('--record', action='store_true', help="Fetch from Yahoo and save fixtures (needs network)")
+    parser.add_argument('--iterations', type=int, default=3)
+    parser.add_argument('--yahoo-latency-ms', type=float, default=0.0,
+                        help="Simulated round trip per replayed Yahoo request")
+    parser.add_argument('--inference-latency-ms', type=float, default=50.0,
+                        help="Simulated round trip per inference request")
+    parser.add_argument('--output', help="Results file (default: benchmarks/results/pipeline-<commit>.json)")
+    parser.add_argument('--compare', help="Earlier results file to compare against")
+    parser.add_argument('--real-rate-limit', action='store_true',
+                        help="Keep the default Yahoo rate limiter when replaying")
+    parser.add_argument('--verbose', action='store_true', help="Show the app's own logging")
+    args = parser.parse_args()
+
+    # Configuration is read at import time, so it is set before any app module is imported
+    os.environ.update({
+        'OHLCV_STORE_DIR': tempfile.mkdtemp(prefix='bench-store-'),
+        'WARM_SNAPSHOT_PATH': os.path.join(tempfile.mkdtemp(prefix='bench-snapshot-'), 'none.json'),
+        'ENABLE_BACKGROUND_REFRESH': '0',
+        'HF_API_KEY': 'offline-benchmark',
+        'SENTIMENT_BACKEND': 'hosted'
+    })
+    rate_limited = args.record or args.real_rate_limit
+    if not rate_limited:
+        os.environ['YAHOO_RATE_LIMIT'] = os.environ['YAHOO_RATE_BURST'] = '1000000'
+
+    from fixtures import FIXTURES_DIR, InferenceStandIn, YahooFixtures, cold_start_wait, limiter_note
+
+    commit, dirty = git_commit()
+    stand_in = InferenceStandIn(latency=args.inference_latency_ms / 1000).start()
+    os.environ['HF_INFERENCE_URL'] = stand_in.url
+
+    started = time.time()
+    try:
+        with YahooFixtures(args.fixtures or FIXTURES_DIR, record=args.record, latency=args.yahoo_latency_ms / 1000) as yahoo:
+            with contextlib.redirect_stdout(sys.stdout if args.verbose else open(os.devnull, 'w')):
+                results, universe_size = run(args)
+    finally:
+        stand_in.stop()
+
+    output = args.output or os.path.join(RESULTS_DIR, f"pipeline-{commit}{'-dirty' if dirty else ''}.json")
+    payload = {
+        'meta': {
+            'commit': commit,
+            'dirty': dirty,
+            'timestamp': datetime.now().astimezone().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'duration_s': round(time.time() - started, 1),
+            'config': {
+                'mode': 'record' if args.record else 'replay',
+                'iterations': args.iterations,
+                'yahoo_latency_ms': args.yahoo_latency_ms,
+                'inference_latency_ms': args.inference_latency_ms,
+                'rate_limited': rate_limited
+            },
+            'limiter_wait_s': None if rate_limited else cold_start_wait(universe_size),
+            'yahoo': yahoo.stats,
+            'inference': {'requests': stand_in.requests, 'texts': stand_in.texts}
+        },
+        'results': results
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(payload, f, indent=2)
+    if not rate_limited:
+        print(limiter_note(universe_size))
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
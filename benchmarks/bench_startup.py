@@ -0,0 +1,98 @@
+"""
+Benchmark cold-start cost of the Flask app: `import app` in fresh interpreters.
+
+Reports the import time of the app, the slowest modules it pulls in (from
+`python -X importtime`), the first `/` and `/api/methodology` requests, and
+which heavy dependencies were loaded eagerly. Exits with status 1 if the app
+import exceeds the budget or a module meant to load lazily is imported at
+startup.
+
+Usage: python benchmarks/bench_startup.py [--runs 5] [--budget-ms 400] [--top 15]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use by the engines and inference backends, never by `import app`
+LAZY_MODULES = ('pandas', 'numpy', 'yfinance', 'huggingface_hub', 'pyarrow', 'requests')
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+client = app.app.test_client()
+client.get('/')
+page = time.perf_counter()
+client.get('/api/methodology')
+methodology = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'first_page_ms': (page - imported) * 1000,
+    'first_methodology_ms': (methodology - page) * 1000,
+    'lazy_loaded': [m for m in %r if m in sys.modules]
+}))
+""" % (LAZY_MODULES,)
+
+
+def run_probe(env):
+    output = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def module_times(env):
+    """(cumulative ms, self ms, module) for every module imported by `import app`"""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us) / 1000, int(self_us) / 1000, name.rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=float(os.environ.get('STARTUP_BUDGET_MS', 400)))
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    env = dict(os.environ, ENABLE_BACKGROUND_REFRESH='0')
+    probes = [run_probe(env) for _ in range(args.runs)]
+    import_ms = [p['import_ms'] for p in probes]
+
+    print(f"import app         median {statistics.median(import_ms):7.1f} ms   min {min(import_ms):7.1f} ms"
+          f"   (budget {args.budget_ms:.0f} ms, {args.runs} runs)")
+    print(f"first GET /        median {statistics.median(p['first_page_ms'] for p in probes):7.1f} ms")
+    print(f"first methodology  median {statistics.median(p['first_methodology_ms'] for p in probes):7.1f} ms")
+
+    print(f"\nSlowest imports (cumulative / self ms):")
+    for cumulative, own, name in sorted(module_times(env), reverse=True)[:args.top]:
+        print(f"  {cumulative:8.1f} {own:8.1f}  {name}")
+
+    failures = []
+    if statistics.median(import_ms) > args.budget_ms:
+        failures.append(f"import app took {statistics.median(import_ms):.1f} ms (budget {args.budget_ms:.0f} ms)")
+    eager = sorted(set(m for p in probes for m in p['lazy_loaded']))
+    if eager:
+        failures.append(f"loaded at startup: {', '.join(eager)}")
+
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        return 1
+    print("\nOK: within startup budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
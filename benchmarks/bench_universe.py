@@ -0,0 +1,102 @@
+"""
+Benchmark how universe ranking scales with the number of tickers.
+
+Each size runs `get_top_20_stocks` in a fresh interpreter over a universe of
+synthetic tickers replayed through benchmarks/fixtures.py (no network), and
+reports wall time and peak RSS. With sharding, both should grow roughly
+linearly: time per ticker and RSS per added ticker stay about constant.
+
+The Yahoo rate limiter is disabled so the numbers show the ranking itself;
+the wait it adds to a cold start is printed alongside (--real-rate-limit
+keeps it).
+
+Usage: python benchmarks/bench_universe.py [--sizes 250 500 1000 2000] [--shard-size 250] [--real-rate-limit] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fixtures import UNLIMITED_RATE, cold_start_wait, limiter_note
+
+PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, 'benchmarks')
+from fixtures import YahooFixtures
+from prediction_engine import StockPredictionEngine
+
+with YahooFixtures(sys.argv[1]):
+    engine = StockPredictionEngine()
+    start = time.perf_counter()
+    top = engine.get_top_20_stocks()
+    seconds = time.perf_counter() - start
+
+print(json.dumps({
+    'seconds': seconds,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'ranked': len(top['short_term'])
+}))
+"""
+
+
+def run_size(size, args):
+    directory = tempfile.mkdtemp(prefix='bench-universe-')
+    universe_path = os.path.join(directory, 'universe.txt')
+    with open(universe_path, 'w') as f:
+        f.write('\n'.join(f'SYN{i:05d}' for i in range(size)))
+
+    env = dict(os.environ,
+               STOCK_UNIVERSE=universe_path,
+               UNIVERSE_SHARD_SIZE=str(args.shard_size),
+               OHLCV_STORE_DIR=os.path.join(directory, 'store'))
+    if not args.real_rate_limit:
+        env.update(YAHOO_RATE_LIMIT=UNLIMITED_RATE, YAHOO_RATE_BURST=UNLIMITED_RATE)
+    # Empty fixture directory: every ticker gets deterministic synthetic data
+    output = subprocess.run([sys.executable, '-c', PROBE, os.path.join(directory, 'fixtures')],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Universe ranking runtime and memory scaling")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 500, 1000, 2000])
+    parser.add_argument('--shard-size', type=int, default=250)
+    parser.add_argument('--real-rate-limit', action='store_true',
+                        help="Keep the default Yahoo rate limiter (cold runs then wait on it)")
+    parser.add_argument('--output', help="Write the measurements as JSON")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'tickers':>8} {'seconds':>9} {'ms/ticker':>10} {'peak RSS MB':>12} {'KB/ticker*':>11}")
+    for size in sorted(args.sizes):
+        result = run_size(size, args)
+        result['tickers'] = size
+        if not args.real_rate_limit:
+            result['limiter_wait_s'] = cold_start_wait(size)
+        if rows:
+            # Marginal memory against the smallest run, which absorbs the interpreter and imports
+            base = rows[0]
+            added = size - base['tickers']
+            result['marginal_kb_per_ticker'] = round((result['peak_rss_mb'] - base['peak_rss_mb']) * 1024 / added, 1)
+        rows.append(result)
+        print(f"{size:>8} {result['seconds']:>9.2f} {result['seconds'] * 1000 / size:>10.2f} "
+              f"{result['peak_rss_mb']:>12.0f} {result.get('marginal_kb_per_ticker', float('nan')):>11.1f}")
+    print("* peak RSS added per ticker over the smallest universe")
+    if not args.real_rate_limit:
+        print(limiter_note(max(args.sizes)))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'shard_size': args.shard_size, 'rate_limited': args.real_rate_limit, 'runs': rows}, f, indent=2)
+        print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
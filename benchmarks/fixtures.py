@@ -0,0 +1,279 @@
+"""
+Record/replay fixtures for Yahoo Finance and a local stand-in for the hosted inference API.
+
+YahooFixtures patches the two yfinance entry points the app uses
+(`yf.download` for bars, `yf.Ticker(...).info` for fundamentals). In record
+mode, real responses are saved per ticker. In replay mode, they are served
+from disk, with deterministic synthetic data for tickers that were never
+recorded. InferenceStandIn is a local HTTP server that answers
+`POST /models/<model>` like the hosted API, scoring texts with the offline
+lexicon after a configurable delay.
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from fundamentals import INFO_FIELDS
+from rate_limiter import DEFAULT_RATE, DEFAULT_BURST
+from peer_scoreboard import INDUSTRY_GROUPS
+from sentiment_lexicon import LexiconSentimentBackend
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+MARKET_TZ = 'America/New_York'
+
+
+# Rate and burst the benchmarks use unless asked to keep the default Yahoo limiter
+UNLIMITED_RATE = '1000000'
+
+
+def cold_start_wait(tickers, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+    """Seconds the default Yahoo limiter adds to a cold run over `tickers` tickers.
+
+    A cold run takes one token per ticker for bars (batched downloads are
+    charged per ticker) and one per ticker for fundamentals.
+    """
+    bars = max(tickers - burst, 0) / rate
+    total = max(2 * tickers - burst, 0) / rate
+    return {'bars_s': round(bars, 1), 'fundamentals_s': round(total - bars, 1)}
+
+
+def limiter_note(tickers):
+    """Line printed by the benchmarks when they run with the limiter disabled"""
+    wait = cold_start_wait(tickers)
+    return (f"Yahoo rate limiter disabled (YAHOO_RATE_LIMIT={UNLIMITED_RATE}) to time the pipeline itself; "
+            f"at the default {DEFAULT_RATE} req/s a cold start over {tickers} tickers also waits "
+            f"~{wait['bars_s']:.0f} s for bars + ~{wait['fundamentals_s']:.0f} s for fundamentals. "
+            f"Pass --real-rate-limit to include it.")
+
+
+def _seed(ticker):
+    return zlib.crc32(ticker.encode('utf-8'))
+
+
+def synthetic_bars(ticker, days=260):
+    """Deterministic random-walk daily bars ending today"""
+    rng = np.random.default_rng(_seed(ticker))
+    index = pd.bdate_range(end=pd.Timestamp.now(tz=MARKET_TZ).normalize(), periods=days, tz=MARKET_TZ)
+    base = 4.0 if ticker == '^TNX' else rng.uniform(20, 500)
+    close = base * np.exp(np.cumsum(rng.normal(0.0004, 0.018, days)))
+    spread = np.abs(rng.normal(0, 0.01, days))
+    return pd.DataFrame({
+        'Open': close * (1 + rng.normal(0, 0.005, days)),
+        'High': close * (1 + spread),
+        'Low': close * (1 - spread),
+        'Close': close,
+        'Volume': rng.integers(1_000_000, 60_000_000, days).astype(float)
+    }, index=index)
+
+
+def synthetic_info(ticker):
+    rng = np.random.default_rng(_seed(ticker) + 1)
+    industry = next((name for name, members in INDUSTRY_GROUPS.items() if ticker in members), 'Software')
+    price = float(synthetic_bars(ticker)['Close'].iloc[-1])
+    return {
+        'longName': f'{ticker} Inc.', 'shortName': ticker, 'sector': 'Technology', 'industry': industry,
+        'currentPrice': round(price, 2), 'forwardPE': round(float(rng.uniform(8, 45)), 2),
+        'trailingPE': round(float(rng.uniform(8, 60)), 2), 'profitMargins': round(float(rng.uniform(-0.1, 0.4)), 3),
+        'returnOnEquity': round(float(rng.uniform(-0.1, 0.5)), 3), 'marketCap': int(rng.integers(10**9, 3 * 10**12)),
+        'volume': int(rng.integers(10**6, 6 * 10**7)), 'averageVolume': int(rng.integers(10**6, 6 * 10**7)),
+        'recommendationKey': str(rng.choice(['strong_buy', 'buy', 'hold', 'sell'])),
+        'targetMeanPrice': round(price * float(rng.uniform(0.8, 1.4)), 2)
+    }
+
+
+class _FixtureTicker:
+    def __init__(self, info):
+        self.info = info
+
+
+class YahooFixtures:
+    """Serve (or record) yfinance responses from a fixture directory.
+
+    Bars are stored per ticker, so any batch composition can be replayed.
+    `latency` adds a simulated round trip per replayed request.
+    """
+
+    def __init__(self, directory=FIXTURES_DIR, record=False, latency=0.0):
+        self.directory = directory
+        self.record = record
+        self.latency = latency
+        self.bars_dir = os.path.join(directory, 'yahoo', 'bars')
+        self.info_path = os.path.join(directory, 'yahoo', 'info.json')
+        self._lock = threading.Lock()
+        self._bars = {}
+        self._info = {}
+        self._originals = None
+        self.stats = {'download_requests': 0, 'info_requests': 0, 'recorded': 0, 'replayed': 0, 'synthesized': 0}
+
+        if os.path.exists(self.info_path):
+            with open(self.info_path) as f:
+                self._info = json.load(f)
+
+    def _bars_path(self, ticker):
+        return os.path.join(self.bars_dir, f"{ticker.replace('^', '_')}.pkl")
+
+    def bars(self, ticker):
+        with self._lock:
+            bars = self._bars.get(ticker)
+        if bars is not None:
+            return bars
+        path = self._bars_path(ticker)
+        if os.path.exists(path):
+            bars = pd.read_pickle(path)
+            self.stats['replayed'] += 1
+        else:
+            bars = synthetic_bars(ticker)
+            self.stats['synthesized'] += 1
+        with self._lock:
+            self._bars[ticker] = bars
+        return bars
+
+    def info(self, ticker):
+        info = self._info.get(ticker)
+        if info is None:
+            info = synthetic_info(ticker)
+            self._info[ticker] = info
+        return info
+
+    # Replay -------------------------------------------------------------
+
+    def _replay_download(self, tickers, start=None, period=None, **kwargs):
+        self.stats['download_requests'] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        frames = {}
+        for ticker in tickers:
+            bars = self.bars(ticker)
+            if start is not None:
+                bars = bars[bars.index >= pd.Timestamp(start, tz=bars.index.tz)]
+            frames[ticker] = bars
+        return pd.concat(frames, axis=1)
+
+    def _replay_ticker(self, ticker, *args, **kwargs):
+        self.stats['info_requests'] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return _FixtureTicker(self.info(ticker))
+
+    # Record -------------------------------------------------------------
+
+    def _record_download(self, tickers, **kwargs):
+        data = self._originals['download'](tickers, **kwargs)
+        self.stats['download_requests'] += 1
+        if data is None or data.empty:
+            return data
+        os.makedirs(self.bars_dir, exist_ok=True)
+        batch = [tickers] if isinstance(tickers, str) else list(tickers)
+        for ticker in batch:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                frame = data[ticker]
+            else:
+                frame = data
+            frame = frame.dropna(how='all')
+            if kwargs.get('start') is None and not frame.empty:
+                frame.to_pickle(self._bars_path(ticker))
+                self.stats['recorded'] += 1
+        return data
+
+    def _record_ticker(self, ticker, *args, **kwargs):
+        real = self._originals['Ticker'](ticker, *args, **kwargs)
+        self.stats['info_requests'] += 1
+        info = real.info or {}
+        with self._lock:
+            self._info[ticker] = {key: info[key] for key in INFO_FIELDS if key in info}
+            os.makedirs(os.path.dirname(self.info_path), exist_ok=True)
+            with open(self.info_path, 'w') as f:
+                json.dump(self._info, f, indent=1, sort_keys=True)
+        self.stats['recorded'] += 1
+        return _FixtureTicker(info)
+
+    def __enter__(self):
+        self._originals = {'download': yf.download, 'Ticker': yf.Ticker}
+        if self.record:
+            yf.download, yf.Ticker = self._record_download, self._record_ticker
+        else:
+            yf.download, yf.Ticker = self._replay_download, self._replay_ticker
+        return self
+
+    def __exit__(self, *exc):
+        yf.download, yf.Ticker = self._originals['download'], self._originals['Ticker']
+        return False
+
+
+class InferenceStandIn:
+    """Local stand-in for the hosted inference API.
+
+    Answers `POST /models/<model>` with `{"inputs": text or [texts]}` using
+    the label names the real model returns. `latency` is slept per request to
+    model the hosted round trip.
+    """
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.backend = LexiconSentimentBackend()
+        self.requests = 0
+        self.texts = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                inputs = json.loads(body or b'{}').get('inputs', '')
+                texts = inputs if isinstance(inputs, list) else [inputs]
+                model = self.path.split('/models/', 1)[-1]
+
+                time.sleep(stand_in.latency)
+                stand_in.requests += 1
+                stand_in.texts += len(texts)
+
+                results = stand_in.backend.classify_many(texts, model=model)
+                payload = json.dumps(results if isinstance(inputs, list) else results[:1]).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='inference-stand-in', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
@@ -0,0 +1,148 @@
+import os
+import re
+import threading
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Hosted models answer 503 "... is currently loading" with an estimated_time while cold
+ESTIMATED_TIME_PATTERN = re.compile(r"estimated_time['\"]?\s*[:=]\s*([0-9.]+)")
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+def is_cold_start(error):
+    message = str(error).lower()
+    return 'loading' in message or '503' in message
+
+
+class CircuitBreaker:
+    """Fail fast while an upstream model is cold or failing.
+
+    A cold-start response (503 / "loading") opens the circuit right away for
+    the model's estimated load time; other failures open it after
+    `failure_threshold` in a row. While open, calls raise CircuitOpenError
+    without touching the network. Once the open period ends, a single
+    half-open probe is let through: success closes the circuit, failure opens
+    it again. The error message keeps "loading" for cold starts so callers'
+    existing warm-up fallbacks apply.
+    """
+
+    def __init__(self, name, failure_threshold=None, reset_timeout=None, cold_start_timeout=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or int(os.environ.get('CIRCUIT_FAILURE_THRESHOLD', 3))
+        self.reset_timeout = reset_timeout or float(os.environ.get('CIRCUIT_RESET_SECONDS', 30))
+        self.cold_start_timeout = cold_start_timeout or float(os.environ.get('COLD_START_SECONDS', 20))
+        self.state = CLOSED
+        self.failures = 0
+        self.cold = False
+        self.opened_until = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.rejected = 0
+        self.cold_starts = 0
+        self.last_cold_start = None
+        self.last_error = None
+
+    def _reject(self, now):
+        self.rejected += 1
+        retry_in = max(int(self.opened_until - now), 1)
+        if self.cold:
+            raise CircuitOpenError(f"{self.name} is loading (circuit open, retry in {retry_in}s)")
+        raise CircuitOpenError(f"{self.name} unavailable after {self.failures} failures (circuit open, retry in {retry_in}s)")
+
+    def _before_call(self):
+        """Admit or reject a call; returns True if it is the half-open probe"""
+        now = time.time()
+        with self._lock:
+            if self.state == OPEN:
+                if now < self.opened_until:
+                    self._reject(now)
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    self._reject(now)
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def _open(self, seconds):
+        self.state = OPEN
+        self.opened_until = time.time() + seconds
+
+    def _record_success(self, probe):
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+            self.state = CLOSED
+            self.failures = 0
+            self.cold = False
+
+    def _record_failure(self, error, probe):
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+            self.failures += 1
+            self.last_error = str(error)[:200]
+
+            if is_cold_start(error):
+                match = ESTIMATED_TIME_PATTERN.search(str(error))
+                wait = float(match.group(1)) if match else self.cold_start_timeout
+                if not self.cold:
+                    self.cold_starts += 1
+                    self.last_cold_start = time.time()
+                self.cold = True
+                self._open(min(max(wait, 1.0), 120.0))
+            elif probe or self.failures >= self.failure_threshold:
+                self.cold = False
+                self._open(self.reset_timeout)
+
+    def call(self, fn):
+        probe = self._before_call()
+        self.calls += 1
+        try:
+            result = fn()
+        except Exception as e:
+            self._record_failure(e, probe)
+            raise
+        self._record_success(probe)
+        return result
+
+    def stats(self):
+        now = time.time()
+        return {
+            'state': self.state,
+            'cold': self.cold,
+            'consecutive_failures': self.failures,
+            'open_for_seconds': round(max(self.opened_until - now, 0), 1) if self.state == OPEN else 0,
+            'calls': self.calls,
+            'rejected': self.rejected,
+            'cold_starts': self.cold_starts,
+            'last_cold_start_age_seconds': round(now - self.last_cold_start, 1) if self.last_cold_start else None,
+            'last_error': self.last_error
+        }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(name):
+    """The process-wide circuit breaker for one upstream model"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        return breaker
+
+
+def stats():
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.stats() for name, breaker in breakers.items()}
@@ -0,0 +1,164 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+import yfinance as yf
+from rate_limiter import yahoo_limiter
+from singleflight import SingleFlight
+
+# Yahoo `info` keys we actually read, mapped to record attributes. Price and
+# volume move all session, so routes read them from the latest stored bar instead
+INFO_FIELDS = {
+    'longName': 'long_name',
+    'shortName': 'short_name',
+    'sector': 'sector',
+    'industry': 'industry',
+    'forwardPE': 'forward_pe',
+    'trailingPE': 'trailing_pe',
+    'profitMargins': 'profit_margins',
+    'returnOnEquity': 'return_on_equity',
+    'marketCap': 'market_cap',
+    'recommendationKey': 'recommendation_key',
+    'targetMeanPrice': 'target_mean_price',
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Fundamentals:
+    """Compact subset of Yahoo `Ticker.info` used by the engines.
+
+    Supports the dict-style access (`info.get('forwardPE')`, `info['sector']`,
+    `'forwardPE' in info`) that the scoring and route code already uses.
+    Missing keys read as absent, like they would on the raw dict.
+    """
+    long_name: str = None
+    short_name: str = None
+    sector: str = None
+    industry: str = None
+    forward_pe: float = None
+    trailing_pe: float = None
+    profit_margins: float = None
+    return_on_equity: float = None
+    market_cap: int = None
+    recommendation_key: str = None
+    target_mean_price: float = None
+
+    @classmethod
+    def from_info(cls, info):
+        return cls(**{attr: info.get(key) for key, attr in INFO_FIELDS.items()})
+
+    @classmethod
+    def defaults(cls, ticker):
+        """Placeholder used when Yahoo returns no usable info"""
+        return cls(long_name=ticker, sector='N/A', industry='N/A')
+
+    def get(self, key, default=None):
+        attr = INFO_FIELDS.get(key)
+        value = getattr(self, attr) if attr else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def to_dict(self):
+        return {key: getattr(self, attr) for key, attr in INFO_FIELDS.items()
+                if getattr(self, attr) is not None}
+
+
+class FundamentalsCache:
+    """TTL cache of compact fundamentals records keyed by ticker.
+
+    Fundamentals only change daily, so one `Ticker.info` round trip per
+    ticker per TTL is enough for every route and peer lookup.
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl if ttl is not None else float(os.environ.get('FUNDAMENTALS_TTL', 6 * 3600))
+        self._entries = {}  # ticker -> (record, expires_at)
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.fetch_seconds = 0.0
+
+    def _fetch(self, ticker):
+        try:
+            yahoo_limiter.acquire()
+            info = yf.Ticker(ticker).info
+        except Exception as e:
+            print(f"Error getting info for {ticker}: {e}")
+            return None
+
+        if not info or len(info) < 5:  # Minimal valid info should have more than 5 keys
+            print(f"Limited info for {ticker}, using defaults")
+            return None
+        return Fundamentals.from_info(info)
+
+    def get(self, ticker):
+        """Return cached fundamentals for a ticker, fetching on miss or expiry"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry and entry[1] > now:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Concurrent misses for the same ticker share one Yahoo round trip
+        return self._flight.do(ticker, lambda: self._load(ticker))
+
+    def _load(self, ticker):
+        start = time.time()
+        record = self._fetch(ticker)
+        elapsed = time.time() - start
+
+        with self._lock:
+            self.fetch_seconds += elapsed
+            if record is None:
+                # Don't pin failures for a whole TTL; the next request retries
+                return Fundamentals.defaults(ticker)
+            self._entries[ticker] = (record, time.time() + self.ttl)
+        return record
+
+    def seed(self, records, fetched_at):
+        """Prime the cache with records fetched elsewhere at `fetched_at` (epoch seconds).
+
+        Records expire a TTL after they were fetched; entries already cached
+        are kept.
+        """
+        expires_at = fetched_at + self.ttl
+        if expires_at <= time.time():
+            return 0
+        with self._lock:
+            added = 0
+            for ticker, record in records.items():
+                if ticker not in self._entries:
+                    self._entries[ticker] = (record, expires_at)
+                    added += 1
+            return added
+
+    def invalidate(self, ticker=None):
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(ticker, None)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            avg_fetch = self.fetch_seconds / self.misses if self.misses else 0.0
+            return {
+                'entries': len(self._entries),
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'avg_fetch_seconds': round(avg_fetch, 3),
+                'estimated_saved_seconds': round(self.hits * avg_fetch, 1)
+            }
@@ -0,0 +1,95 @@
+import hashlib
+import os
+from werkzeug.http import remove_entity_headers
+
+# Default browser/CDN lifetime for API responses that are reused between requests
+API_CACHE_SECONDS = int(os.environ.get('API_CACHE_SECONDS', 60))
+
+# Compressed representations get their own ETag (see ResponseCompressor);
+# the suffix is stripped before comparing If-None-Match
+ENCODING_SUFFIXES = ('-gzip', '-br')
+
+
+def content_etag(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def snapshot_etag(name, snapshot):
+    """ETag identifying a snapshot; it only changes when new data is published"""
+    return f"{name}-v{snapshot.version}-{int(snapshot.generated_at.timestamp())}"
+
+
+def matched_etag(etag, if_none_match):
+    """The client's tag matching `etag` (possibly with an encoding suffix), or None"""
+    if if_none_match.star_tag:
+        return etag
+    for tag in if_none_match.as_set(include_weak=True):
+        base = tag
+        for suffix in ENCODING_SUFFIXES:
+            if tag.endswith(suffix):
+                base = tag[:-len(suffix)]
+                break
+        if base == etag:
+            return tag
+    return None
+
+
+def cache_response(response, max_age, etag=None, shared=True):
+    """Set Cache-Control (and optionally a precomputed ETag) on a response.
+
+    Shared responses also get s-maxage, which the Vercel edge cache requires
+    before it stores a function response.
+    """
+    max_age = max(int(max_age), 0)
+    response.cache_control.public = shared
+    response.cache_control.private = not shared
+    response.cache_control.max_age = max_age
+    if shared:
+        response.cache_control.s_maxage = max_age
+    if etag is not None:
+        response.set_etag(etag)
+    return response
+
+
+def not_modified(response_class, etag, max_age, shared=True):
+    """Empty 304 for a client that already holds `etag`"""
+    response = cache_response(response_class(status=304), max_age, etag, shared)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def finalize(response, request):
+    """Add validators and cache headers to a response and answer If-None-Match.
+
+    Successful GET responses without an explicit ETag get one hashed from
+    their body, and default to `no-cache` (store, but revalidate) unless the
+    route set its own Cache-Control. A matching If-None-Match turns the
+    response into an empty 304. Error JSON is marked `no-store`. Streamed
+    responses and static files (which Flask validates itself) are untouched.
+    """
+    if request.method not in ('GET', 'HEAD') or response.is_streamed or response.direct_passthrough:
+        return response
+
+    if response.status_code != 200:
+        if response.status_code >= 400 and 'Cache-Control' not in response.headers:
+            response.cache_control.no_store = True
+        return response
+
+    if 'Cache-Control' not in response.headers:
+        response.cache_control.no_cache = True
+    if response.cache_control.no_store:
+        return response
+
+    etag, _ = response.get_etag()
+    if etag is None:
+        etag = content_etag(response.get_data())
+        response.set_etag(etag)
+
+    matched = matched_etag(etag, request.if_none_match)
+    if matched is not None:
+        response.status_code = 304
+        response.set_data(b'')
+        remove_entity_headers(response.headers)
+        response.set_etag(matched)
+        response.vary.add('Accept-Encoding')
+    return response
@@ -0,0 +1,75 @@
+import os
+import threading
+
+
+class PooledSession:
+    """Process-wide requests.Session with keep-alive connection pooling.
+
+    The session is created on first use and shared by every thread, so
+    repeated calls to the same host reuse warm TLS connections instead of
+    handshaking each time. `pool_connections` bounds how many hosts keep a
+    pool and `pool_maxsize` how many connections each host keeps open.
+    """
+
+    def __init__(self, name, pool_connections=None, pool_maxsize=None):
+        self.name = name
+        self.pool_connections = pool_connections or int(os.environ.get('HTTP_POOL_CONNECTIONS', 10))
+        self.pool_maxsize = pool_maxsize or int(os.environ.get('HTTP_POOL_MAXSIZE', 20))
+        self._session = None
+        self._adapters = []
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    # Imported here so processes that never call out skip loading requests
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    for prefix in ('https://', 'http://'):
+                        # Block when a host's pool is exhausted rather than opening throwaway connections
+                        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                                              pool_maxsize=self.pool_maxsize, pool_block=True)
+                        session.mount(prefix, adapter)
+                        self._adapters.append(adapter)
+                    self._session = session
+        return self._session
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def stats(self):
+        """Connection counters summed over this session's per-host pools"""
+        requests_sent = 0
+        new_connections = 0
+        hosts = 0
+        for adapter in self._adapters:
+            pools = adapter.poolmanager.pools
+            with pools.lock:
+                host_pools = list(pools._container.values())
+            for pool in host_pools:
+                hosts += 1
+                requests_sent += pool.num_requests
+                new_connections += pool.num_connections
+        return {
+            'created': self._session is not None,
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'hosts': hosts,
+            'requests': requests_sent,
+            'new_connections': new_connections,
+            'reused_connections': requests_sent - new_connections
+        }
+
+
+# Shared by the hosted inference calls (batched classification and FinBERT)
+inference_http = PooledSession('inference')
@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Columns added by StockPredictionEngine.calculate_technical_indicators, in order
+INDICATOR_COLUMNS = [
+    'SMA_20', 'SMA_50', 'SMA_200', 'EMA_12', 'EMA_26', 'RSI', 'MACD',
+    'Signal_Line', 'BB_middle', 'BB_upper', 'BB_lower', 'Volume_SMA'
+]
+
+
+def rolling_mean(x, window):
+    """Trailing mean over `window` rows of a dates x tickers array.
+
+    Matches pandas `rolling(window).mean()`: any NaN inside the window
+    makes that output NaN.
+    """
+    valid = ~np.isnan(x)
+    sums = np.zeros((x.shape[0] + 1, x.shape[1]))
+    counts = np.zeros((x.shape[0] + 1, x.shape[1]))
+    np.cumsum(np.where(valid, x, 0.0), axis=0, out=sums[1:])
+    np.cumsum(valid, axis=0, out=counts[1:])
+
+    out = np.full(x.shape, np.nan)
+    window_sum = sums[window:] - sums[:-window]
+    window_count = counts[window:] - counts[:-window]
+    out[window - 1:] = np.where(window_count == window, window_sum / window, np.nan)
+    return out
+
+
+def rolling_std(x, window, chunk=512):
+    """Trailing sample standard deviation (ddof=1), NaN-propagating like pandas.
+
+    Uses exact two-pass windows rather than running sums so flat price
+    stretches come out as 0 instead of sqrt(rounding error). Columns are
+    processed in chunks to bound the size of the window views.
+    """
+    out = np.full(x.shape, np.nan)
+    if x.shape[0] < window:
+        return out
+
+    for start in range(0, x.shape[1], chunk):
+        windows = sliding_window_view(x[:, start:start + chunk], window, axis=0)
+        std = windows.std(axis=-1, ddof=1)
+        # pandas reports exactly zero for windows of identical values
+        std[windows.max(axis=-1) == windows.min(axis=-1)] = 0.0
+        out[window - 1:, start:start + chunk] = std
+    return out
+
+
+def ewm_mean(x, span):
+    """Recursive EMA per column, matching pandas `ewm(span, adjust=False).mean()`.
+
+    The recursion runs once over dates with every ticker updated in the
+    same vector step, including pandas' handling of leading and interior
+    NaNs (ignore_na=False).
+    """
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    out = np.full(x.shape, np.nan)
+    if x.shape[0] == 0:
+        return out
+
+    weighted = x[0].copy()
+    old_wt = np.ones(x.shape[1])
+    out[0] = weighted
+    for i in range(1, x.shape[0]):
+        cur = x[i]
+        is_obs = ~np.isnan(cur)
+        started = ~np.isnan(weighted)
+
+        old_wt = np.where(started, old_wt * decay, old_wt)
+        update = started & is_obs & (weighted != cur)
+        blended = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(update, blended, weighted)
+        old_wt = np.where(started & is_obs, 1.0, old_wt)
+        weighted = np.where(~started & is_obs, cur, weighted)
+        out[i] = weighted
+    return out
+
+
+def rsi(close, window=14):
+    """Simple-average RSI matching the per-ticker implementation"""
+    delta = np.full(close.shape, np.nan)
+    delta[1:] = close[1:] - close[:-1]
+    has_bar = ~np.isnan(close)
+
+    with np.errstate(invalid='ignore'):
+        # A ticker's first bar has no delta and counts as zero gain/loss
+        gain = np.where(has_bar, np.where(delta > 0, delta, 0.0), np.nan)
+        loss = np.where(has_bar, np.where(delta < 0, -delta, 0.0), np.nan)
+
+    avg_gain = rolling_mean(gain, window)
+    avg_loss = rolling_mean(loss, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+class IndicatorPanel:
+    """Technical indicators for a whole universe, computed as 2-D arrays.
+
+    Close and volume are laid out as a sessions x tickers panel and every
+    indicator is produced in one vectorized pass, instead of a dozen pandas
+    rolling/ewm calls per ticker. Histories are right-aligned on their last
+    bar, so row i is the same session for every ticker trading a common
+    calendar, and windows count a ticker's own bars exactly like the
+    per-ticker implementation (a missing session never opens a NaN hole).
+    """
+
+    def __init__(self, frames, min_history=50):
+        self.frames = {t: df for t, df in frames.items() if df is not None and not df.empty}
+        self.min_history = min_history
+        self.tickers = list(self.frames)
+        self._columns_by_ticker = {t: i for i, t in enumerate(self.tickers)}
+
+        rows = max((len(df) for df in self.frames.values()), default=0)
+        self.close = np.full((rows, len(self.tickers)), np.nan)
+        self.volume = np.full((rows, len(self.tickers)), np.nan)
+        for col, df in enumerate(self.frames.values()):
+            self.close[rows - len(df):, col] = df['Close'].to_numpy(dtype=float)
+            self.volume[rows - len(df):, col] = df['Volume'].to_numpy(dtype=float)
+
+        self.columns = self._compute()
+
+    def _compute(self):
+        close = self.close
+        sma_20 = rolling_mean(close, 20)
+        bb_std = rolling_std(close, 20)
+        ema_12 = ewm_mean(close, 12)
+        ema_26 = ewm_mean(close, 26)
+        macd = ema_12 - ema_26
+
+        return {
+            'SMA_20': sma_20,
+            'SMA_50': rolling_mean(close, 50),
+            'SMA_200': rolling_mean(close, 200),
+            'EMA_12': ema_12,
+            'EMA_26': ema_26,
+            'RSI': rsi(close, 14),
+            'MACD': macd,
+            'Signal_Line': ewm_mean(macd, 9),
+            'BB_middle': sma_20,
+            'BB_upper': sma_20 + bb_std * 2,
+            'BB_lower': sma_20 - bb_std * 2,
+            'Volume_SMA': rolling_mean(self.volume, 20)
+        }
+
+    def frame(self, ticker):
+        """Per-ticker DataFrame with indicator columns, like calculate_technical_indicators"""
+        hist = self.frames.get(ticker)
+        if hist is None or len(hist) < self.min_history:
+            return None
+
+        col = self._columns_by_ticker[ticker]
+        start = self.close.shape[0] - len(hist)
+        # Build the frame in one constructor call; per-column inserts dominate otherwise
+        data = {name: hist[name].to_numpy() for name in hist.columns}
+        for name in INDICATOR_COLUMNS:
+            data[name] = self.columns[name][start:, col]
+        return pd.DataFrame(data, index=hist.index)
+
+    def latest(self, tickers=None):
+        """Last-bar value of every input and indicator, as name -> 1-D array over tickers.
+
+        `tickers` selects (and orders) the columns; by default every panel ticker.
+        """
+        cols = slice(None) if tickers is None else [self._columns_by_ticker[t] for t in tickers]
+        latest = {name: values[-1, cols] for name, values in self.columns.items()}
+        latest['Close'] = self.close[-1, cols]
+        latest['Volume'] = self.volume[-1, cols]
+        return latest
+
+    def frames_with_indicators(self):
+        """All tickers with enough history, as ticker -> DataFrame"""
+        result = {}
+        for ticker in self.tickers:
+            df = self.frame(ticker)
+            if df is not None:
+                result[ticker] = df
+        return result
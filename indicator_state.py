@@ -0,0 +1,423 @@
+import json
+import math
+import os
+import threading
+from collections import deque
+import pandas as pd
+from ohlcv_store import ADJUSTMENT_TOLERANCE
+
+NAN = float('nan')
+
+
+class RollingWindow:
+    """Trailing window with running sums, so mean/std update in O(1) per bar.
+
+    Mirrors pandas `rolling(window)`: output is NaN until the window is full
+    and whenever it holds a NaN. The running sums are re-added from the
+    window every `window` pushes so floating-point drift cannot build up,
+    and a run of identical values reports a std of exactly 0 like pandas.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.nans = 0
+        self.run = 0        # Length of the trailing run of identical values
+        self.prev_run = 0   # `run` before the last push, for replace()
+        self.pushes = 0
+
+    def _add(self, x, sign):
+        if math.isnan(x):
+            self.nans += sign
+        else:
+            self.total += sign * x
+            self.total_sq += sign * x * x
+
+    def _resum(self):
+        finite = [v for v in self.values if not math.isnan(v)]
+        self.total = math.fsum(finite)
+        self.total_sq = math.fsum(v * v for v in finite)
+
+    def push(self, x):
+        if len(self.values) == self.window:
+            self._add(self.values[0], -1)
+        last = self.values[-1] if self.values else None
+        self.values.append(x)
+        self._add(x, 1)
+
+        self.prev_run = self.run
+        self.run = self.run + 1 if last == x else 1
+        self.pushes += 1
+        if self.pushes % self.window == 0:
+            self._resum()
+
+    def replace(self, x):
+        """Swap the most recently pushed value (a revised partial bar)"""
+        self._add(self.values[-1], -1)
+        self.values[-1] = x
+        self._add(x, 1)
+        previous = self.values[-2] if len(self.values) > 1 else None
+        self.run = self.prev_run + 1 if previous == x else 1
+
+    def mean(self):
+        if len(self.values) < self.window or self.nans:
+            return NAN
+        return self.total / self.window
+
+    def std(self):
+        """Sample standard deviation (ddof=1)"""
+        if len(self.values) < self.window or self.nans:
+            return NAN
+        if self.run >= self.window:
+            return 0.0
+        n = self.window
+        var = (self.total_sq - self.total * self.total / n) / (n - 1)
+        return math.sqrt(var) if var > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'window': self.window,
+            'values': list(self.values),
+            'run': self.run,
+            'prev_run': self.prev_run,
+            'pushes': self.pushes
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = cls(data['window'])
+        obj.values.extend(data['values'])
+        obj.run = data['run']
+        obj.prev_run = data['prev_run']
+        obj.pushes = data['pushes']
+        obj.nans = sum(1 for v in obj.values if math.isnan(v))
+        obj._resum()
+        return obj
+
+
+class RecursiveEMA:
+    """EMA matching pandas `ewm(span, adjust=False).mean()` one value at a time"""
+
+    def __init__(self, span):
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.weighted = None
+        self.old_wt = 1.0
+        self.prev = None  # (weighted, old_wt) before the last push, for replace()
+
+    def push(self, x):
+        self.prev = (self.weighted, self.old_wt)
+        if self.weighted is None:
+            self.weighted = x
+            self.old_wt = 1.0
+            return self.weighted
+
+        # Same recursion as indicator_panel.ewm_mean, including NaN handling
+        started = not math.isnan(self.weighted)
+        is_obs = not math.isnan(x)
+        if started:
+            self.old_wt *= 1.0 - self.alpha
+            if is_obs:
+                if self.weighted != x:
+                    self.weighted = (self.old_wt * self.weighted + self.alpha * x) / (self.old_wt + self.alpha)
+                self.old_wt = 1.0
+        elif is_obs:
+            self.weighted = x
+        return self.weighted
+
+    def replace(self, x):
+        self.weighted, self.old_wt = self.prev
+        return self.push(x)
+
+    @property
+    def value(self):
+        return NAN if self.weighted is None else self.weighted
+
+    def to_dict(self):
+        return {'span': self.span, 'weighted': self.weighted, 'old_wt': self.old_wt, 'prev': self.prev}
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = cls(data['span'])
+        obj.weighted = data['weighted']
+        obj.old_wt = data['old_wt']
+        obj.prev = tuple(data['prev']) if data['prev'] is not None else None
+        return obj
+
+
+class IncrementalRSI:
+    """Simple-average RSI over gain/loss windows, updated per close"""
+
+    def __init__(self, window=14):
+        self.gains = RollingWindow(window)
+        self.losses = RollingWindow(window)
+        self.last_close = None
+        self.prev_close = None  # Close before the last push, for replace()
+
+    def _deltas(self, close, previous):
+        # A NaN delta (first bar, or a NaN close) counts as zero gain/loss, like pandas
+        delta = close - previous if previous is not None else NAN
+        return (delta if delta > 0 else 0.0), (-delta if delta < 0 else 0.0)
+
+    def push(self, close):
+        gain, loss = self._deltas(close, self.last_close)
+        self.gains.push(gain)
+        self.losses.push(loss)
+        self.prev_close, self.last_close = self.last_close, close
+
+    def replace(self, close):
+        gain, loss = self._deltas(close, self.prev_close)
+        self.gains.replace(gain)
+        self.losses.replace(loss)
+        self.last_close = close
+
+    @property
+    def value(self):
+        avg_gain = self.gains.mean()
+        avg_loss = self.losses.mean()
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            return NAN
+        if avg_loss == 0:
+            return NAN if avg_gain == 0 else 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def to_dict(self):
+        return {
+            'gains': self.gains.to_dict(),
+            'losses': self.losses.to_dict(),
+            'last_close': self.last_close,
+            'prev_close': self.prev_close
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = cls(data['gains']['window'])
+        obj.gains = RollingWindow.from_dict(data['gains'])
+        obj.losses = RollingWindow.from_dict(data['losses'])
+        obj.last_close = data['last_close']
+        obj.prev_close = data['prev_close']
+        return obj
+
+
+class IndicatorState:
+    """Running state for every indicator in calculate_technical_indicators.
+
+    `update()` appends one bar (or revises the latest one when the timestamp
+    repeats, as the store does for a partial session) in constant time, and
+    `latest()` returns the current indicator values. The state serializes to
+    a plain dict so it can be persisted and resumed after a restart.
+    """
+
+    def __init__(self):
+        self.sma_20 = RollingWindow(20)
+        self.sma_50 = RollingWindow(50)
+        self.sma_200 = RollingWindow(200)
+        self.volume_sma = RollingWindow(20)
+        self.ema_12 = RecursiveEMA(12)
+        self.ema_26 = RecursiveEMA(26)
+        self.signal = RecursiveEMA(9)
+        self.rsi = IncrementalRSI(14)
+        self.last_timestamp = None
+        self.close = NAN
+        self.volume = NAN
+        self.bars = 0
+
+    def _components(self):
+        return ('sma_20', 'sma_50', 'sma_200', 'volume_sma', 'ema_12', 'ema_26', 'signal', 'rsi')
+
+    def update(self, timestamp, close, volume):
+        """Apply one bar; a repeated timestamp replaces the latest bar"""
+        timestamp = pd.Timestamp(timestamp)
+        close = float(close)
+        volume = float(volume)
+
+        if self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError(f"Bar at {timestamp} is older than state at {self.last_timestamp}")
+        op = 'replace' if timestamp == self.last_timestamp else 'push'
+
+        for window in (self.sma_20, self.sma_50, self.sma_200):
+            getattr(window, op)(close)
+        getattr(self.volume_sma, op)(volume)
+        getattr(self.rsi, op)(close)
+        ema_12 = getattr(self.ema_12, op)(close)
+        ema_26 = getattr(self.ema_26, op)(close)
+        getattr(self.signal, op)(ema_12 - ema_26)
+
+        if op == 'push':
+            self.bars += 1
+        self.last_timestamp = timestamp
+        self.close = close
+        self.volume = volume
+
+    @property
+    def previous_close(self):
+        """Close of the bar before the latest one (None with fewer than two bars)"""
+        return self.rsi.prev_close
+
+    def update_from_frame(self, df):
+        """Apply every bar of a history frame in order"""
+        for timestamp, close, volume in zip(df.index, df['Close'].to_numpy(), df['Volume'].to_numpy()):
+            self.update(timestamp, close, volume)
+
+    def latest(self):
+        """Current values, keyed like the calculate_technical_indicators columns"""
+        sma_20 = self.sma_20.mean()
+        bb_std = self.sma_20.std()
+        macd = self.ema_12.value - self.ema_26.value
+        return {
+            'Close': self.close,
+            'Volume': self.volume,
+            'SMA_20': sma_20,
+            'SMA_50': self.sma_50.mean(),
+            'SMA_200': self.sma_200.mean(),
+            'EMA_12': self.ema_12.value,
+            'EMA_26': self.ema_26.value,
+            'RSI': self.rsi.value,
+            'MACD': macd,
+            'Signal_Line': self.signal.value,
+            'BB_middle': sma_20,
+            'BB_upper': sma_20 + bb_std * 2,
+            'BB_lower': sma_20 - bb_std * 2,
+            'Volume_SMA': self.volume_sma.mean()
+        }
+
+    def to_dict(self):
+        data = {name: getattr(self, name).to_dict() for name in self._components()}
+        data.update({
+            'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp is not None else None,
+            'timezone': str(self.last_timestamp.tz) if self.last_timestamp is not None and self.last_timestamp.tz else None,
+            'close': self.close,
+            'volume': self.volume,
+            'bars': self.bars
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = cls()
+        for name in ('sma_20', 'sma_50', 'sma_200', 'volume_sma'):
+            setattr(obj, name, RollingWindow.from_dict(data[name]))
+        for name in ('ema_12', 'ema_26', 'signal'):
+            setattr(obj, name, RecursiveEMA.from_dict(data[name]))
+        obj.rsi = IncrementalRSI.from_dict(data['rsi'])
+        if data['last_timestamp']:
+            obj.last_timestamp = pd.Timestamp(data['last_timestamp'])
+            if data.get('timezone'):
+                obj.last_timestamp = obj.last_timestamp.tz_convert(data['timezone'])
+        obj.close = data['close']
+        obj.volume = data['volume']
+        obj.bars = data['bars']
+        return obj
+
+    @classmethod
+    def from_history(cls, df):
+        state = cls()
+        state.update_from_frame(df)
+        return state
+
+
+class IndicatorStateStore:
+    """Per-ticker IndicatorState kept in step with an OHLCVStore.
+
+    States are saved as `indicators.json` next to each ticker's bars. On
+    `get()` only the bars newer than the saved state are applied (the last
+    saved bar is re-applied as a revision), so a warm ticker costs O(new
+    bars). The store trims its oldest bars as new sessions arrive, which
+    does not affect the state. If the stored bars no longer line up with it
+    (the state's last bar is gone, or the complete bar before it has a
+    different Close because the history was re-adjusted) the state is
+    rebuilt from the full history.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._states = {}
+        self._locks = {}  # ticker -> lock, so one slow rebuild only holds up its own ticker
+        self._locks_guard = threading.Lock()
+        self.stats = {'rebuilds': 0, 'incremental_updates': 0, 'bars_applied': 0, 'disk_loads': 0}
+
+    def _path(self, ticker):
+        return os.path.join(os.path.dirname(self.store._path(ticker)), 'indicators.json')
+
+    def _load(self, ticker):
+        path = self._path(ticker)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                state = IndicatorState.from_dict(json.load(f))
+            self.stats['disk_loads'] += 1
+            return state
+        except Exception as e:
+            print(f"Error reading indicator state for {ticker}: {e}")
+            return None
+
+    def _save(self, ticker, state):
+        path = self._path(ticker)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(state.to_dict(), f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error writing indicator state for {ticker}: {e}")
+
+    def _ticker_lock(self, ticker):
+        with self._locks_guard:
+            lock = self._locks.get(ticker)
+            if lock is None:
+                lock = self._locks[ticker] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _anchor_matches(bars, position, state):
+        """True if the stored bar before the state's last one still has the Close the state saw"""
+        if state.bars < 2:
+            return True
+        if position < 1:
+            return False
+        stored = float(bars['Close'].iloc[position - 1])
+        return abs(stored - state.previous_close) <= ADJUSTMENT_TOLERANCE * max(abs(state.previous_close), 1e-9)
+
+    def get(self, ticker):
+        """Return the ticker's state, caught up with the stored bars (None if no bars)"""
+        bars = self.store.load(ticker)
+        if bars is None or bars.empty:
+            return None
+
+        with self._ticker_lock(ticker):
+            state = self._states.get(ticker)
+            if state is None:
+                state = self._load(ticker)
+
+            position = -1
+            if state is not None and state.last_timestamp is not None:
+                position = bars.index.searchsorted(state.last_timestamp)
+                lined_up = (position < len(bars) and bars.index[position] == state.last_timestamp
+                            and self._anchor_matches(bars, position, state))
+                if not lined_up:
+                    state = None
+
+            if state is None:
+                state = IndicatorState.from_history(bars)
+                self.stats['rebuilds'] += 1
+                self.stats['bars_applied'] += len(bars)
+            else:
+                new_bars = bars.iloc[position:]
+                if len(new_bars) == 1 and new_bars['Close'].iloc[0] == state.close \
+                        and new_bars['Volume'].iloc[0] == state.volume:
+                    return state
+                state.update_from_frame(new_bars)
+                self.stats['incremental_updates'] += 1
+                self.stats['bars_applied'] += len(new_bars)
+
+            self._states[ticker] = state
+            self._save(ticker, state)
+            return state
+
+    def latest(self, ticker):
+        state = self.get(ticker)
+        return state.latest() if state is not None else None
@@ -0,0 +1,250 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from singleflight import SingleFlightCache
+from http_pool import inference_http
+import circuit_breaker
+from circuit_breaker import breaker_for
+
+# Model every StockScore helper classifies with
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment"
+# Financial sentiment model used by AnalysisEngine.get_financial_sentiment
+FINBERT_MODEL = "ProsusAI/finbert"
+
+# Hosted inference endpoint for batched requests ({base}/models/{model}). The
+# old api-inference.huggingface.co host was retired, so this is the router's
+# hf-inference provider, the same backend InferenceClient calls.
+DEFAULT_INFERENCE_URL = 'https://router.huggingface.co/hf-inference'
+INFERENCE_URL = os.environ.get('HF_INFERENCE_URL', DEFAULT_INFERENCE_URL).rstrip('/')
+
+# Classification results keyed by (model, text hash). The helpers send
+# deterministic template text, so identical analyses within the TTL reuse the
+# result; concurrent identical requests share one call through the single flight.
+classification_cache = SingleFlightCache(
+    ttl=float(os.environ.get('CLASSIFICATION_CACHE_TTL', 3600)),
+    maxsize=int(os.environ.get('CLASSIFICATION_CACHE_SIZE', 4096))
+)
+
+
+def normalize_text(text):
+    """Collapse whitespace so formatting differences share a cache entry"""
+    return " ".join(text.split())
+
+
+def cache_key(model, text):
+    return (model, hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest())
+
+
+def cached_classification(model, text, fetch):
+    """Return fetch() through the classification cache; empty results are not kept"""
+    return classification_cache.get_or_compute(cache_key(model, text), fetch, should_cache=bool)
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-text requests into batched calls.
+
+    Requests for the same (model, token) are collected for at most
+    `max_wait` seconds, or until `max_batch_size` are waiting, and sent as one
+    call to `send_batch(model, token, texts, timeout)`. Each caller gets its
+    own result (or the batch's exception) through a Future. A lone request
+    waits at most `max_wait`, so single-request latency barely changes while
+    bursts (a StockScore run plus its peers, concurrent handlers) share one
+    round trip.
+    """
+
+    def __init__(self, send_batch, max_batch_size=16, max_wait=0.005, max_concurrent_batches=4):
+        self.send_batch = send_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queues = {}  # (model, token) -> {'items': [(text, timeout, future)], 'deadline': t}
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_batches, thread_name_prefix='inference-batch')
+        self._thread = None
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='inference-batcher', daemon=True)
+            self._thread.start()
+
+    def submit(self, model, token, text, timeout):
+        future = Future()
+        with self._cond:
+            self._ensure_thread()
+            queue = self._queues.get((model, token))
+            if queue is None:
+                queue = {'items': [], 'deadline': time.monotonic() + self.max_wait}
+                self._queues[(model, token)] = queue
+            queue['items'].append((text, timeout, future))
+            self.requests += 1
+            self._cond.notify()
+        return future
+
+    def classify(self, text, model, token=None, timeout=30):
+        """Submit one text and wait for its share of the batched result"""
+        future = self.submit(model, token, text, timeout)
+        try:
+            return future.result(timeout=timeout + self.max_wait + 1)
+        except FutureTimeout:
+            raise Exception(f"Inference request timeout after {timeout}s")
+
+    def _take_ready(self):
+        """Pop batches that are full or past their deadline; caller holds the lock"""
+        now = time.monotonic()
+        batches = []
+        for key, queue in list(self._queues.items()):
+            items = queue['items']
+            if len(items) < self.max_batch_size and queue['deadline'] > now:
+                continue
+            batches.append((key, items[:self.max_batch_size]))
+            if len(items) > self.max_batch_size:
+                queue['items'] = items[self.max_batch_size:]
+                queue['deadline'] = now + self.max_wait
+            else:
+                del self._queues[key]
+        return batches
+
+    def _run(self):
+        while True:
+            with self._cond:
+                batches = self._take_ready()
+                while not batches:
+                    if self._queues:
+                        wait = min(q['deadline'] for q in self._queues.values()) - time.monotonic()
+                        self._cond.wait(max(wait, 0))
+                    else:
+                        self._cond.wait()
+                    batches = self._take_ready()
+
+            for key, items in batches:
+                self.batches += 1
+                self.largest_batch = max(self.largest_batch, len(items))
+                self._executor.submit(self._flush, key, items)
+
+    def _flush(self, key, items):
+        model, token = key
+        try:
+            texts = [text for text, _, _ in items]
+            results = self.send_batch(model, token, texts, max(timeout for _, timeout, _ in items))
+            if len(results) != len(items):
+                raise Exception(f"Batch returned {len(results)} results for {len(items)} inputs")
+            for (_, _, future), result in zip(items, results):
+                future.set_result(result)
+        except Exception as e:
+            for _, _, future in items:
+                future.set_exception(e)
+
+    def stats(self):
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': round(self.max_wait * 1000, 1),
+            'requests': self.requests,
+            'batches': self.batches,
+            'avg_batch_size': round(self.requests / self.batches, 2) if self.batches else 0.0,
+            'largest_batch': self.largest_batch
+        }
+
+
+def post_batch(model, token, texts, timeout):
+    """One text-classification call for many inputs; returns one label list per input"""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = inference_http.post(f"{INFERENCE_URL}/models/{model}", headers=headers,
+                                   json={"inputs": texts}, timeout=timeout)
+    if response.status_code != 200:
+        # Keep the status and body (e.g. "503 ... is currently loading") so callers' fallbacks apply
+        raise Exception(f"Inference API error {response.status_code}: {response.text[:200]}")
+
+    result = response.json()
+    # A single input can come back un-nested
+    if len(texts) == 1 and result and isinstance(result[0], dict):
+        result = [result]
+    return result
+
+
+batcher = MicroBatcher(
+    post_batch,
+    max_batch_size=int(os.environ.get('INFERENCE_BATCH_SIZE', 16)),
+    max_wait=float(os.environ.get('INFERENCE_BATCH_WAIT_MS', 5)) / 1000
+)
+
+
+class HostedSentimentBackend:
+    """Classification through the hosted inference API (needs an API key)"""
+
+    name = 'hosted'
+    requires_api_key = True
+
+    def __init__(self):
+        # One client per (token, timeout), reused across calls and threads
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def client(self, token, timeout):
+        key = (token, timeout)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    # huggingface_hub is slow to import; only load it once a client is needed
+                    from huggingface_hub import InferenceClient
+                    client = InferenceClient(token=token, timeout=timeout)
+                    self._clients[key] = client
+        return client
+
+    def classify(self, text, model=SENTIMENT_MODEL, token=None, timeout=30):
+        def call():
+            if batcher.max_batch_size > 1:
+                return batcher.classify(text, model, token=token, timeout=timeout)
+            return self.client(token, timeout).text_classification(text, model=model)
+
+        # While the model is cold or failing, fail fast instead of holding a worker for `timeout`
+        return breaker_for(model).call(call)
+
+
+def backend_from_env():
+    """Pick the sentiment backend from SENTIMENT_BACKEND (hosted or lexicon)"""
+    choice = os.environ.get('SENTIMENT_BACKEND', 'hosted').lower()
+    if choice == 'lexicon':
+        from sentiment_lexicon import LexiconSentimentBackend
+        return LexiconSentimentBackend()
+    if choice != 'hosted':
+        print(f"Unknown SENTIMENT_BACKEND '{choice}', using hosted inference")
+    return HostedSentimentBackend()
+
+
+sentiment_backend = backend_from_env()
+
+
+def is_local_backend():
+    return not sentiment_backend.requires_api_key
+
+
+def backend_available(api_key):
+    """True if classifications can run: local backends need no API key"""
+    return bool(api_key) or is_local_backend()
+
+
+def classify(text, model=SENTIMENT_MODEL, token=None, timeout=30):
+    """Text classification through the configured backend, served from cache when remote"""
+    if is_local_backend():
+        # Local scoring costs less than the cache's hashing and locking
+        return sentiment_backend.classify(text, model, token=token, timeout=timeout)
+
+    return cached_classification(
+        model, text, lambda: sentiment_backend.classify(text, model, token=token, timeout=timeout))
+
+
+def stats():
+    return {
+        'backend': sentiment_backend.name,
+        'classification_cache': classification_cache.stats(),
+        'batcher': batcher.stats(),
+        'http_pool': inference_http.stats(),
+        'circuit_breakers': circuit_breaker.stats()
+    }
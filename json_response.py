@@ -0,0 +1,165 @@
+import gzip
+import json
+import os
+import sys
+import time
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Responses smaller than this are sent as-is; compressing them costs more than it saves
+COMPRESS_MIN_BYTES = int(os.environ.get('COMPRESS_MIN_BYTES', 1024))
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', 5))
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/javascript', 'text/html', 'text/css', 'text/plain'
+}
+
+
+def _default(obj):
+    """Types orjson does not serialize natively"""
+    # pandas/numpy values can only exist if those modules were imported, so
+    # look them up instead of importing them on every cold start
+    pd = sys.modules.get('pandas')
+    if pd is not None:
+        if obj is pd.NaT:
+            return None
+        if isinstance(obj, pd.Timestamp):
+            return obj.isoformat()
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return DefaultJSONProvider.default(obj)
+
+
+def to_json_bytes(obj, sort_keys=False):
+    """Compact UTF-8 JSON for obj, with numpy/pandas support"""
+    if not ORJSON_AVAILABLE:
+        return json.dumps(obj, default=_default, sort_keys=sort_keys, separators=(',', ':')).encode('utf-8')
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        options |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=_default, option=options)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Serializes numpy arrays and scalars and pandas timestamps directly, and
+    writes NaN/inf as null (the stdlib encoder emits bare NaN, which browsers
+    reject). Falls back to the stdlib provider when orjson is not installed
+    or when pretty-printing is requested.
+    """
+
+    def dumps_bytes(self, obj):
+        if not ORJSON_AVAILABLE:
+            return super().dumps(obj).encode('utf-8')
+        return to_json_bytes(obj, sort_keys=self.sort_keys)
+
+    def dumps(self, obj, **kwargs):
+        if not ORJSON_AVAILABLE or kwargs.get('indent') is not None:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if not ORJSON_AVAILABLE or self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
+
+
+def negotiate_encoding(accept_encodings):
+    """Pick 'br' or 'gzip' from a parsed Accept-Encoding header, or None"""
+    candidates = (['br'] if BROTLI_AVAILABLE else []) + ['gzip']
+    best = None
+    best_quality = 0
+    for encoding in candidates:
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class ResponseCompressor:
+    """after_request hook compressing large buffered responses.
+
+    Streamed responses (NDJSON, server-sent events) and files sent with
+    direct passthrough are left alone, as are responses below
+    `min_bytes`. Brotli is preferred when the client accepts it and the
+    module is installed, gzip otherwise.
+    """
+
+    def __init__(self, min_bytes=COMPRESS_MIN_BYTES):
+        self.min_bytes = min_bytes
+        self.responses = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+
+    def __call__(self, response):
+        if (response.status_code < 200 or response.status_code >= 300
+                or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        if len(data) < self.min_bytes:
+            return response
+
+        encoding = negotiate_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        start = time.perf_counter()
+        compressed = compress(data, encoding)
+        self.seconds += time.perf_counter() - start
+        self.responses += 1
+        self.bytes_in += len(data)
+        self.bytes_out += len(compressed)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag is not None:
+            # A different byte representation needs a different strong ETag
+            response.set_etag(f"{etag}-{encoding}", weak)
+        return response
+
+    def stats(self):
+        return {
+            'orjson': ORJSON_AVAILABLE,
+            'brotli': BROTLI_AVAILABLE,
+            'min_bytes': self.min_bytes,
+            'compressed_responses': self.responses,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'ratio': round(self.bytes_out / self.bytes_in, 3) if self.bytes_in else None,
+            'compress_ms': round(self.seconds * 1000, 1)
+        }
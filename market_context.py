@@ -0,0 +1,167 @@
+import os
+import time
+from singleflight import SingleFlight
+
+SECTOR_ETFS = {
+    'Technology': 'XLK',
+    'Healthcare': 'XLV',
+    'Financials': 'XLF',
+    'Energy': 'XLE',
+    'Consumer Discretionary': 'XLY',
+    'Consumer Staples': 'XLP',
+    'Industrials': 'XLI',
+    'Materials': 'XLB',
+    'Real Estate': 'XLRE',
+    'Utilities': 'XLU',
+    'Communication Services': 'XLC'
+}
+
+# Everything the market context needs, fetched together in one batched refresh
+MARKET_TICKERS = ['SPY', '^TNX'] + list(SECTOR_ETFS.values())
+
+
+class MarketContext:
+    """Market-wide inputs shared by every per-ticker analysis.
+
+    SPY, the 10-year yield and the sector ETFs are identical for every
+    ticker, so they are refreshed together once per `ttl` and per-ticker
+    analysis reads them from memory.
+    """
+
+    def __init__(self, store, ttl=None, clock=time.time):
+        self.store = store
+        self.ttl = ttl if ttl is not None else float(os.environ.get('MARKET_CONTEXT_TTL', 900))
+        self.clock = clock
+        self._state = None
+        self._expires_at = 0
+        self._flight = SingleFlight()
+        self.refreshes = 0
+
+    def _compute_market_sentiment(self):
+        try:
+            spy_hist = self.store.get_history("SPY", period="1mo", refresh=False)
+
+            if spy_hist is None or spy_hist.empty:
+                raise Exception("No SPY data")
+
+            # Calculate market trend
+            current = spy_hist['Close'].iloc[-1]
+            month_ago = spy_hist['Close'].iloc[0]
+            change = ((current - month_ago) / month_ago) * 100
+
+            if change > 3:
+                sentiment = "Bullish"
+            elif change < -3:
+                sentiment = "Bearish"
+            else:
+                sentiment = "Neutral"
+
+            return {
+                'sentiment': sentiment,
+                'spy_change': round(change, 2),
+                'description': f"Market has moved {change:.2f}% in the last month"
+            }
+        except Exception as e:
+            print(f"Error getting market sentiment: {e}")
+            return {
+                'sentiment': 'Neutral',
+                'spy_change': 0,
+                'description': 'Market data unavailable'
+            }
+
+    def _compute_interest_rate(self):
+        try:
+            # 10-year treasury yield as proxy
+            tnx_hist = self.store.get_history("^TNX", period="3mo", refresh=False)
+
+            if tnx_hist is None or tnx_hist.empty:
+                raise Exception("No TNX data")
+
+            current_yield = tnx_hist['Close'].iloc[-1]
+            three_months_ago = tnx_hist['Close'].iloc[0]
+            change = current_yield - three_months_ago
+
+            if current_yield > 4.5:
+                impact = "Negative for growth stocks, positive for financials"
+            elif current_yield < 3.5:
+                impact = "Positive for growth stocks, lower bank margins"
+            else:
+                impact = "Neutral environment for equities"
+
+            return {
+                'current_yield': round(current_yield, 2),
+                'change_3m': round(change, 2),
+                'impact': impact,
+                'description': f"10-year yield at {current_yield:.2f}%, {change:+.2f}% change in 3 months"
+            }
+        except Exception as e:
+            print(f"Error analyzing interest rates: {e}")
+            return {
+                'current_yield': 4.0,
+                'change_3m': 0,
+                'impact': 'Data unavailable',
+                'description': 'Interest rate data unavailable'
+            }
+
+    def _compute_etf_changes(self):
+        """3-month percentage change for SPY and every sector ETF"""
+        changes = {}
+        for etf in ['SPY'] + list(SECTOR_ETFS.values()):
+            hist = self.store.get_history(etf, period='3mo', refresh=False)
+            if hist is None or hist.empty:
+                continue
+            current = hist['Close'].iloc[-1]
+            three_months_ago = hist['Close'].iloc[0]
+            changes[etf] = ((current - three_months_ago) / three_months_ago) * 100
+        return changes
+
+    def _refresh(self):
+        self.store.refresh(MARKET_TICKERS)
+        self._state = {
+            'market_sentiment': self._compute_market_sentiment(),
+            'interest_rate': self._compute_interest_rate(),
+            'etf_changes': self._compute_etf_changes()
+        }
+        self._expires_at = self.clock() + self.ttl
+        self.refreshes += 1
+        return self._state
+
+    def current(self):
+        """Return the latest market state, refreshing it once per ttl"""
+        state = self._state
+        if state is None or self.clock() >= self._expires_at:
+            state = self._flight.do('market-context', self._refresh)
+        return state
+
+    def market_sentiment(self):
+        return dict(self.current()['market_sentiment'])
+
+    def interest_rate(self):
+        return dict(self.current()['interest_rate'])
+
+    def sector_performance(self, sector):
+        etf = SECTOR_ETFS.get(sector, 'SPY')
+        change = self.current()['etf_changes'].get(etf)
+
+        if change is None:
+            print(f"Error analyzing sector {sector}: No data for {etf}")
+            return {
+                'sector': sector,
+                'performance': 0,
+                'trend': 'Unknown',
+                'description': 'Sector data unavailable'
+            }
+
+        return {
+            'sector': sector,
+            'performance': round(change, 2),
+            'trend': 'Outperforming' if change > 5 else 'Underperforming' if change < -5 else 'In-line',
+            'description': f"{sector} sector has moved {change:.2f}% in the last 3 months"
+        }
+
+    def stats(self):
+        return {
+            'ttl_seconds': self.ttl,
+            'refreshes': self.refreshes,
+            'expires_in_seconds': round(max(self._expires_at - self.clock(), 0), 1) if self._state else None
+        }
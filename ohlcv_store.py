@@ -0,0 +1,308 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+import yfinance as yf
+import pandas as pd
+from rate_limiter import yahoo_limiter
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# How far back each yfinance-style period reaches when slicing stored bars
+PERIOD_OFFSETS = {
+    '5d': pd.DateOffset(days=5),
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+}
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Relative Close difference on a re-fetched, already stored session that means
+# Yahoo re-adjusted the history (split or dividend) since it was stored
+ADJUSTMENT_TOLERANCE = 1e-4
+
+
+def default_store_dir():
+    """Pick a writable store location (serverless platforms only allow /tmp)"""
+    configured = os.environ.get('OHLCV_STORE_DIR')
+    if configured:
+        return configured
+    if os.environ.get('VERCEL'):
+        return '/tmp/ohlcv'
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'ohlcv')
+
+
+def split_bulk_frame(data, tickers):
+    """Split a multi-symbol download into per-ticker frames"""
+    frames = {}
+    if isinstance(data.columns, pd.MultiIndex):
+        available = set(data.columns.get_level_values(0))
+        for ticker in tickers:
+            if ticker not in available:
+                continue
+            df = data[ticker].dropna(how='all')
+            if not df.empty:
+                frames[ticker] = df.copy()
+    elif len(tickers) == 1:
+        df = data.dropna(how='all')
+        if not df.empty:
+            frames[tickers[0]] = df.copy()
+    return frames
+
+
+class OHLCVStore:
+    """Local columnar store of daily bars, partitioned by ticker.
+
+    The first refresh of a ticker downloads `history_period` of bars; later
+    refreshes only request bars from the last complete stored session onwards
+    and upsert them, so a warm store fetches one or two rows per ticker
+    instead of a full year. Bars are split/dividend adjusted, so when the
+    re-fetched complete session no longer matches the stored one the whole
+    history is fetched again. Stored bars are trimmed to `history_period`.
+    """
+
+    def __init__(self, root=None, history_period='1y', max_age=None, batch_size=25, max_frames=None):
+        self.root = root or default_store_dir()
+        self.history_period = history_period
+        # Seconds before a ticker's bars are considered stale
+        self.max_age = max_age if max_age is not None else float(os.environ.get('OHLCV_MAX_AGE', 900))
+        # Tickers per multi-symbol download request
+        self.batch_size = batch_size
+        self.extension = 'parquet' if PARQUET_AVAILABLE else 'pkl'
+
+        # Tickers whose bars stay in memory; least recently used frames are re-read from disk
+        self.max_frames = max_frames or int(os.environ.get('OHLCV_MEMORY_TICKERS', 1000))
+
+        self._frames = OrderedDict()  # ticker -> DataFrame, least recently used first
+        self._refreshed = {}   # ticker -> epoch seconds of last successful refresh
+        self._lock = threading.Lock()
+        self.stats = {
+            'full_fetches': 0,
+            'incremental_fetches': 0,
+            'rows_fetched': 0,
+            'disk_loads': 0,
+            'readjusted_fetches': 0,
+            'evictions': 0
+        }
+
+    def _path(self, ticker):
+        safe = ticker.replace('^', '_').replace('/', '_')
+        return os.path.join(self.root, f"ticker={safe}", f"bars.{self.extension}")
+
+    def _read(self, path):
+        if self.extension == 'parquet':
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+
+    def _write(self, ticker, df):
+        path = self._path(ticker)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if self.extension == 'parquet':
+            df.to_parquet(tmp_path)
+        else:
+            df.to_pickle(tmp_path)
+        # Atomic swap so concurrent workers never read a half-written file
+        os.replace(tmp_path, path)
+
+    def _remember(self, ticker, df):
+        """Keep a frame in memory, evicting the least recently used; call with the lock held"""
+        self._frames[ticker] = df
+        self._frames.move_to_end(ticker)
+        while len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def load(self, ticker):
+        """Return the stored bars for a ticker, or None if nothing is stored"""
+        with self._lock:
+            if ticker in self._frames:
+                self._frames.move_to_end(ticker)
+                return self._frames[ticker]
+
+            path = self._path(ticker)
+            if not os.path.exists(path):
+                return None
+            try:
+                df = self._read(path)
+            except Exception as e:
+                print(f"Error reading stored bars for {ticker}: {e}")
+                return None
+
+            self._remember(ticker, df)
+            self._refreshed[ticker] = os.path.getmtime(path)
+            self.stats['disk_loads'] += 1
+            return df
+
+    def last_timestamp(self, ticker):
+        df = self.load(ticker)
+        if df is None or df.empty:
+            return None
+        return df.index[-1]
+
+    def is_stale(self, ticker):
+        if self.load(ticker) is None:
+            return True
+        refreshed = self._refreshed.get(ticker, 0)
+        return time.time() - refreshed > self.max_age
+
+    def _download(self, tickers, max_retries=3, **kwargs):
+        """Download bars for many tickers in batched multi-symbol requests"""
+        frames = {}
+        for start in range(0, len(tickers), self.batch_size):
+            batch = list(tickers[start:start + self.batch_size])
+
+            data = None
+            for attempt in range(max_retries):
+                try:
+                    # yfinance issues one request per symbol, so charge the whole batch
+                    yahoo_limiter.acquire(len(batch))
+                    data = yf.download(
+                        batch,
+                        group_by='ticker',
+                        auto_adjust=True,  # Match Ticker.history defaults
+                        ignore_tz=False,   # Keep exchange timestamps for price labels
+                        threads=True,
+                        progress=False,
+                        **kwargs
+                    )
+                    if data is None or data.empty:
+                        raise Exception("Empty bulk response")
+                    break
+                except Exception as e:
+                    print(f"Error bulk fetching {len(batch)} tickers (attempt {attempt + 1}/{max_retries}): {e}")
+                    data = None
+                    if attempt < max_retries - 1:
+                        yahoo_limiter.backoff(2)  # Slow every caller down before retrying
+
+            if data is None:
+                continue
+
+            for ticker, df in split_bulk_frame(data, batch).items():
+                frames[ticker] = df[[c for c in OHLCV_COLUMNS if c in df.columns]]
+        return frames
+
+    def _trim(self, df):
+        """Drop bars older than history_period"""
+        offset = PERIOD_OFFSETS.get(self.history_period)
+        if offset is None or df.empty:
+            return df
+        return df[df.index >= pd.Timestamp.now(tz=df.index.tz) - offset]
+
+    def _readjusted(self, ticker, new_bars, anchor):
+        """True if the re-fetched `anchor` session no longer matches the stored one"""
+        stored = self.load(ticker)
+        if stored is None or anchor not in stored.index or anchor not in new_bars.index:
+            return False
+        old_close = float(stored.at[anchor, 'Close'])
+        new_close = float(new_bars.at[anchor, 'Close'])
+        return abs(new_close - old_close) > ADJUSTMENT_TOLERANCE * max(abs(old_close), 1e-9)
+
+    def _merge(self, ticker, new_bars, replace=False):
+        """Upsert freshly fetched bars (the last stored bar may be a partial session).
+
+        `replace` discards the stored history, e.g. after a re-adjustment.
+        """
+        with self._lock:
+            old = None if replace else self._frames.get(ticker)
+            if old is None and not replace and os.path.exists(self._path(ticker)):
+                # Evicted since refresh() checked it; merge with the stored bars, not just the new ones
+                try:
+                    old = self._read(self._path(ticker))
+                except Exception as e:
+                    print(f"Error reading stored bars for {ticker}: {e}")
+            if old is not None and not old.empty:
+                combined = pd.concat([old, new_bars])
+                combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+            else:
+                combined = new_bars.sort_index()
+            combined = self._trim(combined)
+
+            try:
+                self._write(ticker, combined)
+            except Exception as e:
+                print(f"Error writing stored bars for {ticker}: {e}")
+
+            self._remember(ticker, combined)
+            self._refreshed[ticker] = time.time()
+            self.stats['rows_fetched'] += len(new_bars)
+
+    def refresh(self, tickers, max_retries=3):
+        """Bring stale tickers up to date, fetching only missing bars"""
+        stale = [t for t in tickers if self.is_stale(t)]
+        if not stale:
+            return
+
+        new_tickers = []
+        by_start = {}
+        anchors = {}
+        for ticker in stale:
+            stored = self.load(ticker)
+            if stored is None or len(stored) < 2:
+                new_tickers.append(ticker)
+            else:
+                # Re-request the last complete session as well as the possibly
+                # partial last one: it is replaced, and it anchors the adjustment check
+                anchors[ticker] = stored.index[-2]
+                by_start.setdefault(anchors[ticker].strftime('%Y-%m-%d'), []).append(ticker)
+
+        readjusted = []
+        for start, group in by_start.items():
+            fetched = self._download(group, max_retries=max_retries, start=start)
+            self.stats['incremental_fetches'] += len(fetched)
+            for ticker, df in fetched.items():
+                if self._readjusted(ticker, df, anchors[ticker]):
+                    readjusted.append(ticker)
+                else:
+                    self._merge(ticker, df)
+
+        if readjusted:
+            print(f"Re-fetching full history for {len(readjusted)} re-adjusted tickers")
+            fetched = self._download(readjusted, max_retries=max_retries, period=self.history_period)
+            self.stats['readjusted_fetches'] += len(fetched)
+            for ticker, df in fetched.items():
+                self._merge(ticker, df, replace=True)
+
+        if new_tickers:
+            fetched = self._download(new_tickers, max_retries=max_retries, period=self.history_period)
+            self.stats['full_fetches'] += len(fetched)
+            for ticker, df in fetched.items():
+                self._merge(ticker, df, replace=True)
+
+    def latest_quote(self, ticker, average_sessions=63):
+        """Price and volume of the latest stored bar, or None if nothing is stored.
+
+        `average_volume` covers the trailing `average_sessions` bars (about
+        three months, like Yahoo's averageVolume).
+        """
+        df = self.load(ticker)
+        if df is None or df.empty:
+            return None
+        return {
+            'price': float(df['Close'].iloc[-1]),
+            'volume': float(df['Volume'].iloc[-1]),
+            'average_volume': float(df['Volume'].iloc[-average_sessions:].mean()),
+            'timestamp': df.index[-1]
+        }
+
+    def get_history(self, ticker, period='1y', refresh=True):
+        """Return stored bars covering `period`, refreshing the ticker if stale"""
+        if refresh and self.is_stale(ticker):
+            self.refresh([ticker])
+
+        df = self.load(ticker)
+        if df is None or df.empty:
+            return None
+
+        offset = PERIOD_OFFSETS.get(period)
+        if offset is None:
+            return df.copy()
+        cutoff = pd.Timestamp.now(tz=df.index.tz) - offset
+        return df[df.index >= cutoff].copy()
@@ -0,0 +1,145 @@
+from concurrent.futures import ThreadPoolExecutor
+
+# Industry peer groups by specific industry (more granular than sector),
+# followed by broad sector fallbacks
+INDUSTRY_GROUPS = {
+    # Technology sub-industries
+    'Semiconductors': ['NVDA', 'AMD', 'INTC', 'QCOM', 'AVGO', 'TXN', 'MU', 'AMAT'],
+    'Software': ['MSFT', 'ORCL', 'CRM', 'ADBE', 'INTU', 'NOW', 'WDAY', 'TEAM'],
+    'Consumer Electronics': ['AAPL', 'SONY', 'DELL', 'HPQ'],
+    'Internet': ['GOOGL', 'GOOG', 'META', 'AMZN', 'NFLX', 'SNAP', 'PINS', 'UBER'],
+
+    # Automotive
+    'Auto Manufacturers': ['TSLA', 'F', 'GM', 'TM', 'HMC', 'RIVN', 'LCID'],
+
+    # Healthcare sub-industries
+    'Drug Manufacturers': ['PFE', 'JNJ', 'ABBV', 'MRK', 'LLY', 'BMY', 'GILD', 'AMGN'],
+    'Health Insurance': ['UNH', 'CVS', 'CI', 'HUM', 'ANTM', 'CNC'],
+    'Medical Devices': ['TMO', 'ABT', 'DHR', 'MDT', 'SYK', 'BSX', 'EW'],
+
+    # Retail
+    'E-commerce': ['AMZN', 'SHOP', 'EBAY', 'ETSY', 'W'],
+    'Home Improvement': ['HD', 'LOW'],
+    'Restaurants': ['MCD', 'SBUX', 'YUM', 'QSR', 'CMG', 'DPZ'],
+    'Apparel': ['NKE', 'LULU', 'UAA', 'VFC'],
+    'Discount Stores': ['WMT', 'TGT', 'COST', 'DG', 'DLTR'],
+
+    # Financial Services
+    'Banks': ['JPM', 'BAC', 'WFC', 'C', 'USB', 'PNC', 'TFC'],
+    'Investment Banks': ['GS', 'MS', 'SCHW', 'BLK', 'BX', 'KKR'],
+
+    # Communication Services
+    'Telecom': ['T', 'VZ', 'TMUS', 'CHTR'],
+    'Media': ['DIS', 'NFLX', 'CMCSA', 'PARA', 'WBD'],
+
+    # Energy
+    'Oil & Gas': ['XOM', 'CVX', 'COP', 'SLB', 'EOG', 'MPC', 'PSX', 'OXY'],
+
+    # Industrials
+    'Aerospace': ['BA', 'LMT', 'RTX', 'GD', 'NOC'],
+    'Industrial Conglomerates': ['HON', 'GE', 'MMM', 'CAT', 'DE'],
+    'Logistics': ['UPS', 'FDX', 'XPO'],
+
+    # Consumer Defensive
+    'Beverages': ['KO', 'PEP', 'MNST', 'STZ'],
+    'Household Products': ['PG', 'CL', 'KMB', 'CLX'],
+    'Tobacco': ['PM', 'MO', 'BTI'],
+
+    # Broad sector fallbacks (if specific industry not found)
+    'Technology': ['AAPL', 'MSFT', 'GOOGL', 'META', 'NVDA', 'AMD', 'INTC', 'ORCL', 'CRM', 'ADBE'],
+    'Healthcare': ['UNH', 'JNJ', 'PFE', 'ABBV', 'MRK', 'TMO', 'LLY', 'ABT', 'DHR', 'CVS'],
+    'Financial Services': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'BLK', 'SCHW'],
+    'Consumer Cyclical': ['AMZN', 'HD', 'MCD', 'NKE', 'SBUX', 'TGT', 'LOW'],
+    'Consumer Defensive': ['WMT', 'PG', 'KO', 'PEP', 'COST'],
+    'Communication Services': ['GOOGL', 'META', 'DIS', 'NFLX', 'T', 'VZ'],
+    'Energy': ['XOM', 'CVX', 'COP', 'SLB', 'EOG'],
+    'Industrials': ['UPS', 'HON', 'BA', 'CAT', 'GE'],
+    'Basic Materials': ['LIN', 'APD', 'ECL', 'DD', 'NEM'],
+    'Real Estate': ['AMT', 'PLD', 'CCI', 'EQIX', 'PSA'],
+    'Utilities': ['NEE', 'DUK', 'SO', 'D', 'AEP']
+}
+
+
+
+def same_company(ticker, other):
+    """True for the ticker itself and its other share class (GOOGL/GOOG)"""
+    return other == ticker or other == ticker.replace('GOOGL', 'GOOG') or other == ticker.replace('GOOG', 'GOOGL')
+
+
+class PeerIndex:
+    """Prebuilt industry/sector -> peer group lookup.
+
+    Group names are lowercased once, and each (industry, sector) pair is
+    resolved once and memoized, so repeated lookups are a single dict hit
+    instead of a substring scan over every group.
+    """
+
+    def __init__(self, groups=None):
+        self.groups = groups or INDUSTRY_GROUPS
+        self._lowered = [(name.lower(), stocks) for name, stocks in self.groups.items()]
+        self._resolved = {}
+
+    def group_for(self, industry, sector):
+        key = (industry, sector)
+        group = self._resolved.get(key)
+        if group is None:
+            group = []
+            # Check if industry contains key terms that match our groups, then fall back to sector
+            needle = industry.lower()
+            for name, stocks in self._lowered:
+                if name in needle or needle in name:
+                    group = stocks
+                    break
+            if not group:
+                group = self.groups.get(sector, [])
+            group = tuple(group)
+            self._resolved[key] = group
+        return group
+
+    def peers_for(self, ticker, industry, sector):
+        return [p for p in self.group_for(industry, sector) if not same_company(ticker, p)]
+
+    def all_tickers(self):
+        """Every ticker that appears in any group, in first-seen order"""
+        return list(dict.fromkeys(t for stocks in self.groups.values() for t in stocks))
+
+
+class PeerScoreboard:
+    """Per-ticker peer snapshots (price changes and sentiment) for every grouped stock.
+
+    `build()` runs the peer analysis for every ticker in the index; it is
+    meant to run from a SnapshotScheduler so requests only do in-memory
+    lookups. `prefetch_fn(tickers)` can warm shared data (e.g. one batched
+    bar download) before the per-ticker work.
+    """
+
+    def __init__(self, analyze_fn, index=None, prefetch_fn=None, max_workers=8):
+        self.analyze_fn = analyze_fn
+        self.index = index or PeerIndex()
+        self.prefetch_fn = prefetch_fn
+        self.max_workers = max_workers
+
+    def build(self):
+        tickers = self.index.all_tickers()
+        if self.prefetch_fn:
+            try:
+                self.prefetch_fn(tickers)
+            except Exception as e:
+                print(f"Peer scoreboard prefetch failed: {e}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='peer-scoreboard') as executor:
+            entries = executor.map(self.analyze_fn, tickers)
+            board = {ticker: entry for ticker, entry in zip(tickers, entries) if entry}
+
+        print(f"Peer scoreboard built for {len(board)}/{len(tickers)} tickers")
+        return board
+
+    @staticmethod
+    def lookup(board, peers):
+        """Entries for the given peers that are on the board, in peer order"""
+        return [board[p] for p in peers if p in board]
+
+    @staticmethod
+    def missing(board, peers):
+        """Peers with no entry on the board (new to the index or failed in the last build)"""
+        return [p for p in peers if p not in board]
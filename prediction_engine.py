@@ -1,73 +1,70 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import warnings
-import time
+from ohlcv_store import OHLCVStore
+from fundamentals import FundamentalsCache
+from indicator_panel import IndicatorPanel
+from indicator_state import IndicatorStateStore
+from scoring import score_universe, latest_rows, stack_rows, fundamentals_table
+from rankings import TopRankings
+import universe
 warnings.filterwarnings('ignore')
 
 class StockPredictionEngine:
-    def __init__(self):
-        # Popular stocks to analyze (mix of sectors)
-        self.stock_universe = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B',
-            'JPM', 'JNJ', 'V', 'WMT', 'PG', 'MA', 'UNH', 'HD', 'DIS', 'BAC',
-            'ADBE', 'CRM', 'NFLX', 'CSCO', 'PEP', 'KO', 'INTC', 'AMD', 'NKE',
-            'PYPL', 'CMCSA', 'XOM', 'CVX', 'LLY', 'PFE', 'ABBV', 'TMO', 'COST',
-            'MRK', 'AVGO', 'ORCL', 'ACN', 'TXN', 'DHR', 'NEE', 'VZ', 'PM',
-            'UNP', 'RTX', 'BMY', 'HON', 'QCOM', 'LOW', 'IBM', 'SBUX', 'AMT'
-        ]
+    def __init__(self, store=None, fundamentals=None, stock_universe=None):
+        # Local daily-bar store shared by every history lookup
+        self.store = store or OHLCVStore()
+        # Ticker.info is slow and changes daily, so keep compact records with a TTL
+        self.fundamentals = fundamentals or FundamentalsCache()
+        # Per-ticker indicator state kept in step with the store, O(new bars) per lookup
+        self.indicator_states = IndicatorStateStore(self.store)
+
+        # Tickers to rank: a preset name or ticker file (see universe.py), default STOCK_UNIVERSE
+        self.stock_universe = universe.load(stock_universe)
 
     def get_stock_data(self, ticker, period='1y', max_retries=3):
-        """Fetch stock data using yfinance with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                # Don't pass session - yfinance 0.2.66+ uses curl_cffi internally
-                stock = yf.Ticker(ticker)
-
-                # Add small delay between requests to avoid rate limiting
-                time.sleep(0.5)
-
-                hist = stock.history(period=period)
-
-                # Check if we got valid data
-                if hist is None or hist.empty:
-                    print(f"No historical data for {ticker}, attempt {attempt + 1}/{max_retries}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2)  # Wait before retry
-                        continue
-                    return None, None
-
-                # Get info with error handling
-                try:
-                    info = stock.info
-                    if not info or len(info) < 5:  # Minimal valid info should have more than 5 keys
-                        print(f"Limited info for {ticker}, using defaults")
-                        info = {
-                            'longName': ticker,
-                            'sector': 'N/A',
-                            'industry': 'N/A'
-                        }
-                except Exception as e:
-                    print(f"Error getting info for {ticker}: {e}")
-                    info = {
-                        'longName': ticker,
-                        'sector': 'N/A',
-                        'industry': 'N/A'
-                    }
-
-                return hist, info
+        """Fetch stock data from the local bar store, downloading only new bars"""
+        try:
+            # The store retries its own downloads and serves cached bars when fresh
+            self.store.refresh([ticker], max_retries=max_retries)
+            hist = self.store.get_history(ticker, period=period, refresh=False)
 
-            except Exception as e:
-                print(f"Error fetching {ticker} (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2)  # Wait before retry
-                else:
-                    return None, None
+            # Check if we got valid data
+            if hist is None or hist.empty:
+                print(f"No historical data for {ticker}")
+                return None, None
+
+            info = self.get_stock_info(ticker)
+
+            return hist, info
+
+        except Exception as e:
+            print(f"Error fetching {ticker}: {e}")
+            return None, None
+
+    def get_stock_info(self, ticker):
+        """Get compact company fundamentals from the TTL cache"""
+        return self.fundamentals.get(ticker)
+
+    def get_bulk_stock_data(self, tickers, period='1y', max_retries=3):
+        """Fetch daily bars for many tickers through the store's batched downloads.
+
+        Returns a dict of ticker -> history DataFrame. Tickers the store could
+        not fill are left out so callers can fall back to get_stock_data.
+        """
+        self.store.refresh(tickers, max_retries=max_retries)
 
-        return None, None
+        histories = {}
+        for ticker in tickers:
+            hist = self.store.get_history(ticker, period=period, refresh=False)
+            if hist is not None and not hist.empty:
+                histories[ticker] = hist
+
+        print(f"Bulk download returned data for {len(histories)}/{len(tickers)} tickers")
+        return histories
 
     def calculate_technical_indicators(self, df):
         """Calculate various technical indicators"""
@@ -110,138 +107,26 @@ class StockPredictionEngine:
         if df is None or len(df) < 50:
             return 0, "Insufficient data", {'baseline': 0, 'technical': 0, 'fundamental': 0, 'total': 0, 'components': []}
 
-        baseline_score = 50  # Start neutral
-        technical_points = 0
-        fundamental_points = 0
-        reasons = []
-        components = []  # Detailed component breakdown
-
-        latest = df.iloc[-1]
-
-        # Technical Analysis (30 points)
-        # Trend following
-        sma_50_points = 0
-        if latest['Close'] > latest['SMA_50']:
-            sma_50_points = 5
-            technical_points += 5
-            reasons.append("Price above 50-day MA")
-        components.append({'name': 'Price vs 50-day SMA', 'points': sma_50_points, 'max_points': 5, 'category': 'Technical'})
-
-        sma_200_points = 0
-        if latest['Close'] > latest['SMA_200']:
-            sma_200_points = 5
-            technical_points += 5
-            reasons.append("Price above 200-day MA")
-        components.append({'name': 'Price vs 200-day SMA', 'points': sma_200_points, 'max_points': 5, 'category': 'Technical'})
-
-        golden_cross_points = 0
-        if latest['SMA_50'] > latest['SMA_200']:
-            golden_cross_points = 5
-            technical_points += 5
-            reasons.append("Golden cross formation")
-        components.append({'name': 'Golden Cross (50>200)', 'points': golden_cross_points, 'max_points': 5, 'category': 'Technical'})
-
-        # Momentum
-        rsi_points = 0
-        if 30 <= latest['RSI'] <= 70:
-            rsi_points = 5
-            technical_points += 5
-            reasons.append(f"Healthy RSI ({latest['RSI']:.1f})")
-        elif latest['RSI'] < 30:
-            rsi_points = 3
-            technical_points += 3
-            reasons.append("Oversold condition (potential bounce)")
-        elif latest['RSI'] > 70:
-            rsi_points = -3
-            technical_points -= 3
-            reasons.append("Overbought condition")
-        components.append({'name': f'RSI ({latest["RSI"]:.1f})', 'points': rsi_points, 'max_points': 5, 'category': 'Technical'})
-
-        # MACD
-        macd_points = 0
-        if latest['MACD'] > latest['Signal_Line']:
-            macd_points = 5
-            technical_points += 5
-            reasons.append("Bullish MACD crossover")
-        components.append({'name': 'MACD Signal', 'points': macd_points, 'max_points': 5, 'category': 'Technical'})
-
-        # Volume
-        volume_points = 0
-        if latest['Volume'] > latest['Volume_SMA']:
-            volume_points = 5
-            technical_points += 5
-            reasons.append("Above-average volume")
-        components.append({'name': 'Volume Trend', 'points': volume_points, 'max_points': 5, 'category': 'Technical'})
-
-        # Fundamental factors (20 points)
-        pe_points = 0
-        try:
-            if 'forwardPE' in info and info['forwardPE'] is not None:
-                pe = info['forwardPE']
-                if 10 <= pe <= 25:
-                    pe_points = 10
-                    fundamental_points += 10
-                    reasons.append(f"Reasonable P/E ratio ({pe:.1f})")
-                elif pe < 10:
-                    pe_points = 5
-                    fundamental_points += 5
-                    reasons.append(f"Low P/E ratio ({pe:.1f})")
-        except:
-            pass
-        components.append({'name': 'P/E Ratio Valuation', 'points': pe_points, 'max_points': 10, 'category': 'Fundamental'})
-
-        margin_points = 0
-        try:
-            if 'profitMargins' in info and info['profitMargins'] is not None:
-                if info['profitMargins'] > 0.15:
-                    margin_points = 5
-                    fundamental_points += 5
-                    reasons.append(f"Strong profit margins ({info['profitMargins']*100:.1f}%)")
-        except:
-            pass
-        components.append({'name': 'Profit Margins', 'points': margin_points, 'max_points': 5, 'category': 'Fundamental'})
-
-        roe_points = 0
-        try:
-            if 'returnOnEquity' in info and info['returnOnEquity'] is not None:
-                if info['returnOnEquity'] > 0.15:
-                    roe_points = 5
-                    fundamental_points += 5
-                    reasons.append(f"High ROE ({info['returnOnEquity']*100:.1f}%)")
-        except:
-            pass
-        components.append({'name': 'Return on Equity (ROE)', 'points': roe_points, 'max_points': 5, 'category': 'Fundamental'})
-
-        # Calculate total score
-        total_score = baseline_score + technical_points + fundamental_points
-        final_score = min(max(total_score, 0), 100)
-
-        # Calculate breakdown
-        breakdown = {
-            'baseline': baseline_score,
-            'technical': technical_points,
-            'fundamental': fundamental_points,
-            'total': final_score,
-            'baseline_pct': round((baseline_score / final_score * 100) if final_score > 0 else 0, 1),
-            'technical_pct': round((technical_points / final_score * 100) if final_score > 0 else 0, 1),
-            'fundamental_pct': round((fundamental_points / final_score * 100) if final_score > 0 else 0, 1),
-            'components': components
-        }
+        # A one-row batch; get_top_20_stocks scores the whole universe at once
+        batch = score_universe(latest_rows([df]), fundamentals_table([info]))
+        return batch.result(0)
 
-        return final_score, " | ".join(reasons[:5]), breakdown  # Limit to top 5 reasons
+    def predict_price(self, df, timeframe='short', score=50, latest=None):
+        """Predict future price based on timeframe and score.
 
-    def predict_price(self, df, timeframe='short', score=50):
-        """Predict future price based on timeframe and score"""
+        `latest` holds the last row's indicator values when `df` only has bars.
+        """
         if df is None or len(df) < 20:
             return None
 
         try:
             current_price = df['Close'].iloc[-1]
+            row = latest if latest is not None else df.iloc[-1]
 
             # Simple prediction based on moving averages and trend
             if timeframe == 'short':  # 1-3 months
-                sma = df['SMA_20'].iloc[-1]
-                rsi = df['RSI'].iloc[-1]
+                sma = row['SMA_20']
+                rsi = row['RSI']
 
                 # Score-based multiplier (align prediction with score)
                 if score >= 80:
@@ -270,14 +155,14 @@ class StockPredictionEngine:
 
             elif timeframe == 'mid':  # 3-12 months
                 if len(df) >= 60:
-                    sma_50 = df['SMA_50'].iloc[-1]
+                    sma_50 = row['SMA_50']
                     trend = (df['Close'].iloc[-1] - df['Close'].iloc[-60]) / df['Close'].iloc[-60]
                     predicted = current_price * (1 + trend * 1.5)
                 else:
                     predicted = current_price * 1.10  # Default 10% increase
 
             else:  # long term 1-3 years
-                sma_200 = df['SMA_200'].iloc[-1]
+                sma_200 = row['SMA_200']
                 annual_return = (df['Close'].iloc[-1] - df['Close'].iloc[0]) / df['Close'].iloc[0]
                 predicted = current_price * (1 + annual_return * 2)
 
@@ -287,148 +172,218 @@ class StockPredictionEngine:
             # Return a conservative estimate
             return round(df['Close'].iloc[-1] * 1.03, 2)
 
-    def analyze_single_stock(self, ticker):
-        """Analyze a single stock"""
+    def analyze_single_stock(self, ticker, hist=None, info=None):
+        """Analyze a single stock, optionally from preloaded history and info"""
         try:
-            hist, info = self.get_stock_data(ticker)
+            latest = None
+            if hist is None:
+                hist, info = self.get_stock_data(ticker)
+                if hist is not None and len(hist) >= 50:
+                    # Stored bars: the incremental state has the latest row, no full recompute
+                    latest = self.latest_indicators(ticker)
+            elif info is None:
+                info = self.get_stock_info(ticker)
             if hist is None or hist.empty:
                 return None
 
+            if latest is not None:
+                batch = score_universe(stack_rows([latest]), fundamentals_table([info]))
+                score, reasons, breakdown = batch.result(0)
+                return self.build_stock_result(ticker, hist, info, score, reasons, breakdown, latest=latest)
+
             df = self.calculate_technical_indicators(hist)
             if df is None:
                 return None
 
             score, reasons, breakdown = self.calculate_prediction_score(df, info)
+            return self.build_stock_result(ticker, df, info, score, reasons, breakdown)
+        except Exception as e:
+            print(f"Error analyzing {ticker}: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
 
-            # Get the last close price (this is what yfinance returns)
-            current_price = float(df['Close'].iloc[-1])
-            price_timestamp = df.index[-1]
+    def latest_indicators(self, ticker):
+        """Latest-row indicator values from the ticker's incremental state (None on failure)"""
+        try:
+            return self.indicator_states.latest(ticker)
+        except Exception as e:
+            print(f"Error updating indicator state for {ticker}: {e}")
+            return None
 
-            # Determine if this is a close price, intraday price, or pre/post-market
-            price_label = "Last Close Price"  # Default
-            try:
-                import pytz
-                now = datetime.now(pytz.timezone('America/New_York'))
+    def build_stock_result(self, ticker, df, info, score, reasons, breakdown, latest=None):
+        """Assemble the per-stock result dict from indicators and a computed score.
 
-                # Handle timezone-aware and naive timestamps
-                if price_timestamp.tzinfo is None:
-                    price_date = price_timestamp.tz_localize('UTC').tz_convert('America/New_York')
-                else:
-                    price_date = price_timestamp.tz_convert('America/New_York')
-
-                is_same_day = now.date() == price_date.date()
-                is_weekday = now.weekday() < 5  # Monday = 0, Friday = 4
-
-                if is_weekday:
-                    # Define market hours (all times in ET)
-                    pre_market_start = now.replace(hour=4, minute=0, second=0, microsecond=0)
-                    market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-                    market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-                    post_market_end = now.replace(hour=20, minute=0, second=0, microsecond=0)
-
-                    # Determine the appropriate label based on current time
-                    if market_open <= now <= market_close:
-                        # During regular market hours
-                        if is_same_day:
-                            price_label = "Current Price"
-                        else:
-                            price_label = "Previous Close Price"
-                    elif pre_market_start <= now < market_open:
-                        # Pre-market hours (4:00 AM - 9:30 AM ET)
-                        price_label = "Previous Close Price (Pre-Market)"
-                    elif market_close < now <= post_market_end:
-                        # Post-market hours (4:00 PM - 8:00 PM ET)
-                        price_label = "Previous Close Price (Post-Market)"
+        `latest` supplies the last row's indicators when `df` only has bars.
+        """
+        # Get the last close price (this is what yfinance returns)
+        current_price = float(df['Close'].iloc[-1])
+        price_timestamp = df.index[-1]
+
+        # Determine if this is a close price, intraday price, or pre/post-market
+        price_label = "Last Close Price"  # Default
+        try:
+            import pytz
+            now = datetime.now(pytz.timezone('America/New_York'))
+
+            # Handle timezone-aware and naive timestamps
+            if price_timestamp.tzinfo is None:
+                price_date = price_timestamp.tz_localize('UTC').tz_convert('America/New_York')
+            else:
+                price_date = price_timestamp.tz_convert('America/New_York')
+
+            is_same_day = now.date() == price_date.date()
+            is_weekday = now.weekday() < 5  # Monday = 0, Friday = 4
+
+            if is_weekday:
+                # Define market hours (all times in ET)
+                pre_market_start = now.replace(hour=4, minute=0, second=0, microsecond=0)
+                market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
+                market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
+                post_market_end = now.replace(hour=20, minute=0, second=0, microsecond=0)
+
+                # Determine the appropriate label based on current time
+                if market_open <= now <= market_close:
+                    # During regular market hours
+                    if is_same_day:
+                        price_label = "Current Price"
                     else:
-                        # After hours (8:00 PM - 4:00 AM ET)
                         price_label = "Previous Close Price"
+                elif pre_market_start <= now < market_open:
+                    # Pre-market hours (4:00 AM - 9:30 AM ET)
+                    price_label = "Previous Close Price (Pre-Market)"
+                elif market_close < now <= post_market_end:
+                    # Post-market hours (4:00 PM - 8:00 PM ET)
+                    price_label = "Previous Close Price (Post-Market)"
                 else:
-                    # Weekend
-                    price_label = "Last Close Price (Weekend)"
-            except Exception as e:
-                print(f"Timezone handling error: {e}")
-                # Default to "Last Close Price" on error
-
-            # Ensure all predictions return valid values (pass score for alignment)
-            short_predicted = self.predict_price(df, 'short', score)
-            if short_predicted is None:
-                short_predicted = round(current_price * 1.03, 2)
-
-            mid_predicted = self.predict_price(df, 'mid', score)
-            if mid_predicted is None:
-                mid_predicted = round(current_price * 1.10, 2)
-
-            long_predicted = self.predict_price(df, 'long', score)
-            if long_predicted is None:
-                long_predicted = round(current_price * 1.25, 2)
-
-            result = {
-                'ticker': ticker,
-                'company_name': info.get('longName', ticker),
-                'sector': info.get('sector', 'N/A'),
-                'industry': info.get('industry', 'N/A'),
-                'current_price': round(current_price, 2),
-                'price_label': price_label,
-                'price_timestamp': price_timestamp.isoformat(),
-                'short_term': {
-                    'predicted_price': float(short_predicted),
-                    'timeframe': '1-3 months',
-                    'score': score
-                },
-                'mid_term': {
-                    'predicted_price': float(mid_predicted),
-                    'timeframe': '3-12 months',
-                    'score': score
-                },
-                'long_term': {
-                    'predicted_price': float(long_predicted),
-                    'timeframe': '1-3 years',
-                    'score': score
-                },
-                'prediction_score': score,
-                'score_breakdown': breakdown,
-                'reasons': reasons,
-                'last_updated': datetime.now().isoformat()
-            }
-
-            return result
+                    # After hours (8:00 PM - 4:00 AM ET)
+                    price_label = "Previous Close Price"
+            else:
+                # Weekend
+                price_label = "Last Close Price (Weekend)"
         except Exception as e:
-            print(f"Error analyzing {ticker}: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+            print(f"Timezone handling error: {e}")
+            # Default to "Last Close Price" on error
+
+        # Ensure all predictions return valid values (pass score for alignment)
+        short_predicted = self.predict_price(df, 'short', score, latest)
+        if short_predicted is None:
+            short_predicted = round(current_price * 1.03, 2)
+
+        mid_predicted = self.predict_price(df, 'mid', score, latest)
+        if mid_predicted is None:
+            mid_predicted = round(current_price * 1.10, 2)
+
+        long_predicted = self.predict_price(df, 'long', score, latest)
+        if long_predicted is None:
+            long_predicted = round(current_price * 1.25, 2)
+
+        result = {
+            'ticker': ticker,
+            'company_name': info.get('longName', ticker),
+            'sector': info.get('sector', 'N/A'),
+            'industry': info.get('industry', 'N/A'),
+            'current_price': round(current_price, 2),
+            'price_label': price_label,
+            'price_timestamp': price_timestamp.isoformat(),
+            'short_term': {
+                'predicted_price': float(short_predicted),
+                'timeframe': '1-3 months',
+                'score': score
+            },
+            'mid_term': {
+                'predicted_price': float(mid_predicted),
+                'timeframe': '3-12 months',
+                'score': score
+            },
+            'long_term': {
+                'predicted_price': float(long_predicted),
+                'timeframe': '1-3 years',
+                'score': score
+            },
+            'prediction_score': score,
+            'score_breakdown': breakdown,
+            'reasons': reasons,
+            'last_updated': datetime.now().isoformat()
+        }
 
-    def get_top_20_stocks(self):
-        """Get top 20 stocks for each timeframe"""
-        all_stocks = []
+        return result
 
-        # Use ThreadPoolExecutor for parallel processing with reduced workers to avoid rate limiting
+    def _analyze_chunk(self, tickers):
+        # Pull the chunk's daily bars up front so indicator and scoring work runs over local data
+        histories = self.get_bulk_stock_data(tickers)
+
+        # One vectorized indicator pass over the chunk
+        panel = IndicatorPanel(histories)
+        indicator_frames = panel.frames_with_indicators()
+        scored = list(indicator_frames)
+
+        # Fundamentals come from the TTL cache; Yahoo calls are paced by the shared rate limiter
         with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {executor.submit(self.analyze_single_stock, ticker): ticker
-                      for ticker in self.stock_universe}
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    all_stocks.append(result)
-                # Small delay between processing results
-                time.sleep(0.3)
-
-        # Sort by prediction score and get top 20
-        all_stocks.sort(key=lambda x: x['prediction_score'], reverse=True)
-        top_20 = all_stocks[:20]
-
-        # Safe sorting with None checks
-        def safe_sort_by_gain(stocks, timeframe_key):
-            return sorted(
-                stocks,
-                key=lambda x: (x[timeframe_key]['predicted_price'] or x['current_price']) - x['current_price'],
-                reverse=True
-            )[:20]
-
-        return {
-            'short_term': top_20,
-            'mid_term': safe_sort_by_gain(all_stocks, 'mid_term'),
-            'long_term': safe_sort_by_gain(all_stocks, 'long_term'),
-            'generated_at': datetime.now().isoformat()
-        }
+            infos = list(executor.map(self.get_stock_info, scored))
+
+        # Score every ticker in one batch, then build result dicts per ticker
+        batch = score_universe(panel.latest(scored), fundamentals_table(infos))
+        for i, ticker in enumerate(scored):
+            try:
+                score, reasons, breakdown = batch.result(i)
+                result = self.build_stock_result(
+                    ticker, indicator_frames[ticker], infos[i], score, reasons, breakdown)
+            except Exception as e:
+                print(f"Error analyzing {ticker}: {e}")
+                continue
+            yield result
+
+        # Tickers the bulk download missed go through the per-ticker path
+        missing = [ticker for ticker in tickers if ticker not in histories]
+        if missing:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {executor.submit(self.analyze_single_stock, ticker): ticker for ticker in missing}
+
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result:
+                        yield result
+
+    def rank_top_stocks(self, all_stocks):
+        """Top 20 stocks for each timeframe from per-stock results"""
+        return TopRankings().extend(all_stocks).result()
+
+    def rank_shard(self, offset, tickers, on_result=None, chunk_size=None):
+        """Analyze one shard of the universe, keeping only its top candidates.
+
+        A `chunk_size` smaller than the shard downloads and scores it in
+        chunks, so `on_result` sees the first stocks sooner.
+        """
+        rankings = TopRankings(offset=offset)
+        chunk_size = chunk_size or len(tickers)
+        for start in range(0, len(tickers), chunk_size):
+            for stock in self._analyze_chunk(tickers[start:start + chunk_size]):
+                rankings.add(stock)
+                if on_result is not None:
+                    on_result(stock)
+        return rankings
+
+    def rank_universe(self, tickers=None, shard_size=None, workers=None, on_result=None, chunk_size=None):
+        """Rank the universe shard by shard and merge the shards' top candidates.
+
+        Only one shard's bars, indicators and results are held per worker at a
+        time, so memory is bounded by the shard size rather than the universe.
+        `on_result(stock)` is called as each stock is analyzed; `chunk_size`
+        splits each shard's work so those calls start sooner.
+        """
+        tickers = list(tickers or self.stock_universe)
+        shards = universe.shards(tickers, shard_size)
+        rankings = TopRankings()
+        with ThreadPoolExecutor(max_workers=workers or universe.SHARD_WORKERS) as executor:
+            results = executor.map(lambda shard: self.rank_shard(*shard, on_result=on_result, chunk_size=chunk_size),
+                                   shards)
+            for i, shard_rankings in enumerate(results):
+                rankings.merge(shard_rankings)
+                if len(shards) > 1:
+                    print(f"Ranked shard {i + 1}/{len(shards)} ({rankings.count} stocks analyzed)")
+        return rankings
+
+    def get_top_20_stocks(self):
+        """Get top 20 stocks for each timeframe"""
+        return self.rank_universe().result()
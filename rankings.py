@@ -0,0 +1,75 @@
+import heapq
+from datetime import datetime
+
+# Stocks listed per timeframe
+TOP_N = 20
+
+
+def _gain(timeframe):
+    return lambda stock: (stock[timeframe]['predicted_price'] or stock['current_price']) - stock['current_price']
+
+
+# Timeframe -> sort key: short term by prediction score, mid/long term by predicted gain
+RANK_KEYS = {
+    'short_term': lambda stock: stock['prediction_score'],
+    'mid_term': _gain('mid_term'),
+    'long_term': _gain('long_term')
+}
+
+
+class TopRankings:
+    """Bounded top-N candidates per timeframe.
+
+    Each timeframe keeps a min-heap of at most `n` stocks, so memory stays
+    constant however many stocks are added. Shards of a universe are ranked
+    separately and merged; `offset` is the shard's position in the universe,
+    which breaks ties in universe order exactly like a stable sort would.
+    """
+
+    def __init__(self, n=TOP_N, offset=0):
+        self.n = n
+        self.position = offset
+        self.count = 0
+        self._heaps = {timeframe: [] for timeframe in RANK_KEYS}
+
+    def _push(self, heap, entry):
+        if len(heap) < self.n:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def add(self, stock):
+        # Earlier stocks win ties, so a larger negated position ranks higher
+        order = -self.position
+        self.position += 1
+        self.count += 1
+        for timeframe, key in RANK_KEYS.items():
+            self._push(self._heaps[timeframe], (key(stock), order, stock))
+
+    def extend(self, stocks):
+        for stock in stocks:
+            self.add(stock)
+        return self
+
+    def merge(self, other):
+        """Fold another shard's candidates into this ranking"""
+        for timeframe, heap in other._heaps.items():
+            for entry in heap:
+                self._push(self._heaps[timeframe], entry)
+        self.count += other.count
+        return self
+
+    def ranked(self, timeframe):
+        return [entry[2] for entry in sorted(self._heaps[timeframe], key=lambda entry: entry[:2], reverse=True)]
+
+    def tickers(self):
+        """Every ticker that made at least one timeframe's list"""
+        return list(dict.fromkeys(stock['ticker'] for timeframe in RANK_KEYS for stock in self.ranked(timeframe)))
+
+    def result(self):
+        return {
+            'short_term': self.ranked('short_term'),
+            'mid_term': self.ranked('mid_term'),
+            'long_term': self.ranked('long_term'),
+            'generated_at': datetime.now().isoformat()
+        }
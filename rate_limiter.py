@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; cross-worker limiting is unavailable there
+    fcntl = None
+
+# Yahoo requests per second and burst unless YAHOO_RATE_LIMIT / YAHOO_RATE_BURST say otherwise
+DEFAULT_RATE = 4
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """Process-wide token-bucket rate limiter.
+
+    `rate` tokens are added per second up to `burst`. A caller takes its
+    tokens immediately and, if that leaves the bucket in debt, sleeps until
+    the debt is repaid. Requests larger than `burst` (e.g. a batched
+    download) therefore still go through, just paced. `clock` and `sleep`
+    can be replaced, e.g. by a simulated clock in tests.
+    """
+
+    def __init__(self, rate, burst, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.acquisitions = 0
+        self.tokens_taken = 0.0
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _reserve(self, tokens):
+        """Take tokens and return how long the caller must wait"""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def _record(self, tokens, wait):
+        with self._stats_lock:
+            self.acquisitions += 1
+            self.tokens_taken += tokens
+            if wait > 0:
+                self.waits += 1
+                self.total_wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` requests may be sent"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            self.sleep(wait)
+        self._record(tokens, wait)
+        return wait
+
+    def backoff(self, seconds):
+        """Hold every caller for `seconds`, e.g. after the upstream pushes back"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self.clock() + seconds)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'rate_per_second': self.rate,
+                'burst': self.burst,
+                'shared': False,
+                'acquisitions': self.acquisitions,
+                'tokens_taken': round(self.tokens_taken, 1),
+                'waits': self.waits,
+                'total_wait_seconds': round(self.total_wait_seconds, 2),
+                'avg_wait_seconds': round(self.total_wait_seconds / self.waits, 3) if self.waits else 0.0,
+                'max_wait_seconds': round(self.max_wait_seconds, 2)
+            }
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket whose state lives in a lock-protected file.
+
+    Every gunicorn worker pointing at the same file shares one budget.
+    Wall-clock time is used because the state crosses process boundaries.
+    """
+
+    def __init__(self, rate, burst, path, clock=time.time, sleep=time.sleep):
+        super().__init__(rate, burst, clock=clock, sleep=sleep)
+        self.path = path
+
+    def _reserve(self, tokens):
+        with self._lock, open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+
+                now = self.clock()
+                current = state.get('tokens', self.burst)
+                updated = state.get('updated', now)
+                paused_until = state.get('paused_until', 0.0)
+
+                current = min(self.burst, current + (now - updated) * self.rate) - tokens
+                wait = -current / self.rate if current < 0 else 0.0
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({'tokens': current, 'updated': now, 'paused_until': paused_until}))
+                f.flush()
+                return max(wait, paused_until - now)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def backoff(self, seconds):
+        with self._lock, open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+                state['paused_until'] = max(state.get('paused_until', 0.0), self.clock() + seconds)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def stats(self):
+        stats = super().stats()
+        stats['shared'] = True
+        return stats
+
+
+def limiter_from_env():
+    """Build the Yahoo limiter from YAHOO_RATE_LIMIT / YAHOO_RATE_BURST / YAHOO_RATE_LIMIT_FILE"""
+    rate = float(os.environ.get('YAHOO_RATE_LIMIT', DEFAULT_RATE))
+    burst = float(os.environ.get('YAHOO_RATE_BURST', DEFAULT_BURST))
+    shared_path = os.environ.get('YAHOO_RATE_LIMIT_FILE')
+
+    if shared_path:
+        if fcntl is not None:
+            return SharedTokenBucket(rate, burst, shared_path)
+        print("YAHOO_RATE_LIMIT_FILE ignored: file locking is not supported on this platform")
+    return TokenBucket(rate, burst)
+
+
+# Every Yahoo Finance request in the process goes through this limiter
+yahoo_limiter = limiter_from_env()
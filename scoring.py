@@ -0,0 +1,153 @@
+import numpy as np
+
+# Latest-row inputs the scoring rules read
+TECHNICAL_INPUTS = ['Close', 'SMA_50', 'SMA_200', 'RSI', 'MACD', 'Signal_Line', 'Volume', 'Volume_SMA']
+# Fundamentals the scoring rules read, as Yahoo `info` keys
+FUNDAMENTAL_INPUTS = ['forwardPE', 'profitMargins', 'returnOnEquity']
+
+BASELINE_SCORE = 50
+
+
+def latest_rows(frames):
+    """Stack the last row of each indicator frame into name -> 1-D array"""
+    return {
+        name: np.array([df[name].iat[-1] for df in frames], dtype=float)
+        for name in TECHNICAL_INPUTS
+    }
+
+
+def stack_rows(rows):
+    """Stack latest-value mappings (e.g. IndicatorState.latest()) into name -> 1-D array"""
+    return {name: np.array([row[name] for row in rows], dtype=float) for name in TECHNICAL_INPUTS}
+
+
+def fundamentals_table(infos):
+    """Stack per-ticker info mappings into name -> 1-D float array (NaN when missing)"""
+    table = {key: np.full(len(infos), np.nan) for key in FUNDAMENTAL_INPUTS}
+    for i, info in enumerate(infos):
+        for key in FUNDAMENTAL_INPUTS:
+            value = info.get(key) if info else None
+            if value is None:
+                continue
+            try:
+                table[key][i] = float(value)
+            except (TypeError, ValueError):
+                pass
+    return table
+
+
+class ScoreBatch:
+    """Prediction scores for a whole universe, computed as array operations.
+
+    Points, totals and percentage breakdowns are arrays over tickers; the
+    per-ticker reasons string and components list are only built when a
+    result is serialized.
+    """
+
+    def __init__(self, latest, fundamentals):
+        self.latest = latest
+        self.fundamentals = fundamentals
+
+        close = latest['Close']
+        sma_50 = latest['SMA_50']
+        sma_200 = latest['SMA_200']
+        rsi = latest['RSI']
+        pe = fundamentals['forwardPE']
+        margins = fundamentals['profitMargins']
+        roe = fundamentals['returnOnEquity']
+
+        # NaN comparisons are False, so missing inputs earn no points
+        with np.errstate(invalid='ignore'):
+            self.points = {
+                'sma_50': np.where(close > sma_50, 5, 0),
+                'sma_200': np.where(close > sma_200, 5, 0),
+                'golden_cross': np.where(sma_50 > sma_200, 5, 0),
+                'rsi': np.select([(rsi >= 30) & (rsi <= 70), rsi < 30, rsi > 70], [5, 3, -3], 0),
+                'macd': np.where(latest['MACD'] > latest['Signal_Line'], 5, 0),
+                'volume': np.where(latest['Volume'] > latest['Volume_SMA'], 5, 0),
+                'pe': np.select([(pe >= 10) & (pe <= 25), pe < 10], [10, 5], 0),
+                'margins': np.where(margins > 0.15, 5, 0),
+                'roe': np.where(roe > 0.15, 5, 0)
+            }
+
+        points = self.points
+        self.technical = (points['sma_50'] + points['sma_200'] + points['golden_cross'] +
+                          points['rsi'] + points['macd'] + points['volume'])
+        self.fundamental = points['pe'] + points['margins'] + points['roe']
+        self.total = np.clip(BASELINE_SCORE + self.technical + self.fundamental, 0, 100)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            positive = self.total > 0
+            self.baseline_pct = np.where(positive, BASELINE_SCORE / self.total * 100, 0)
+            self.technical_pct = np.where(positive, self.technical / self.total * 100, 0)
+            self.fundamental_pct = np.where(positive, self.fundamental / self.total * 100, 0)
+
+    def __len__(self):
+        return len(self.total)
+
+    def _reasons_and_components(self, i):
+        latest = {name: values[i] for name, values in self.latest.items()}
+        pe = self.fundamentals['forwardPE'][i]
+        margins = self.fundamentals['profitMargins'][i]
+        roe = self.fundamentals['returnOnEquity'][i]
+        points = {name: int(values[i]) for name, values in self.points.items()}
+        reasons = []
+
+        if points['sma_50']:
+            reasons.append("Price above 50-day MA")
+        if points['sma_200']:
+            reasons.append("Price above 200-day MA")
+        if points['golden_cross']:
+            reasons.append("Golden cross formation")
+        if points['rsi'] == 5:
+            reasons.append(f"Healthy RSI ({latest['RSI']:.1f})")
+        elif points['rsi'] == 3:
+            reasons.append("Oversold condition (potential bounce)")
+        elif points['rsi'] == -3:
+            reasons.append("Overbought condition")
+        if points['macd']:
+            reasons.append("Bullish MACD crossover")
+        if points['volume']:
+            reasons.append("Above-average volume")
+        if points['pe'] == 10:
+            reasons.append(f"Reasonable P/E ratio ({pe:.1f})")
+        elif points['pe'] == 5:
+            reasons.append(f"Low P/E ratio ({pe:.1f})")
+        if points['margins']:
+            reasons.append(f"Strong profit margins ({margins*100:.1f}%)")
+        if points['roe']:
+            reasons.append(f"High ROE ({roe*100:.1f}%)")
+
+        components = [
+            {'name': 'Price vs 50-day SMA', 'points': points['sma_50'], 'max_points': 5, 'category': 'Technical'},
+            {'name': 'Price vs 200-day SMA', 'points': points['sma_200'], 'max_points': 5, 'category': 'Technical'},
+            {'name': 'Golden Cross (50>200)', 'points': points['golden_cross'], 'max_points': 5, 'category': 'Technical'},
+            {'name': f'RSI ({latest["RSI"]:.1f})', 'points': points['rsi'], 'max_points': 5, 'category': 'Technical'},
+            {'name': 'MACD Signal', 'points': points['macd'], 'max_points': 5, 'category': 'Technical'},
+            {'name': 'Volume Trend', 'points': points['volume'], 'max_points': 5, 'category': 'Technical'},
+            {'name': 'P/E Ratio Valuation', 'points': points['pe'], 'max_points': 10, 'category': 'Fundamental'},
+            {'name': 'Profit Margins', 'points': points['margins'], 'max_points': 5, 'category': 'Fundamental'},
+            {'name': 'Return on Equity (ROE)', 'points': points['roe'], 'max_points': 5, 'category': 'Fundamental'}
+        ]
+        return reasons, components
+
+    def result(self, i):
+        """(score, reasons, breakdown) for ticker i, shaped like calculate_prediction_score"""
+        reasons, components = self._reasons_and_components(i)
+        final_score = int(self.total[i])
+        breakdown = {
+            'baseline': BASELINE_SCORE,
+            'technical': int(self.technical[i]),
+            'fundamental': int(self.fundamental[i]),
+            'total': final_score,
+            'baseline_pct': round(float(self.baseline_pct[i]), 1),
+            'technical_pct': round(float(self.technical_pct[i]), 1),
+            'fundamental_pct': round(float(self.fundamental_pct[i]), 1),
+            'components': components
+        }
+        return final_score, " | ".join(reasons[:5]), breakdown  # Limit to top 5 reasons
+
+
+def score_universe(latest, fundamentals):
+    """Score every ticker from latest-row indicator arrays and a fundamentals table"""
+    return ScoreBatch(latest, fundamentals)
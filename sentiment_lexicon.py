@@ -0,0 +1,102 @@
+import re
+import numpy as np
+
+# Financial polarity lexicon: word -> weight. Positive words push towards the
+# positive label, negative words towards the negative one.
+LEXICON = {
+    # Price action
+    'surged': 2.0, 'surge': 2.0, 'soared': 2.0, 'skyrocketed': 2.5, 'rallied': 1.5, 'rally': 1.5,
+    'gained': 1.0, 'gaining': 1.0, 'gain': 1.0, 'gains': 1.0, 'rose': 1.0, 'rise': 1.0, 'rising': 1.0,
+    'climbed': 1.0, 'jumped': 1.5, 'up': 0.5, 'higher': 0.5, 'rebound': 1.0, 'recovery': 1.0,
+    'plummeted': -2.5, 'plunged': -2.0, 'crashed': -2.5, 'collapsed': -2.5, 'tumbled': -2.0,
+    'dropped': -1.5, 'dropping': -1.5, 'fell': -1.5, 'fall': -1.0, 'declined': -1.0, 'declining': -1.0,
+    'decline': -1.0, 'slumped': -1.5, 'sank': -1.5, 'down': -0.5, 'lower': -0.5, 'loss': -1.0, 'losses': -1.0,
+    # Performance and momentum
+    'outperforming': 1.5, 'outperform': 1.5, 'beating': 1.0, 'beat': 1.0, 'strong': 1.0, 'strength': 1.0,
+    'exceptional': 1.5, 'momentum': 0.5, 'bullish': 2.0, 'optimistic': 1.5, 'confidence': 1.0,
+    'improving': 1.0, 'improved': 1.0, 'favorable': 1.0, 'positive': 1.0, 'growth': 0.5, 'record': 0.5,
+    'underperforming': -1.5, 'underperform': -1.5, 'missed': -1.0, 'weak': -1.0, 'weakness': -1.0,
+    'bearish': -2.0, 'pessimistic': -1.5, 'deteriorating': -1.5, 'unfavorable': -1.0, 'negative': -1.0,
+    'pressure': -0.5, 'selling': -0.5, 'volatile': -0.5, 'volatility': -0.5, 'uncertainty': -0.5,
+    # Analyst language
+    'buy': 1.0, 'buying': 1.0, 'upgrade': 1.5, 'upgraded': 1.5, 'upside': 1.0, 'conviction': 0.5,
+    'sell': -1.0, 'downgrade': -1.5, 'downgraded': -1.5, 'downside': -1.0, 'concerns': -1.0,
+    'concern': -1.0, 'risk': -0.5, 'risks': -0.5, 'red': -0.5, 'flags': -0.5, 'warning': -1.0,
+    # Corporate events
+    'profit': 0.5, 'profitable': 1.0, 'dividend': 0.5, 'beats': 1.0, 'lawsuit': -1.5, 'fraud': -2.5,
+    'bankruptcy': -3.0, 'layoffs': -1.0, 'recall': -1.0, 'investigation': -1.5, 'default': -2.0,
+}
+
+# Words that flip the polarity of the word right after them
+NEGATORS = {'not', 'no', 'never', 'without', "isn't", "wasn't", "didn't", "don't"}
+
+# Index 0 is reserved for words outside the lexicon (weight 0)
+VOCABULARY = {word: i + 1 for i, word in enumerate(LEXICON)}
+WEIGHTS = np.array([0.0] + list(LEXICON.values()))
+
+TOKEN_PATTERN = re.compile(r"[a-z']+")
+
+# Label names per model, ordered negative, neutral, positive
+MODEL_LABELS = {
+    'ProsusAI/finbert': ('negative', 'neutral', 'positive'),
+}
+DEFAULT_LABELS = ('LABEL_0', 'LABEL_1', 'LABEL_2')
+
+
+class LexiconSentimentBackend:
+    """Offline sentiment classifier scoring text against a financial lexicon.
+
+    Tokens are looked up in one vocabulary, and per-text scores for a whole
+    batch come from a single weighted bincount, so thousands of narratives
+    classify per second on one CPU core. Scores are mapped to
+    negative/neutral/positive probabilities with the label names the hosted
+    model would return, so downstream label mapping is unchanged.
+    """
+
+    name = 'lexicon'
+    requires_api_key = False
+
+    def __init__(self, neutral_bias=0.75, temperature=1.0):
+        # Texts need a net score beyond the bias before leaving neutral
+        self.neutral_bias = neutral_bias
+        self.temperature = temperature
+
+    def scores(self, texts):
+        """Net polarity per text, normalized by the number of opinion words"""
+        text_ids = []
+        word_ids = []
+        signs = []
+        for i, text in enumerate(texts):
+            negate = False
+            for token in TOKEN_PATTERN.findall(text.lower()):
+                index = VOCABULARY.get(token, 0)
+                if index:
+                    text_ids.append(i)
+                    word_ids.append(index)
+                    signs.append(-1.0 if negate else 1.0)
+                negate = token in NEGATORS
+
+        text_ids = np.asarray(text_ids, dtype=np.intp)
+        contributions = WEIGHTS[np.asarray(word_ids, dtype=np.intp)] * np.asarray(signs)
+        totals = np.bincount(text_ids, weights=contributions, minlength=len(texts))
+        counts = np.bincount(text_ids, minlength=len(texts))
+        return totals / np.sqrt(np.maximum(counts, 1))
+
+    def probabilities(self, texts):
+        """(n, 3) array of negative, neutral, positive probabilities"""
+        s = self.scores(texts)
+        logits = np.stack([-s, np.full_like(s, self.neutral_bias), s], axis=1) / self.temperature
+        logits -= logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def classify_many(self, texts, model=None):
+        labels = MODEL_LABELS.get(model, DEFAULT_LABELS)
+        probs = self.probabilities(texts)
+        return [
+            [{'label': label, 'score': float(p)} for label, p in zip(labels, row)]
+            for row in probs
+        ]
+
+    def classify(self, text, model=None, token=None, timeout=None):
+        return self.classify_many([text], model)[0]
@@ -0,0 +1,281 @@
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is running wait and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls)
+            }
+
+
+class Broadcast:
+    """Progress of one in-flight computation, replayed to every follower.
+
+    The producer pushes items as they are ready and then closes (or fails)
+    the broadcast. Each follower iterates from the first item, so one that
+    joins late still sees everything, and then waits for new items until the
+    computation ends. With `max_items`, only the most recent items are kept
+    for replay, so a run nobody follows holds a bounded buffer; a follower
+    that falls further behind skips ahead to the oldest kept item.
+    """
+
+    def __init__(self, max_items=None):
+        self.max_items = max_items
+        self._items = []
+        self._dropped = 0  # items discarded from the front of the buffer
+        self._cond = threading.Condition()
+        self.done = False
+        self.result = None
+        self.error = None
+
+    def push(self, item):
+        with self._cond:
+            self._items.append(item)
+            if self.max_items is not None and len(self._items) > self.max_items:
+                excess = len(self._items) - self.max_items
+                del self._items[:excess]
+                self._dropped += excess
+            self._cond.notify_all()
+
+    def close(self, result=None):
+        with self._cond:
+            self.result = result
+            self.done = True
+            self._cond.notify_all()
+
+    def fail(self, error):
+        with self._cond:
+            self.error = error
+            self.done = True
+            self._cond.notify_all()
+
+    def follow(self):
+        """Yield every item, blocking for new ones; raises the producer's error at the end"""
+        position = 0  # absolute index of the next item
+        while True:
+            with self._cond:
+                while position >= self._dropped + len(self._items) and not self.done:
+                    self._cond.wait()
+                position = max(position, self._dropped)
+                batch = self._items[position - self._dropped:]
+                finished = self.done
+                end = self._dropped + len(self._items)
+            position += len(batch)
+            yield from batch
+            if finished and position >= end:
+                break
+        if self.error is not None:
+            raise self.error
+
+
+class BroadcastGroup:
+    """At most one in-flight, broadcast computation per key.
+
+    `join(key, fn)` returns the key's Broadcast, starting `fn(broadcast)` on
+    a daemon thread if nothing is running for it. The computation belongs to
+    no request, so it finishes (and its followers get the result) even if
+    the request that started it goes away.
+    """
+
+    def __init__(self, name='broadcast'):
+        self.name = name
+        self._broadcasts = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.joined = 0
+
+    def join(self, key, fn):
+        with self._lock:
+            broadcast = self._broadcasts.get(key)
+            if broadcast is not None:
+                self.joined += 1
+                return broadcast
+            broadcast = self._broadcasts[key] = Broadcast()
+            self.executions += 1
+
+        def run():
+            try:
+                result = fn(broadcast)
+            except BaseException as e:
+                self._finish(key, broadcast)
+                broadcast.fail(e)
+                return
+            self._finish(key, broadcast)
+            broadcast.close(result)
+
+        threading.Thread(target=run, name=f"{self.name}-{key}", daemon=True).start()
+        return broadcast
+
+    def _finish(self, key, broadcast):
+        with self._lock:
+            if self._broadcasts.get(key) is broadcast:
+                del self._broadcasts[key]
+
+    def stats(self):
+        with self._lock:
+            return {'executions': self.executions, 'joined': self.joined, 'in_flight': len(self._broadcasts)}
+
+
+class SingleFlightCache:
+    """Short-lived result cache that is safe against stampedes.
+
+    Misses are computed through a SingleFlight, so concurrent requests share
+    one computation. Entries are refreshed probabilistically before they
+    expire (the "XFetch" rule: refresh when now - delta * beta * ln(rand)
+    passes the expiry, where delta is how long the value took to compute), so
+    a single request recomputes early while everyone else keeps getting the
+    cached value instead of all missing at the same instant. `clock` and
+    `rand` can be replaced, e.g. to make expiry deterministic in tests.
+    """
+
+    def __init__(self, ttl, beta=1.0, maxsize=512, clock=time.time, rand=random.random):
+        self.ttl = ttl
+        self.beta = beta
+        self.maxsize = maxsize
+        self.clock = clock
+        self.rand = rand
+        self._entries = OrderedDict()  # key -> (value, expires_at, compute_seconds)
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.early_refreshes = 0
+
+    def _store(self, key, value, compute_seconds):
+        with self._lock:
+            self._entries[key] = (value, self.clock() + self.ttl, compute_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, fn, should_cache=None):
+        """Return the cached value for key, computing it at most once at a time.
+
+        `should_cache(value)` can reject results (e.g. "not found") so they
+        are shared with concurrent callers but not kept.
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            value, expires_at, compute_seconds = entry
+            jitter = -compute_seconds * self.beta * math.log(1.0 - self.rand())
+            if now + jitter < expires_at:
+                self.hits += 1
+                return value
+            if now < expires_at:
+                # Early refresh: if someone is already on it, keep serving the current value
+                if self._flight.in_flight(key):
+                    self.hits += 1
+                    return value
+                self.early_refreshes += 1
+
+        self.misses += 1
+
+        def compute():
+            start = self.clock()
+            value = fn()
+            if should_cache is None or should_cache(value):
+                self._store(key, value, self.clock() - start)
+            return value
+
+        return self._flight.do(key, compute)
+
+    def peek(self, key):
+        """Return the cached value for key if it has not expired, else None"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or self.clock() >= entry[1]:
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, compute_seconds=0.0):
+        """Store a value computed outside get_or_compute (e.g. by a streaming request)"""
+        self._store(key, value, compute_seconds)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            'entries': entries,
+            'ttl_seconds': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'early_refreshes': self.early_refreshes,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'single_flight': self._flight.stats()
+        }
@@ -0,0 +1,259 @@
+import os
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import datetime
+import pytz
+from singleflight import Broadcast
+
+MARKET_TZ = pytz.timezone('America/New_York')
+
+
+def is_market_hours(now=None):
+    """True during the regular NYSE session (9:30 AM - 4:00 PM ET, weekdays)"""
+    now = now or datetime.now(MARKET_TZ)
+    if now.weekday() >= 5:
+        return False
+    market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
+    market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
+    return market_open <= now <= market_close
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """An immutable, published result of one background computation.
+
+    `data` is shared by every request that serves this snapshot and must be
+    treated as read-only.
+    """
+    data: object
+    version: int
+    generated_at: datetime
+    duration_seconds: float
+    source: str = 'computed'
+
+    def age_seconds(self):
+        return (datetime.now() - self.generated_at).total_seconds()
+
+    def describe(self):
+        return {
+            'version': self.version,
+            'generated_at': self.generated_at.isoformat(),
+            'age_seconds': round(self.age_seconds(), 1),
+            'compute_seconds': round(self.duration_seconds, 2),
+            'source': self.source
+        }
+
+
+class SnapshotScheduler:
+    """Recompute a value on a market-hours cadence and publish snapshots.
+
+    Requests read the latest snapshot without doing any work. Only the very
+    first request (before any snapshot exists) computes synchronously, and
+    concurrent first requests share that single computation.
+
+    With `streams=True`, compute_fn is called with a Broadcast it pushes
+    partial results to; `follow()` lets any number of requests tail the one
+    in-flight computation instead of starting their own. `stream_buffer`
+    caps how many partial results a broadcast keeps for late followers.
+    """
+
+    def __init__(self, name, compute_fn, market_interval=900, off_hours_interval=3600, streams=False,
+                 stream_buffer=None):
+        self.name = name
+        self.compute_fn = compute_fn
+        self.streams = streams
+        self.stream_buffer = stream_buffer
+        self.market_interval = market_interval
+        self.off_hours_interval = off_hours_interval
+
+        self._snapshot = None
+        self._version = 0
+        self._refresh_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._refresh_thread = None
+        self._last_background_attempt = 0
+        self._progress = None  # Broadcast of the in-flight computation
+        self.last_error = None
+
+    def next_interval(self):
+        return self.market_interval if is_market_hours() else self.off_hours_interval
+
+    def _refresh_locked(self, progress=None):
+        start = time.time()
+        progress = progress or Broadcast(self.stream_buffer)
+        self._progress = progress
+        try:
+            data = self.compute_fn(progress) if self.streams else self.compute_fn()
+        except BaseException as e:
+            self._progress = None
+            progress.fail(e)
+            raise
+        self._version += 1
+        self._snapshot = Snapshot(
+            data=data,
+            version=self._version,
+            generated_at=datetime.now(),
+            duration_seconds=time.time() - start
+        )
+        self.last_error = None
+        self._progress = None
+        progress.close(self._snapshot)
+        print(f"{self.name}: published snapshot v{self._version} in {time.time() - start:.1f}s")
+        return self._snapshot
+
+    def refresh(self):
+        """Recompute now and publish a new snapshot"""
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def current(self):
+        """Return the latest snapshot without computing anything (None if none yet)"""
+        return self._snapshot
+
+    def get(self):
+        """Return the latest snapshot, computing one if none exists yet.
+
+        Without a background thread (e.g. on serverless hosts) a snapshot
+        older than the current cadence, computed or bundled, is served as-is
+        while a one-off refresh replaces it; only the first request blocks.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and (self.is_running() or snapshot.age_seconds() < self.next_interval()):
+            return snapshot
+        if snapshot is not None:
+            self.refresh_in_background()
+            return snapshot
+
+        seen_version = snapshot.version if snapshot else 0
+        with self._refresh_lock:
+            # Another request may have published while we waited for the lock
+            if self._version == seen_version:
+                try:
+                    self._refresh_locked()
+                except Exception as e:
+                    if self._snapshot is None:
+                        raise
+                    self.last_error = str(e)
+                    print(f"{self.name}: refresh failed, serving previous snapshot: {e}")
+            return self._snapshot
+
+    def publish(self, data, generated_at=None, source='published'):
+        """Publish externally computed data as the current snapshot"""
+        with self._refresh_lock:
+            self._version += 1
+            self._snapshot = Snapshot(
+                data=data,
+                version=self._version,
+                generated_at=generated_at or datetime.now(),
+                duration_seconds=0.0,
+                source=source
+            )
+            return self._snapshot
+
+    def refresh_in_background(self):
+        """Recompute once on a daemon thread unless a refresh is already under way"""
+        with self._start_lock:
+            if self.is_running() or (self._refresh_thread is not None and self._refresh_thread.is_alive()):
+                return False
+            # After a failed attempt, wait before hitting the data source again
+            if self.last_error and time.time() - self._last_background_attempt < 300:
+                return False
+            self._last_background_attempt = time.time()
+            self._refresh_thread = threading.Thread(target=self._refresh_once, name=f"{self.name}-refresh", daemon=True)
+            self._refresh_thread.start()
+            return True
+
+    def follow(self):
+        """Broadcast of the in-flight computation, starting one on a daemon thread if none is running.
+
+        Returns None while backing off after a failed refresh and a previous
+        snapshot can be served instead. The broadcast closes with the new
+        snapshot; it closes empty if another caller published first.
+        """
+        with self._start_lock:
+            progress = self._progress
+            if progress is not None:
+                return progress
+            if (self.last_error and self._snapshot is not None
+                    and time.time() - self._last_background_attempt < 300):
+                return None
+            self._last_background_attempt = time.time()
+            # Visible right away, so callers arriving before the thread runs join it
+            progress = self._progress = Broadcast(self.stream_buffer)
+            seen = self._snapshot
+            self._refresh_thread = threading.Thread(target=self._refresh_once, args=(seen, progress),
+                                                    name=f"{self.name}-refresh", daemon=True)
+            self._refresh_thread.start()
+            return progress
+
+    def _refresh_once(self, snapshot=None, progress=None):
+        if progress is None:
+            snapshot = self._snapshot
+        try:
+            with self._refresh_lock:
+                if self._snapshot is snapshot:
+                    self._refresh_locked(progress)
+                elif progress is not None:
+                    # Someone published while we waited; followers read that snapshot
+                    if self._progress is progress:
+                        self._progress = None
+                    progress.close(self._snapshot)
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"{self.name}: background refresh failed, serving previous snapshot: {e}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            snapshot = self._snapshot
+            if snapshot is not None:
+                wait = self.next_interval() - snapshot.age_seconds()
+                if wait > 0:
+                    if self._stop.wait(wait):
+                        break
+                    continue
+            try:
+                with self._refresh_lock:
+                    # Skip if a request published a snapshot in the meantime
+                    if self._snapshot is snapshot:
+                        self._refresh_locked()
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"{self.name}: background refresh failed: {e}")
+                traceback.print_exc()
+                # Back off before retrying a failed computation
+                if self._stop.wait(min(self.next_interval(), 300)):
+                    break
+
+    def start(self):
+        """Start the background refresh thread (idempotent)"""
+        with self._start_lock:
+            if self.is_running():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        snapshot = self._snapshot
+        return {
+            'running': self.is_running(),
+            'next_interval_seconds': self.next_interval(),
+            'snapshot': snapshot.describe() if snapshot else None,
+            'last_error': self.last_error
+        }
+
+
+def background_refresh_enabled():
+    """Serverless platforms freeze idle instances, so default to off there"""
+    default = '0' if os.environ.get('VERCEL') else '1'
+    return os.environ.get('ENABLE_BACKGROUND_REFRESH', default) == '1'
@@ -18,24 +18,21 @@ function showTab(timeframe) {
     document.getElementById(timeframe).classList.add('active');
 }
 
-// Load top 20 stocks
+// Load top 20 stocks, rendering rows as the server streams them
 async function loadTopStocks() {
     const loading = document.getElementById('loading');
     loading.style.display = 'flex';
 
     try {
-        const response = await fetch('/api/top-stocks');
-        const data = await response.json();
-
-        if (data.success) {
-            stocksData = data.data;
-            displayStocks('short', stocksData.short_term);
-            displayStocks('mid', stocksData.mid_term);
-            displayStocks('long', stocksData.long_term);
-            updateLastUpdate(stocksData.generated_at);
-        } else {
-            showError('Failed to load stock data: ' + data.error);
+        if (window.ReadableStream && window.TextDecoder) {
+            try {
+                await streamTopStocks(loading);
+                return;
+            } catch (error) {
+                console.warn('Streaming top stocks failed, loading in one request:', error);
+            }
         }
+        await fetchTopStocks();
     } catch (error) {
         showError('Error loading stocks: ' + error.message);
     } finally {
@@ -43,6 +40,94 @@ async function loadTopStocks() {
     }
 }
 
+// Load the full ranking in a single JSON response
+async function fetchTopStocks() {
+    const response = await fetch('/api/top-stocks');
+    const data = await response.json();
+
+    if (data.success) {
+        showTopStocks(data.data);
+    } else {
+        showError('Failed to load stock data: ' + data.error);
+    }
+}
+
+function showTopStocks(data) {
+    stocksData = data;
+    displayStocks('short', stocksData.short_term);
+    displayStocks('mid', stocksData.mid_term);
+    displayStocks('long', stocksData.long_term);
+    updateLastUpdate(stocksData.generated_at);
+}
+
+// Provisional ranking of the stocks received so far (same ordering as the server)
+function rankPartialStocks(stocks) {
+    const gain = (stock, key) => (stock[key].predicted_price || stock.current_price) - stock.current_price;
+    return {
+        short_term: [...stocks].sort((a, b) => b.prediction_score - a.prediction_score).slice(0, 20),
+        mid_term: [...stocks].sort((a, b) => gain(b, 'mid_term') - gain(a, 'mid_term')).slice(0, 20),
+        long_term: [...stocks].sort((a, b) => gain(b, 'long_term') - gain(a, 'long_term')).slice(0, 20)
+    };
+}
+
+// Read NDJSON events from /api/top-stocks/stream
+async function streamTopStocks(loading) {
+    const response = await fetch('/api/top-stocks/stream');
+    if (!response.ok || !response.body) {
+        throw new Error('Stream unavailable (' + response.status + ')');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const received = [];
+    let buffer = '';
+    let renderPending = false;
+    let finished = false;
+
+    const render = () => {
+        renderPending = false;
+        if (finished) return;
+        const partial = rankPartialStocks(received);
+        displayStocks('short', partial.short_term);
+        displayStocks('mid', partial.mid_term);
+        displayStocks('long', partial.long_term);
+    };
+
+    const handle = (line) => {
+        if (!line.trim()) return;
+        const event = JSON.parse(line);
+
+        if (event.type === 'stock') {
+            received.push(event.data);
+            loading.style.display = 'none';
+            if (!renderPending) {
+                renderPending = true;
+                requestAnimationFrame(render);
+            }
+        } else if (event.type === 'summary') {
+            finished = true;
+            showTopStocks(event.data);
+        } else if (event.type === 'error') {
+            throw new Error(event.error);
+        }
+    };
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        lines.forEach(handle);
+    }
+    handle(buffer + decoder.decode());
+
+    if (!finished) {
+        throw new Error('Stream ended before the summary');
+    }
+}
+
 // Display stocks in table
 function displayStocks(timeframe, stocks) {
     const container = document.getElementById(timeframe);
@@ -167,6 +167,15 @@ async function analyzeStock() {
     // Scroll to results area
     resultsContainer.scrollIntoView({ behavior: 'smooth', block: 'start' });
 
+    if (window.EventSource) {
+        streamStockScore(ticker, resultsContainer, loadingIndicator);
+    } else {
+        fetchStockScore(ticker, resultsContainer, loadingIndicator);
+    }
+}
+
+// Load the whole analysis in one JSON response
+async function fetchStockScore(ticker, resultsContainer, loadingIndicator) {
     try {
         const response = await fetch(`/api/stockscore/${ticker}`);
         const data = await response.json();
@@ -184,18 +193,90 @@ async function analyzeStock() {
     }
 }
 
-function displayStockScoreResults(data) {
-    const container = document.getElementById('stockScoreResults');
+// Render each section as the server finishes it
+function streamStockScore(ticker, resultsContainer, loadingIndicator) {
+    const source = new EventSource(`/api/stockscore/${ticker}/stream`);
+    let data = null;
+    let finished = false;
 
-    // Determine colors for consolidated summary
-    const verdictIcon = data.consolidated_summary.overall_verdict === 'BULLISH' ? '📈' :
-                       data.consolidated_summary.overall_verdict === 'BEARISH' ? '📉' : '➡️';
-    const verdictColor = data.consolidated_summary.overall_verdict === 'BULLISH' ? '#28a745' :
-                        data.consolidated_summary.overall_verdict === 'BEARISH' ? '#dc3545' : '#ffc107';
+    source.addEventListener('meta', (e) => {
+        data = JSON.parse(e.data);
+        loadingIndicator.style.display = 'none';
+        resultsContainer.innerHTML = renderStockScoreLayout(data);
+    });
 
-    let html = `
-        <div style="max-width: 1200px; margin: 30px auto;">
+    source.addEventListener('section', (e) => {
+        const section = JSON.parse(e.data);
+        if (!data) return;
+        data[section.name] = section.data;
+        displayStockScoreSection(data, section.name, section.data);
+    });
+
+    source.addEventListener('complete', (e) => {
+        finished = true;
+        source.close();
+        displayStockScoreResults(JSON.parse(e.data));
+    });
+
+    source.addEventListener('failed', (e) => {
+        finished = true;
+        source.close();
+        loadingIndicator.style.display = 'none';
+        resultsContainer.innerHTML = `<div class="alert alert-error">${JSON.parse(e.data).error}</div>`;
+    });
+
+    source.onerror = () => {
+        // Connection dropped before the analysis finished: don't let EventSource
+        // reconnect (that would restart it), load the plain JSON result instead
+        source.close();
+        if (!finished) {
+            finished = true;
+            fetchStockScore(ticker, resultsContainer, loadingIndicator);
+        }
+    };
+}
+
+function verdictStyle(summary) {
+    return {
+        icon: summary.overall_verdict === 'BULLISH' ? '📈' :
+              summary.overall_verdict === 'BEARISH' ? '📉' : '➡️',
+        color: summary.overall_verdict === 'BULLISH' ? '#28a745' :
+               summary.overall_verdict === 'BEARISH' ? '#dc3545' : '#ffc107'
+    };
+}
+
+// Verdict box in the header card; shows a placeholder until the consolidated summary arrives
+function renderVerdictBox(summary) {
+    if (!summary) {
+        return `
+                    <div style="text-align: right; min-width: 200px;">
+                        <div style="background: rgba(255,255,255,0.2);
+                                    padding: 20px;
+                                    border-radius: 12px;
+                                    backdrop-filter: blur(10px);">
+                            <div style="font-size: 14px; opacity: 0.9; margin-bottom: 8px;">AI Verdict</div>
+                            <div style="font-size: 18px; font-weight: 600;">Analyzing...</div>
+                        </div>
+                    </div>`;
+    }
+    return `
+                    <div style="text-align: right; min-width: 200px;">
+                        <div style="background: rgba(255,255,255,0.2);
+                                    padding: 20px;
+                                    border-radius: 12px;
+                                    backdrop-filter: blur(10px);">
+                            <div style="font-size: 14px; opacity: 0.9; margin-bottom: 8px;">AI Verdict</div>
+                            <div style="font-size: 36px; margin-bottom: 5px;">${verdictStyle(summary).icon}</div>
+                            <div style="font-size: 24px; font-weight: 700;">${summary.overall_verdict}</div>
+                            <div style="font-size: 18px; margin-top: 10px; padding-top: 10px; border-top: 1px solid rgba(255,255,255,0.3);">
+                                ${summary.recommendation}
+                            </div>
+                        </div>
+                    </div>`;
+}
 
+function renderStockHeader(data, summary) {
+    return `
             <!-- Stock Header Card -->
             <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
                         padding: 30px;
@@ -212,59 +293,51 @@ function displayStockScoreResults(data) {
                             <div style="font-size: 14px; opacity: 0.85;">as of ${new Date(data.last_updated).toLocaleString()}</div>
                         </div>
                     </div>
-                    <div style="text-align: right; min-width: 200px;">
-                        <div style="background: rgba(255,255,255,0.2);
-                                    padding: 20px;
-                                    border-radius: 12px;
-                                    backdrop-filter: blur(10px);">
-                            <div style="font-size: 14px; opacity: 0.9; margin-bottom: 8px;">AI Verdict</div>
-                            <div style="font-size: 36px; margin-bottom: 5px;">${verdictIcon}</div>
-                            <div style="font-size: 24px; font-weight: 700;">${data.consolidated_summary.overall_verdict}</div>
-                            <div style="font-size: 18px; margin-top: 10px; padding-top: 10px; border-top: 1px solid rgba(255,255,255,0.3);">
-                                ${data.consolidated_summary.recommendation}
-                            </div>
-                        </div>
-                    </div>
+                    ${renderVerdictBox(summary)}
                 </div>
-            </div>
+            </div>`;
+}
 
+function renderConsolidatedSections(summary) {
+    const style = verdictStyle(summary);
+    return `
             <!-- Quick Stats Grid -->
             <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-bottom: 30px;">
                 <div style="background: white; padding: 25px; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); border-left: 4px solid #28a745;">
                     <div style="font-size: 14px; color: #666; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">Positive Signals</div>
-                    <div style="font-size: 42px; font-weight: 700; color: #28a745;">${data.consolidated_summary.positive_signals}</div>
+                    <div style="font-size: 42px; font-weight: 700; color: #28a745;">${summary.positive_signals}</div>
                     <div style="font-size: 12px; color: #999; margin-top: 5px;">AI models detecting bullish trends</div>
                 </div>
                 <div style="background: white; padding: 25px; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); border-left: 4px solid #dc3545;">
                     <div style="font-size: 14px; color: #666; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">Negative Signals</div>
-                    <div style="font-size: 42px; font-weight: 700; color: #dc3545;">${data.consolidated_summary.negative_signals}</div>
+                    <div style="font-size: 42px; font-weight: 700; color: #dc3545;">${summary.negative_signals}</div>
                     <div style="font-size: 12px; color: #999; margin-top: 5px;">AI models detecting bearish trends</div>
                 </div>
                 <div style="background: white; padding: 25px; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); border-left: 4px solid #667eea;">
                     <div style="font-size: 14px; color: #666; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">Confidence</div>
-                    <div style="font-size: 32px; font-weight: 700; color: #667eea;">${data.consolidated_summary.confidence}</div>
+                    <div style="font-size: 32px; font-weight: 700; color: #667eea;">${summary.confidence}</div>
                     <div style="font-size: 12px; color: #999; margin-top: 5px;">AI consensus strength</div>
                 </div>
                 <div style="background: white; padding: 25px; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); border-left: 4px solid #17a2b8;">
                     <div style="font-size: 14px; color: #666; margin-bottom: 8px; text-transform: uppercase; letter-spacing: 0.5px;">30-Day Outlook</div>
-                    <div style="font-size: 18px; font-weight: 700; color: #17a2b8; line-height: 1.3;">${data.consolidated_summary.price_outlook}</div>
+                    <div style="font-size: 18px; font-weight: 700; color: #17a2b8; line-height: 1.3;">${summary.price_outlook}</div>
                     <div style="font-size: 12px; color: #999; margin-top: 5px;">Predicted price range</div>
                 </div>
             </div>
 
             <!-- Action Statement Card -->
-            <div style="background: ${verdictColor};
+            <div style="background: ${style.color};
                         color: white;
                         padding: 25px;
                         border-radius: 12px;
                         margin-bottom: 30px;
                         box-shadow: 0 4px 12px rgba(0,0,0,0.15);">
                 <div style="display: flex; align-items: center; gap: 15px; margin-bottom: 12px;">
-                    <div style="font-size: 32px;">${verdictIcon}</div>
+                    <div style="font-size: 32px;">${style.icon}</div>
                     <div style="font-size: 20px; font-weight: 700;">Recommended Action</div>
                 </div>
                 <div style="font-size: 18px; line-height: 1.6; font-weight: 500;">
-                    ${data.consolidated_summary.action_statement}
+                    ${summary.action_statement}
                 </div>
             </div>
 
@@ -344,23 +417,13 @@ function displayStockScoreResults(data) {
                      style="padding: 40px;
                             background: linear-gradient(to bottom, #f8f9fa 0%, white 100%);
                             font-size: 15px;">
-                    ${formatSummaryWithHighlights(data.consolidated_summary.summary)}
+                    ${formatSummaryWithHighlights(summary.summary)}
                 </div>
-            </div>
-
-            <style>
-                @keyframes pulse {
-                    0%, 100% { transform: scale(1); opacity: 0.1; }
-                    50% { transform: scale(1.1); opacity: 0.15; }
-                }
-            </style>
-
-            <!-- Individual Model Analysis Header -->
-            <div style="background: #f8f9fa; padding: 20px; border-radius: 12px; margin-bottom: 20px; border-left: 4px solid #667eea;">
-                <h3 style="margin: 0 0 10px 0; color: #667eea; font-size: 20px;">📊 Detailed Model Breakdown</h3>
-                <p style="color: #666; margin: 0; line-height: 1.6;">Click on each model below to view detailed analysis. Each AI model specializes in different aspects of financial analysis.</p>
-            </div>
+            </div>`;
+}
 
+function renderFinGPTSection(analysis) {
+    return `
             <!-- FinGPT (Collapsible) -->
             <div style="background: white; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 15px; overflow: hidden;">
                 <div onclick="toggleSection('fingpt-details')"
@@ -369,14 +432,14 @@ function displayStockScoreResults(data) {
                             display: flex;
                             justify-content: space-between;
                             align-items: center;
-                            background: linear-gradient(90deg, ${data.fingpt_analysis.sentiment === 'positive' ? '#d4edda' : data.fingpt_analysis.sentiment === 'negative' ? '#f8d7da' : '#fff3cd'} 0%, white 50%);
-                            border-left: 4px solid ${data.fingpt_analysis.sentiment === 'positive' ? '#28a745' : data.fingpt_analysis.sentiment === 'negative' ? '#dc3545' : '#ffc107'};
+                            background: linear-gradient(90deg, ${analysis.sentiment === 'positive' ? '#d4edda' : analysis.sentiment === 'negative' ? '#f8d7da' : '#fff3cd'} 0%, white 50%);
+                            border-left: 4px solid ${analysis.sentiment === 'positive' ? '#28a745' : analysis.sentiment === 'negative' ? '#dc3545' : '#ffc107'};
                             user-select: none;">
                     <div style="display: flex; align-items: center; gap: 15px; flex: 1;">
                         <div style="font-size: 36px;">📊</div>
                         <div>
                             <div style="font-size: 18px; font-weight: 700; color: #333; margin-bottom: 4px;">FinGPT - Sentiment Analysis</div>
-                            <div style="font-size: 14px; color: #666;">Sentiment: <strong style="color: ${data.fingpt_analysis.sentiment === 'positive' ? '#28a745' : data.fingpt_analysis.sentiment === 'negative' ? '#dc3545' : '#856404'};">${data.fingpt_analysis.sentiment.toUpperCase()}</strong> (${(data.fingpt_analysis.confidence * 100).toFixed(1)}% confidence)</div>
+                            <div style="font-size: 14px; color: #666;">Sentiment: <strong style="color: ${analysis.sentiment === 'positive' ? '#28a745' : analysis.sentiment === 'negative' ? '#dc3545' : '#856404'};">${analysis.sentiment.toUpperCase()}</strong> (${(analysis.confidence * 100).toFixed(1)}% confidence)</div>
                         </div>
                     </div>
                     <div id="fingpt-details-icon" style="font-size: 20px; transition: transform 0.3s;">▶</div>
@@ -384,15 +447,18 @@ function displayStockScoreResults(data) {
                 <div id="fingpt-details" style="display: none; padding: 25px; background: #fafbfc; border-top: 1px solid #e9ecef;">
                     <div style="margin-bottom: 20px;">
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">💹 Price Movement Prediction</div>
-                        <div style="color: #333; line-height: 1.6;">${data.fingpt_analysis.price_prediction}</div>
+                        <div style="color: #333; line-height: 1.6;">${analysis.price_prediction}</div>
                     </div>
                     <div>
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">📝 Detailed Analysis</div>
-                        <div style="color: #555; line-height: 1.7;">${data.fingpt_analysis.summary}</div>
+                        <div style="color: #555; line-height: 1.7;">${analysis.summary}</div>
                     </div>
                 </div>
-            </div>
+            </div>`;
+}
 
+function renderFinBERTSection(analysis) {
+    return `
             <!-- FinBERT (Collapsible) -->
             <div style="background: white; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 15px; overflow: hidden;">
                 <div onclick="toggleSection('finbert-details')"
@@ -401,14 +467,14 @@ function displayStockScoreResults(data) {
                             display: flex;
                             justify-content: space-between;
                             align-items: center;
-                            background: linear-gradient(90deg, ${data.finbert_analysis.sentiment === 'positive' ? '#d4edda' : data.finbert_analysis.sentiment === 'negative' ? '#f8d7da' : '#fff3cd'} 0%, white 50%);
-                            border-left: 4px solid ${data.finbert_analysis.sentiment === 'positive' ? '#28a745' : data.finbert_analysis.sentiment === 'negative' ? '#dc3545' : '#ffc107'};
+                            background: linear-gradient(90deg, ${analysis.sentiment === 'positive' ? '#d4edda' : analysis.sentiment === 'negative' ? '#f8d7da' : '#fff3cd'} 0%, white 50%);
+                            border-left: 4px solid ${analysis.sentiment === 'positive' ? '#28a745' : analysis.sentiment === 'negative' ? '#dc3545' : '#ffc107'};
                             user-select: none;">
                     <div style="display: flex; align-items: center; gap: 15px; flex: 1;">
                         <div style="font-size: 36px;">📰</div>
                         <div>
                             <div style="font-size: 18px; font-weight: 700; color: #333; margin-bottom: 4px;">FinBERT - News Classification</div>
-                            <div style="font-size: 14px; color: #666;">News Sentiment: <strong style="color: ${data.finbert_analysis.sentiment === 'positive' ? '#28a745' : data.finbert_analysis.sentiment === 'negative' ? '#dc3545' : '#856404'};">${data.finbert_analysis.sentiment.toUpperCase()}</strong> (${(data.finbert_analysis.score * 100).toFixed(1)}% confidence)</div>
+                            <div style="font-size: 14px; color: #666;">News Sentiment: <strong style="color: ${analysis.sentiment === 'positive' ? '#28a745' : analysis.sentiment === 'negative' ? '#dc3545' : '#856404'};">${analysis.sentiment.toUpperCase()}</strong> (${(analysis.score * 100).toFixed(1)}% confidence)</div>
                         </div>
                     </div>
                     <div id="finbert-details-icon" style="font-size: 20px; transition: transform 0.3s;">▶</div>
@@ -416,15 +482,18 @@ function displayStockScoreResults(data) {
                 <div id="finbert-details" style="display: none; padding: 25px; background: #fafbfc; border-top: 1px solid #e9ecef;">
                     <div style="margin-bottom: 20px;">
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">📊 Impact Assessment</div>
-                        <div style="color: #333; line-height: 1.6;">${data.finbert_analysis.impact}</div>
+                        <div style="color: #333; line-height: 1.6;">${analysis.impact}</div>
                     </div>
                     <div>
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">🔍 Key Findings</div>
-                        <div style="color: #555; line-height: 1.7;">${data.finbert_analysis.findings}</div>
+                        <div style="color: #555; line-height: 1.7;">${analysis.findings}</div>
                     </div>
                 </div>
-            </div>
+            </div>`;
+}
 
+function renderFinLLMSection(decision) {
+    return `
             <!-- FinLLM (Collapsible) -->
             <div style="background: white; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 15px; overflow: hidden;">
                 <div onclick="toggleSection('finllm-details')"
@@ -433,14 +502,14 @@ function displayStockScoreResults(data) {
                             display: flex;
                             justify-content: space-between;
                             align-items: center;
-                            background: linear-gradient(90deg, ${data.finllm_decision.recommendation === 'BUY' ? '#d4edda' : data.finllm_decision.recommendation === 'SELL' ? '#f8d7da' : '#fff3cd'} 0%, white 50%);
-                            border-left: 4px solid ${data.finllm_decision.recommendation === 'BUY' ? '#28a745' : data.finllm_decision.recommendation === 'SELL' ? '#dc3545' : '#ffc107'};
+                            background: linear-gradient(90deg, ${decision.recommendation === 'BUY' ? '#d4edda' : decision.recommendation === 'SELL' ? '#f8d7da' : '#fff3cd'} 0%, white 50%);
+                            border-left: 4px solid ${decision.recommendation === 'BUY' ? '#28a745' : decision.recommendation === 'SELL' ? '#dc3545' : '#ffc107'};
                             user-select: none;">
                     <div style="display: flex; align-items: center; gap: 15px; flex: 1;">
                         <div style="font-size: 36px;">💼</div>
                         <div>
                             <div style="font-size: 18px; font-weight: 700; color: #333; margin-bottom: 4px;">FinLLM - Investment Decision</div>
-                            <div style="font-size: 14px; color: #666;">Recommendation: <strong style="color: ${data.finllm_decision.recommendation === 'BUY' ? '#28a745' : data.finllm_decision.recommendation === 'SELL' ? '#dc3545' : '#856404'};">${data.finllm_decision.recommendation}</strong> (${data.finllm_decision.confidence} confidence)</div>
+                            <div style="font-size: 14px; color: #666;">Recommendation: <strong style="color: ${decision.recommendation === 'BUY' ? '#28a745' : decision.recommendation === 'SELL' ? '#dc3545' : '#856404'};">${decision.recommendation}</strong> (${decision.confidence} confidence)</div>
                         </div>
                     </div>
                     <div id="finllm-details-icon" style="font-size: 20px; transition: transform 0.3s;">▶</div>
@@ -448,19 +517,22 @@ function displayStockScoreResults(data) {
                 <div id="finllm-details" style="display: none; padding: 25px; background: #fafbfc; border-top: 1px solid #e9ecef;">
                     <div style="margin-bottom: 20px;">
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">💡 Investment Rationale</div>
-                        <div style="color: #333; line-height: 1.6;">${data.finllm_decision.rationale}</div>
+                        <div style="color: #333; line-height: 1.6;">${decision.rationale}</div>
                     </div>
                     <div style="margin-bottom: 20px;">
                         <div style="font-weight: 600; color: #dc3545; margin-bottom: 8px;">⚠️ Risk Factors</div>
-                        <div style="color: #555; line-height: 1.7;">${data.finllm_decision.risks}</div>
+                        <div style="color: #555; line-height: 1.7;">${decision.risks}</div>
                     </div>
                     <div>
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">⏰ Time Horizon</div>
-                        <div style="color: #555;">${data.finllm_decision.time_horizon}</div>
+                        <div style="color: #555;">${decision.time_horizon}</div>
                     </div>
                 </div>
-            </div>
+            </div>`;
+}
 
+function renderFinMASection(prediction) {
+    return `
             <!-- FinMA (Collapsible) -->
             <div style="background: white; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 15px; overflow: hidden;">
                 <div onclick="toggleSection('finma-details')"
@@ -469,36 +541,112 @@ function displayStockScoreResults(data) {
                             display: flex;
                             justify-content: space-between;
                             align-items: center;
-                            background: linear-gradient(90deg, ${data.finma_prediction.movement_direction === 'Upward' ? '#d4edda' : data.finma_prediction.movement_direction === 'Downward' ? '#f8d7da' : '#e7f3ff'} 0%, white 50%);
-                            border-left: 4px solid ${data.finma_prediction.movement_direction === 'Upward' ? '#28a745' : data.finma_prediction.movement_direction === 'Downward' ? '#dc3545' : '#17a2b8'};
+                            background: linear-gradient(90deg, ${prediction.movement_direction === 'Upward' ? '#d4edda' : prediction.movement_direction === 'Downward' ? '#f8d7da' : '#e7f3ff'} 0%, white 50%);
+                            border-left: 4px solid ${prediction.movement_direction === 'Upward' ? '#28a745' : prediction.movement_direction === 'Downward' ? '#dc3545' : '#17a2b8'};
                             user-select: none;">
                     <div style="display: flex; align-items: center; gap: 15px; flex: 1;">
                         <div style="font-size: 36px;">📈</div>
                         <div>
                             <div style="font-size: 18px; font-weight: 700; color: #333; margin-bottom: 4px;">Open FinMA - Stock Movement Prediction</div>
-                            <div style="font-size: 14px; color: #666;">Direction: <strong style="color: ${data.finma_prediction.movement_direction === 'Upward' ? '#28a745' : data.finma_prediction.movement_direction === 'Downward' ? '#dc3545' : '#17a2b8'};">${data.finma_prediction.movement_direction}</strong> (${(data.finma_prediction.confidence_score * 100).toFixed(1)}% confidence)</div>
+                            <div style="font-size: 14px; color: #666;">Direction: <strong style="color: ${prediction.movement_direction === 'Upward' ? '#28a745' : prediction.movement_direction === 'Downward' ? '#dc3545' : '#17a2b8'};">${prediction.movement_direction}</strong> (${(prediction.confidence_score * 100).toFixed(1)}% confidence)</div>
                         </div>
                     </div>
                     <div id="finma-details-icon" style="font-size: 20px; transition: transform 0.3s;">▶</div>
                 </div>
                 <div id="finma-details" style="display: none; padding: 25px; background: #fafbfc; border-top: 1px solid #e9ecef;">
                     <div style="margin-bottom: 20px;">
-                        <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">🎯 Price Target Range (${data.finma_prediction.timeframe})</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #17a2b8;">$${data.finma_prediction.price_target_low} - $${data.finma_prediction.price_target_high}</div>
+                        <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">🎯 Price Target Range (${prediction.timeframe})</div>
+                        <div style="font-size: 24px; font-weight: 700; color: #17a2b8;">$${prediction.price_target_low} - $${prediction.price_target_high}</div>
                     </div>
                     <div style="margin-bottom: 20px;">
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">📊 Key Technical Factors</div>
-                        <div style="color: #555; line-height: 1.7;">${data.finma_prediction.key_factors}</div>
+                        <div style="color: #555; line-height: 1.7;">${prediction.key_factors}</div>
                     </div>
                     <div>
                         <div style="font-weight: 600; color: #667eea; margin-bottom: 8px;">📉 Volatility Assessment</div>
-                        <div style="color: #555; line-height: 1.7;">${data.finma_prediction.volatility_assessment}</div>
+                        <div style="color: #555; line-height: 1.7;">${prediction.volatility_assessment}</div>
                     </div>
                 </div>
+            </div>`;
+}
+
+// Placeholder card for a section that is still being computed
+function renderPendingSection(title) {
+    return `
+            <div style="background: white; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 15px; padding: 20px; color: #999;">
+                <div style="font-size: 18px; font-weight: 700; color: #bbb; margin-bottom: 4px;">${title}</div>
+                <div style="font-size: 14px;">Analyzing...</div>
+            </div>`;
+}
+
+// Peer alternatives shown while the consolidated summary (which includes them) is pending
+function renderPeerSection(peers) {
+    if (!peers || !peers.has_alternatives) {
+        return '';
+    }
+    const names = peers.alternatives.map(peer => `<strong>${peer.ticker}</strong>`).join(', ');
+    return `
+            <div style="background: #f8f9fa; padding: 20px; border-radius: 12px; margin-bottom: 30px; border-left: 4px solid #17a2b8;">
+                <div style="color: #333;">🏭 Stronger peers in ${peers.industry || peers.sector}: ${names}</div>
+            </div>`;
+}
+
+const STOCKSCORE_SECTIONS = {
+    fingpt_analysis: { slot: 'fingpt', render: renderFinGPTSection },
+    finbert_analysis: { slot: 'finbert', render: renderFinBERTSection },
+    finllm_decision: { slot: 'finllm', render: renderFinLLMSection },
+    finma_prediction: { slot: 'finma', render: renderFinMASection },
+    industry_alternatives: { slot: 'peers', render: renderPeerSection },
+    consolidated_summary: { slot: 'consolidated', render: renderConsolidatedSections }
+};
+
+// Page skeleton with one slot per section, pre-filled with whatever is already known
+function renderStockScoreLayout(data) {
+    const summary = data.consolidated_summary;
+    return `
+        <div style="max-width: 1200px; margin: 30px auto;">
+            <div id="stockscore-slot-header">${renderStockHeader(data, summary)}</div>
+            <div id="stockscore-slot-peers"></div>
+            <div id="stockscore-slot-consolidated">${summary ? renderConsolidatedSections(summary) : renderPendingSection('🤖 AI Consensus Analysis')}</div>
+
+            <style>
+                @keyframes pulse {
+                    0%, 100% { transform: scale(1); opacity: 0.1; }
+                    50% { transform: scale(1.1); opacity: 0.15; }
+                }
+            </style>
+
+            <!-- Individual Model Analysis Header -->
+            <div style="background: #f8f9fa; padding: 20px; border-radius: 12px; margin-bottom: 20px; border-left: 4px solid #667eea;">
+                <h3 style="margin: 0 0 10px 0; color: #667eea; font-size: 20px;">📊 Detailed Model Breakdown</h3>
+                <p style="color: #666; margin: 0; line-height: 1.6;">Click on each model below to view detailed analysis. Each AI model specializes in different aspects of financial analysis.</p>
             </div>
 
+            <div id="stockscore-slot-fingpt">${data.fingpt_analysis ? renderFinGPTSection(data.fingpt_analysis) : renderPendingSection('📊 FinGPT - Sentiment Analysis')}</div>
+            <div id="stockscore-slot-finbert">${data.finbert_analysis ? renderFinBERTSection(data.finbert_analysis) : renderPendingSection('📰 FinBERT - News Classification')}</div>
+            <div id="stockscore-slot-finllm">${data.finllm_decision ? renderFinLLMSection(data.finllm_decision) : renderPendingSection('💼 FinLLM - Investment Decision')}</div>
+            <div id="stockscore-slot-finma">${data.finma_prediction ? renderFinMASection(data.finma_prediction) : renderPendingSection('📈 Open FinMA - Stock Movement Prediction')}</div>
         </div>
     `;
+}
+
+// Fill one slot when its section arrives over the stream
+function displayStockScoreSection(data, name, section) {
+    const entry = STOCKSCORE_SECTIONS[name];
+    if (!entry) return;
 
-    container.innerHTML = html;
+    const slot = document.getElementById('stockscore-slot-' + entry.slot);
+    if (slot) {
+        slot.innerHTML = entry.render(section);
+    }
+    if (name === 'consolidated_summary') {
+        // The summary already lists the alternatives, and carries the verdict for the header
+        document.getElementById('stockscore-slot-peers').innerHTML = '';
+        document.getElementById('stockscore-slot-header').innerHTML = renderStockHeader(data, section);
+    }
+}
+
+function displayStockScoreResults(data) {
+    const container = document.getElementById('stockScoreResults');
+    container.innerHTML = renderStockScoreLayout(data);
 }
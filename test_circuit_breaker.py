@@ -0,0 +1,63 @@
+"""
+Tests for the inference circuit breaker (no network access needed).
+"""
+
+import sys
+import time
+from circuit_breaker import CircuitBreaker, CircuitOpenError, OPEN, CLOSED
+
+
+def failing(message):
+    def call():
+        raise Exception(message)
+    return call
+
+
+def expect_open(breaker):
+    try:
+        breaker.call(lambda: 'called')
+    except CircuitOpenError as e:
+        return str(e)
+    raise AssertionError("call went through an open circuit")
+
+
+def test_cold_start_opens_immediately_and_probes():
+    """A loading response opens the circuit for the estimated time, then one probe closes it"""
+    breaker = CircuitBreaker('model', failure_threshold=3, cold_start_timeout=20)
+    try:
+        breaker.call(failing('503: {"error":"Model is currently loading","estimated_time":1.0}'))
+    except Exception:
+        pass
+
+    assert breaker.state == OPEN and breaker.cold
+    assert 'loading' in expect_open(breaker)
+
+    time.sleep(1.05)
+    assert breaker.call(lambda: 'ok') == 'ok'
+    assert breaker.state == CLOSED and breaker.stats()['cold_starts'] == 1
+    print("✓ Cold start fails fast, half-open probe closes the circuit")
+
+
+def test_failures_trip_after_threshold():
+    """Ordinary errors open the circuit only after consecutive failures"""
+    breaker = CircuitBreaker('model', failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+        try:
+            breaker.call(failing('Connection reset'))
+        except Exception as e:
+            assert not isinstance(e, CircuitOpenError)
+
+    message = expect_open(breaker)
+    assert 'loading' not in message and breaker.stats()['rejected'] == 1
+    print("✓ Failure threshold opens the circuit")
+
+
+def main():
+    test_cold_start_opens_immediately_and_probes()
+    test_failures_trip_after_threshold()
+    print("\nAll circuit breaker tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
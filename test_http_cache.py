@@ -0,0 +1,75 @@
+"""
+Tests for ETag / conditional GET handling (no network access needed).
+"""
+
+import sys
+from flask import Flask, jsonify, request
+import http_cache
+from json_response import ResponseCompressor
+
+
+def make_app():
+    app = Flask(__name__)
+    compressor = ResponseCompressor(min_bytes=64)
+
+    @app.after_request
+    def finalize_response(response):
+        return compressor(http_cache.finalize(response, request))
+
+    @app.route('/data')
+    def data():
+        return http_cache.cache_response(jsonify({'values': list(range(100))}), 60)
+
+    @app.route('/versioned')
+    def versioned():
+        etag = 'snapshot-v3'
+        matched = http_cache.matched_etag(etag, request.if_none_match)
+        if matched is not None:
+            return http_cache.not_modified(app.response_class, matched, 30)
+        return http_cache.cache_response(jsonify({'version': 3}), 30, etag)
+
+    @app.route('/missing')
+    def missing():
+        return jsonify({'success': False}), 404
+
+    return app
+
+
+def test_content_etag_round_trip():
+    """Body-hash ETags revalidate to an empty 304, also for compressed representations"""
+    client = make_app().test_client()
+
+    first = client.get('/data')
+    etag = first.headers['ETag']
+    assert first.headers['Cache-Control'] == 'public, max-age=60, s-maxage=60'
+    assert client.get('/data', headers={'If-None-Match': etag}).status_code == 304
+
+    gzipped = client.get('/data', headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.headers['ETag'] != etag and gzipped.headers['ETag'].endswith('-gzip"')
+    revalidated = client.get('/data', headers={'Accept-Encoding': 'gzip', 'If-None-Match': gzipped.headers['ETag']})
+    assert revalidated.status_code == 304 and revalidated.data == b''
+    assert revalidated.headers['ETag'] == gzipped.headers['ETag']
+    print("✓ Content ETags and 304s")
+
+
+def test_versioned_etag_and_errors():
+    """Snapshot ETags short-circuit the route; errors are not stored"""
+    client = make_app().test_client()
+
+    response = client.get('/versioned', headers={'If-None-Match': '"snapshot-v2", "snapshot-v3"'})
+    assert response.status_code == 304 and response.headers['ETag'] == '"snapshot-v3"'
+    assert client.get('/versioned', headers={'If-None-Match': '"snapshot-v2"'}).status_code == 200
+
+    assert client.get('/missing').headers['Cache-Control'] == 'no-store'
+    print("✓ Snapshot ETags and uncached errors")
+
+
+def main():
+    test_content_etag_round_trip()
+    test_versioned_etag_and_errors()
+    print("\nAll HTTP cache tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Tests for the pooled keep-alive HTTP session against a local server (no network access needed).
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http_pool import PooledSession
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.reply(b'ok')
+
+    def do_POST(self):
+        self.reply(self.rfile.read(int(self.headers['Content-Length'])))
+
+    def reply(self, payload):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_session_is_reused_and_counted():
+    """Calls share one session and one warm connection; stats count requests and reuse"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    pool = PooledSession('test', pool_connections=2, pool_maxsize=4)
+
+    try:
+        before = pool.stats()
+        assert not before['created'] and before['requests'] == 0 and before['hosts'] == 0
+
+        assert pool.get(f"{base}/a", timeout=5).text == 'ok'
+        session = pool.session
+        assert pool.post(f"{base}/b", data=b'payload', timeout=5).content == b'payload'
+        assert pool.get(f"{base}/c", timeout=5).status_code == 200
+        assert pool.session is session
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    stats = pool.stats()
+    assert stats['created'] and stats['hosts'] == 1
+    assert (stats['pool_connections'], stats['pool_maxsize']) == (2, 4)
+    assert stats['requests'] == 3 and stats['new_connections'] == 1 and stats['reused_connections'] == 2
+    print("✓ Pooled session is reused and counted")
+
+
+def main():
+    test_session_is_reused_and_counted()
+    print("\nAll HTTP pool tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
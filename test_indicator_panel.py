@@ -0,0 +1,95 @@
+"""
+Parity test for the vectorized indicator panel.
+Compares IndicatorPanel output with the per-ticker calculate_technical_indicators
+on synthetic histories (no network access needed).
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from prediction_engine import StockPredictionEngine
+from indicator_panel import IndicatorPanel, INDICATOR_COLUMNS
+
+
+# pandas' online rolling std leaves ~1e-8 relative roundoff on flat windows
+# where the exact two-pass result is 0, so compare at that precision
+RTOL = 1e-7
+ATOL = 1e-6
+
+
+def make_history(seed, periods, end='2024-06-28'):
+    """Random-walk OHLCV history ending on the same session for every ticker"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=end, periods=periods, tz='America/New_York')
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+    # A flat stretch exercises zero-loss RSI windows and zero-width bands
+    if periods > 120:
+        close[60:90] = close[60]
+    volume = rng.integers(1_000_000, 5_000_000, periods).astype(float)
+    return pd.DataFrame({
+        'Open': close,
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': volume
+    }, index=index)
+
+
+def make_universe():
+    # Mixed lengths: full year, shorter than SMA_200, just enough, too short
+    lengths = {'AAA': 252, 'BBB': 252, 'CCC': 180, 'DDD': 60, 'EEE': 50, 'FFF': 30}
+    return {ticker: make_history(i, n) for i, (ticker, n) in enumerate(lengths.items())}
+
+
+def test_panel_matches_per_ticker_indicators():
+    """Panel indicators equal the per-ticker pandas implementation"""
+    engine = StockPredictionEngine()
+    histories = make_universe()
+    panel = IndicatorPanel(histories)
+
+    for ticker, hist in histories.items():
+        expected = engine.calculate_technical_indicators(hist.copy())
+        actual = panel.frame(ticker)
+
+        if expected is None:
+            assert actual is None, f"{ticker}: panel should skip short histories"
+            continue
+
+        assert list(actual.columns) == list(expected.columns), f"{ticker}: column mismatch"
+        assert actual.index.equals(expected.index), f"{ticker}: index mismatch"
+        for column in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(
+                actual[column].to_numpy(), expected[column].to_numpy(),
+                rtol=RTOL, atol=ATOL, equal_nan=True,
+                err_msg=f"{ticker} {column}"
+            )
+        print(f"✓ {ticker}: {len(INDICATOR_COLUMNS)} indicators match")
+
+
+def test_panel_handles_interior_gaps():
+    """A missing session for one ticker is handled like pandas does"""
+    engine = StockPredictionEngine()
+    histories = make_universe()
+    histories['AAA'] = histories['AAA'].drop(histories['AAA'].index[100])
+    panel = IndicatorPanel(histories)
+
+    expected = engine.calculate_technical_indicators(histories['AAA'].copy())
+    actual = panel.frame('AAA')
+    for column in INDICATOR_COLUMNS:
+        np.testing.assert_allclose(
+            actual[column].to_numpy(), expected[column].to_numpy(),
+            rtol=RTOL, atol=ATOL, equal_nan=True,
+            err_msg=f"AAA {column}"
+        )
+    print("✓ Interior gap handled")
+
+
+def main():
+    test_panel_matches_per_ticker_indicators()
+    test_panel_handles_interior_gaps()
+    print("\nAll indicator panel tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
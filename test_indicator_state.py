@@ -0,0 +1,130 @@
+"""
+Tests for the incremental indicator state.
+Checks streaming updates, partial-bar revisions and save/restore against
+calculate_technical_indicators on synthetic histories (no network access needed).
+"""
+
+import sys
+import json
+import tempfile
+import numpy as np
+import pandas as pd
+from prediction_engine import StockPredictionEngine
+from indicator_state import IndicatorState, IndicatorStateStore
+from indicator_panel import INDICATOR_COLUMNS
+from ohlcv_store import OHLCVStore
+from test_indicator_panel import make_history, RTOL, ATOL
+
+
+def assert_matches(state, hist, label):
+    expected = StockPredictionEngine.calculate_technical_indicators(None, hist.copy()).iloc[-1]
+    actual = state.latest()
+    for column in INDICATOR_COLUMNS:
+        np.testing.assert_allclose(actual[column], expected[column], rtol=RTOL, atol=ATOL,
+                                   equal_nan=True, err_msg=f"{label} {column}")
+
+
+def test_streaming_matches_full_recompute():
+    """Appending bars one at a time tracks the full pandas recompute"""
+    hist = make_history(0, 300)
+    state = IndicatorState()
+    for i, (timestamp, row) in enumerate(hist.iterrows(), start=1):
+        state.update(timestamp, row['Close'], row['Volume'])
+        if i >= 50 and i % 10 == 0:
+            assert_matches(state, hist.iloc[:i], f"bar {i}")
+    print(f"✓ {len(hist)} streamed bars match full recompute")
+
+
+def test_revision_and_round_trip():
+    """A repeated timestamp revises the last bar; state survives JSON round trips"""
+    hist = make_history(1, 260)
+    state = IndicatorState.from_history(hist.iloc[:-1])
+
+    revised = hist.copy()
+    revised.iloc[-1, revised.columns.get_loc('Close')] *= 1.05
+    state.update(hist.index[-1], hist['Close'].iloc[-1], hist['Volume'].iloc[-1])
+    state.update(revised.index[-1], revised['Close'].iloc[-1], revised['Volume'].iloc[-1])
+    assert state.bars == len(hist)
+    assert_matches(state, revised, "revised")
+
+    restored = IndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+    assert_matches(restored, revised, "restored")
+    print("✓ Partial-bar revision and JSON round trip")
+
+
+def test_state_store_applies_only_new_bars():
+    """The state store persists states and catches up with stored bars"""
+    hist = make_history(2, 260)
+    store = OHLCVStore(root=tempfile.mkdtemp(), history_period='max')  # fixed-date history, no trimming
+    store._merge('AAA', hist.iloc[:-3])
+
+    states = IndicatorStateStore(store)
+    states.get('AAA')
+    assert states.stats['rebuilds'] == 1
+
+    store._merge('AAA', hist.iloc[-4:])
+    # A fresh instance stands in for a restart: it resumes from indicators.json
+    restarted = IndicatorStateStore(store)
+    state = restarted.get('AAA')
+    assert restarted.stats['rebuilds'] == 0 and restarted.stats['bars_applied'] == 4
+    assert_matches(state, hist, "store")
+    print("✓ State store resumes from disk and applies only new bars")
+
+
+def test_state_store_appends_to_trimmed_history():
+    """A new session on a store trimmed to 1y is applied incrementally; re-adjusted prices force a rebuild"""
+    hist = make_history(3, 300, end=pd.Timestamp.today().strftime('%Y-%m-%d'))
+    store = OHLCVStore(root=tempfile.mkdtemp())  # default 1y history, trimmed on every merge
+    store._merge('AAA', hist.iloc[:-1])
+    assert len(store.load('AAA')) < len(hist) - 1
+    states = IndicatorStateStore(store)
+    states.get('AAA')
+
+    # The next session drops the oldest stored bar; the state keeps going incrementally
+    stored = store.load('AAA')
+    store._merge('AAA', pd.concat([stored.iloc[1:], hist.iloc[-1:]]), replace=True)
+    state = states.get('AAA')
+    assert states.stats['rebuilds'] == 1 and states.stats['incremental_updates'] == 1
+    assert_matches(state, pd.concat([stored, hist.iloc[-1:]]), "appended")
+
+    split = store.load('AAA').copy()
+    split[['Open', 'High', 'Low', 'Close']] /= 2
+    store._merge('AAA', split, replace=True)
+    assert_matches(states.get('AAA'), split, "re-adjusted")
+    assert states.stats['rebuilds'] == 2
+    print("✓ State store appends to trimmed history and rebuilds after re-adjustment")
+
+
+class StaticFundamentals:
+    def get(self, ticker):
+        return {'longName': ticker, 'forwardPE': 18.0, 'profitMargins': 0.2, 'returnOnEquity': 0.25}
+
+
+def test_single_stock_analysis_uses_indicator_state():
+    """Store-backed analysis scores the state's latest row and matches the full recompute"""
+    hist = make_history(4, 240, end=pd.Timestamp.today().strftime('%Y-%m-%d'))
+    store = OHLCVStore(root=tempfile.mkdtemp(), max_age=3600)
+    store._merge('AAA', hist)
+    engine = StockPredictionEngine(store=store, fundamentals=StaticFundamentals())
+
+    result = engine.analyze_single_stock('AAA')
+    expected = engine.analyze_single_stock('AAA', hist=store.get_history('AAA', refresh=False))
+    assert engine.indicator_states.stats['rebuilds'] == 1
+    for key in ('prediction_score', 'score_breakdown', 'reasons', 'current_price',
+                'short_term', 'mid_term', 'long_term'):
+        assert result[key] == expected[key], key
+    print("✓ Single-stock analysis scores from the indicator state")
+
+
+def main():
+    test_streaming_matches_full_recompute()
+    test_revision_and_round_trip()
+    test_state_store_applies_only_new_bars()
+    test_state_store_appends_to_trimmed_history()
+    test_single_stock_analysis_uses_indicator_state()
+    print("\nAll indicator state tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Tests for the hosted inference endpoint, the classification cache and batched requests (no network access needed).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import inference
+from singleflight import SingleFlightCache
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_default_url_is_router():
+    """Without HF_INFERENCE_URL, batches go to the router, not the retired api-inference host"""
+    env = {k: v for k, v in os.environ.items() if k != 'HF_INFERENCE_URL'}
+    output = subprocess.run([sys.executable, '-c', 'import inference; print(inference.INFERENCE_URL)'],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip().splitlines()[-1] == 'https://router.huggingface.co/hf-inference'
+    assert 'api-inference.huggingface.co' not in inference.DEFAULT_INFERENCE_URL
+    print("✓ Default inference URL is the router endpoint")
+
+
+def test_post_batch_request_shape():
+    """One POST to {base}/models/{model} with all inputs; a single un-nested result is wrapped"""
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            requests_seen.append((self.path, self.headers.get('Authorization'), body))
+            labels = [{'label': 'positive', 'score': 0.9}]
+            payload = json.dumps(labels if isinstance(body['inputs'], str) or len(body['inputs']) == 1
+                                 else [labels] * len(body['inputs'])).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    original = inference.INFERENCE_URL
+    inference.INFERENCE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert len(inference.post_batch('org/model', 'token', ['a', 'b'], timeout=5)) == 2
+        assert inference.post_batch('org/model', None, ['a'], timeout=5) == [[{'label': 'positive', 'score': 0.9}]]
+    finally:
+        inference.INFERENCE_URL = original
+        server.shutdown()
+        server.server_close()
+
+    assert requests_seen[0] == ('/models/org/model', 'Bearer token', {'inputs': ['a', 'b']})
+    assert requests_seen[1][1] is None
+    print("✓ Batched request shape")
+
+
+def test_cache_key_normalizes_whitespace():
+    """Texts differing only in whitespace share a key; model and wording still separate entries"""
+    assert inference.normalize_text("  AAPL   rose\n\t3%  today ") == "AAPL rose 3% today"
+    key = inference.cache_key('org/model', "AAPL rose 3% today")
+    assert key == inference.cache_key('org/model', "AAPL  rose 3%\ntoday ")
+    assert key[0] == 'org/model' and len(key[1]) == 64
+    assert key != inference.cache_key('org/other', "AAPL rose 3% today")
+    assert key != inference.cache_key('org/model', "AAPL fell 3% today")
+    print("✓ Cache keys normalize whitespace")
+
+
+def with_classification_cache(ttl, clock):
+    """Swap in a cache on a fake clock (no early refresh); returns the original to restore"""
+    original = inference.classification_cache
+    inference.classification_cache = SingleFlightCache(ttl=ttl, clock=clock, rand=lambda: 0.0)
+    return original
+
+
+def test_classification_cache_ttl():
+    """Identical text is classified once per TTL, then fetched again"""
+    clock = FakeClock()
+    original = with_classification_cache(60, clock)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return [{'label': 'positive', 'score': 0.9}]
+
+    try:
+        first = inference.cached_classification('org/model', "AAPL rose", fetch)
+        clock.now += 59
+        assert inference.cached_classification('org/model', " AAPL  rose ", fetch) == first
+        assert len(calls) == 1
+        clock.now += 2
+        inference.cached_classification('org/model', "AAPL rose", fetch)
+        assert len(calls) == 2
+    finally:
+        inference.classification_cache = original
+    print("✓ Classification cache TTL")
+
+
+def test_classification_cache_skips_empty_and_failed_results():
+    """Empty results and exceptions are returned to the caller but never cached"""
+    clock = FakeClock()
+    original = with_classification_cache(60, clock)
+    calls = []
+
+    def empty():
+        calls.append('empty')
+        return []
+
+    def failing():
+        calls.append('failing')
+        raise RuntimeError("503 model loading")
+
+    try:
+        assert inference.cached_classification('org/model', "quiet", empty) == []
+        assert inference.cached_classification('org/model', "quiet", empty) == []
+        assert calls == ['empty', 'empty']
+
+        for _ in range(2):
+            try:
+                inference.cached_classification('org/model', "busy", failing)
+                assert False, "the fetch error should reach the caller"
+            except RuntimeError:
+                pass
+        assert calls.count('failing') == 2
+        assert inference.classification_cache.stats()['entries'] == 0
+    finally:
+        inference.classification_cache = original
+    print("✓ Empty and failed classifications are not cached")
+
+
+class RecordingBatch:
+    """send_batch stand-in: records each call and labels every text with itself"""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+        self.lock = threading.Lock()
+
+    def __call__(self, model, token, texts, timeout):
+        with self.lock:
+            self.calls.append((model, token, list(texts)))
+        if self.error is not None:
+            raise self.error
+        return [[{'label': text, 'score': 1.0}] for text in texts]
+
+
+def test_micro_batcher_combines_concurrent_callers():
+    """Concurrent classify calls share one batch and each caller gets its own result"""
+    send = RecordingBatch()
+    batcher = inference.MicroBatcher(send, max_batch_size=16, max_wait=0.2)
+    results = {}
+    barrier = threading.Barrier(5)
+
+    def call(text):
+        barrier.wait()
+        results[text] = batcher.classify(text, 'org/model', token='token', timeout=5)
+
+    threads = [threading.Thread(target=call, args=(f"text {i}",)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(send.calls) == 1
+    model, token, texts = send.calls[0]
+    assert (model, token) == ('org/model', 'token') and sorted(texts) == sorted(results)
+    assert all(result == [{'label': text, 'score': 1.0}] for text, result in results.items())
+    assert batcher.stats()['requests'] == 5 and batcher.stats()['batches'] == 1
+    print("✓ Micro-batcher combines concurrent callers")
+
+
+def test_micro_batcher_splits_at_max_batch_size():
+    """More waiting requests than max_batch_size go out as several batches"""
+    send = RecordingBatch()
+    batcher = inference.MicroBatcher(send, max_batch_size=2, max_wait=0.2)
+    futures = {f"text {i}": batcher.submit('org/model', None, f"text {i}", 5) for i in range(5)}
+
+    for text, future in futures.items():
+        assert future.result(timeout=5) == [{'label': text, 'score': 1.0}]
+    sizes = [len(texts) for _, _, texts in send.calls]
+    assert max(sizes) == 2 and sum(sizes) == 5 and len(sizes) == 3
+    assert batcher.stats()['largest_batch'] == 2
+    print("✓ Micro-batcher splits batches at max_batch_size")
+
+
+def test_micro_batcher_error_reaches_every_waiter():
+    """An exception from the batch call is raised for each request in the batch"""
+    batcher = inference.MicroBatcher(RecordingBatch(error=RuntimeError("model loading")),
+                                     max_batch_size=16, max_wait=0.05)
+    futures = [batcher.submit('org/model', None, f"text {i}", 5) for i in range(3)]
+
+    for future in futures:
+        try:
+            future.result(timeout=5)
+            assert False, "waiter should see the batch error"
+        except RuntimeError as e:
+            assert str(e) == "model loading"
+    print("✓ Micro-batcher errors reach every waiter")
+
+
+def main():
+    test_default_url_is_router()
+    test_post_batch_request_shape()
+    test_cache_key_normalizes_whitespace()
+    test_classification_cache_ttl()
+    test_classification_cache_skips_empty_and_failed_results()
+    test_micro_batcher_combines_concurrent_callers()
+    test_micro_batcher_splits_at_max_batch_size()
+    test_micro_batcher_error_reaches_every_waiter()
+    print("\nAll inference tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Tests for the orjson JSON provider and response compression (no network access needed).
+"""
+
+import gzip
+import json
+import sys
+import numpy as np
+import pandas as pd
+from flask import Flask, Response, jsonify
+from json_response import OrjsonProvider, ResponseCompressor
+
+
+def make_app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.after_request(ResponseCompressor(min_bytes=256))
+
+    @app.route('/large')
+    def large():
+        return jsonify({'values': [{'ticker': f'T{i}', 'score': np.float64(i / 3)} for i in range(200)]})
+
+    @app.route('/small')
+    def small():
+        return jsonify({'ok': True})
+
+    @app.route('/stream')
+    def stream():
+        return Response((f'{{"i":{i}}}\n' * 100 for i in range(3)), mimetype='application/json')
+
+    return app
+
+
+def test_numpy_and_pandas_values():
+    """numpy scalars/arrays and timestamps serialize; NaN becomes null"""
+    app = Flask(__name__)
+    provider = OrjsonProvider(app)
+    payload = {
+        'score': np.int64(72), 'pct': np.float32(0.5), 'flag': np.bool_(True),
+        'closes': np.array([1.5, 2.5]), 'missing': float('nan'),
+        'as_of': pd.Timestamp('2024-01-02 16:00'), 1: 'int key'
+    }
+    decoded = json.loads(provider.dumps(payload))
+    assert decoded == {
+        'score': 72, 'pct': 0.5, 'flag': True, 'closes': [1.5, 2.5], 'missing': None,
+        'as_of': '2024-01-02T16:00:00', '1': 'int key'
+    }
+    print("✓ numpy/pandas values serialize")
+
+
+def test_negotiated_compression():
+    """Large responses are gzipped when accepted; small and streamed ones are not"""
+    client = make_app().test_client()
+
+    response = client.get('/large', headers={'Accept-Encoding': 'gzip, deflate'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(json.loads(gzip.decompress(response.data))['values']) == 200
+
+    assert 'Content-Encoding' not in client.get('/large').headers
+    assert 'Content-Encoding' not in client.get('/small', headers={'Accept-Encoding': 'gzip'}).headers
+    assert 'Content-Encoding' not in client.get('/stream', headers={'Accept-Encoding': 'gzip'}).headers
+    print("✓ Compression negotiated by size and Accept-Encoding")
+
+
+def main():
+    test_numpy_and_pandas_values()
+    test_negotiated_compression()
+    print("\nAll JSON response tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Tests for the shared market context refresh (no network access needed).
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+from market_context import MarketContext, MARKET_TICKERS
+from test_ohlcv_store import FakeStore, make_bars
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_one_fetch_per_ttl_window():
+    """Concurrent readers share one batched fetch; the next happens only once the TTL passes"""
+    root = tempfile.mkdtemp()
+    try:
+        remote = {ticker: make_bars(120, start_price=50.0) for ticker in MARKET_TICKERS}
+        store = FakeStore(remote, root=root, max_age=0)
+        clock = FakeClock()
+        context = MarketContext(store, ttl=900, clock=clock)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(context.market_sentiment())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        assert len(store.requests) == 1 and sorted(store.requests[0][0]) == sorted(MARKET_TICKERS)
+        assert context.refreshes == 1 and len(results) == 8
+
+        # Every reader in the window is served from memory
+        clock.now += 899
+        context.interest_rate()
+        context.sector_performance('Technology')
+        context.market_sentiment()
+        assert len(store.requests) == 1 and context.stats()['expires_in_seconds'] == 1
+
+        # The next window refreshes once, incrementally
+        clock.now += 1
+        context.market_sentiment()
+        context.sector_performance('Energy')
+        assert len(store.requests) == 2 and 'start' in store.requests[1][1]
+        assert context.refreshes == 2
+
+        sector = context.sector_performance('Technology')
+        assert sector['trend'] == 'Outperforming' and sector['performance'] > 5
+        assert results[0]['sentiment'] == 'Bullish'
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    print("✓ One market fetch per TTL window")
+
+
+def main():
+    test_one_fetch_per_ttl_window()
+    print("\nAll market context tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
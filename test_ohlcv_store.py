@@ -0,0 +1,140 @@
+"""
+Tests for the local OHLCV store's full, incremental and re-adjusting refreshes (no network access needed).
+"""
+
+import shutil
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+from ohlcv_store import OHLCVStore
+
+
+def make_bars(sessions, start_price=100.0):
+    """Synthetic adjusted daily bars for the last `sessions` business days"""
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=sessions)
+    close = start_price + np.arange(sessions, dtype=float)
+    return pd.DataFrame({'Open': close - 0.5, 'High': close + 1, 'Low': close - 1,
+                         'Close': close, 'Volume': np.full(sessions, 1e6)}, index=index)
+
+
+class FakeStore(OHLCVStore):
+    """Serves downloads from an in-memory 'remote' history and records each request"""
+
+    def __init__(self, remote, **kwargs):
+        super().__init__(**kwargs)
+        self.remote = remote
+        self.requests = []
+
+    def _download(self, tickers, max_retries=3, **kwargs):
+        self.requests.append((list(tickers), kwargs))
+        frames = {}
+        for ticker in tickers:
+            df = self.remote[ticker]
+            if 'start' in kwargs:
+                df = df[df.index >= pd.Timestamp(kwargs['start'])]
+            frames[ticker] = df.copy()
+        return frames
+
+
+def with_store(test):
+    def run():
+        root = tempfile.mkdtemp()
+        try:
+            test(root)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+    run.__name__ = test.__name__
+    run.__doc__ = test.__doc__
+    return run
+
+
+@with_store
+def test_full_fetch_trims_to_history_period(root):
+    """A new ticker is fetched for the whole period, and bars older than it are dropped"""
+    remote = {'AAA': make_bars(400)}
+    store = FakeStore(remote, root=root, max_age=0)
+    store.refresh(['AAA'])
+
+    assert store.requests == [(['AAA'], {'period': '1y'})]
+    stored = store.load('AAA')
+    assert stored.index[0] >= pd.Timestamp.now() - pd.DateOffset(years=1)
+    assert stored.index[-1] == remote['AAA'].index[-1] and len(stored) < 400
+    assert store.stats['full_fetches'] == 1
+    print("✓ Full fetch trimmed to history period")
+
+
+@with_store
+def test_incremental_fetch_upserts_partial_session(root):
+    """A known ticker only re-requests from its last complete session; the partial bar is replaced"""
+    remote = {'AAA': make_bars(200)}
+    store = FakeStore(remote, root=root, max_age=0)
+    store.refresh(['AAA'])
+
+    # The last session closes higher than its intraday snapshot
+    remote['AAA'].iloc[-1, remote['AAA'].columns.get_loc('Close')] += 2.5
+    store.requests.clear()
+    store.refresh(['AAA'])
+
+    assert store.requests == [(['AAA'], {'start': remote['AAA'].index[-2].strftime('%Y-%m-%d')})]
+    stored = store.load('AAA')
+    assert len(stored) == 200 and not stored.index.has_duplicates
+    assert stored['Close'].iloc[-1] == remote['AAA']['Close'].iloc[-1]
+    assert store.stats['incremental_fetches'] == 1 and store.stats['readjusted_fetches'] == 0
+
+    # Upserted bars are persisted for the next process
+    reopened = FakeStore(remote, root=root, max_age=0)
+    assert reopened.load('AAA')['Close'].iloc[-1] == remote['AAA']['Close'].iloc[-1]
+    print("✓ Incremental fetch upserts the partial session")
+
+
+@with_store
+def test_readjusted_history_is_refetched(root):
+    """After a split the stored history no longer matches Yahoo's, so it is replaced in full"""
+    remote = {'AAA': make_bars(200), 'BBB': make_bars(200, start_price=50.0)}
+    store = FakeStore(remote, root=root, max_age=0)
+    store.refresh(['AAA', 'BBB'])
+
+    # AAA splits 2:1: every adjusted price halves and a new bar appears
+    split = remote['AAA'].copy()
+    split[['Open', 'High', 'Low', 'Close']] /= 2
+    split.loc[split.index[-1] + pd.offsets.BDay()] = split.iloc[-1]
+    remote['AAA'] = split
+    store.requests.clear()
+    store.refresh(['AAA', 'BBB'])
+
+    assert store.requests[-1] == (['AAA'], {'period': '1y'})
+    stored = store.load('AAA')
+    pd.testing.assert_frame_equal(stored, store._trim(split), check_freq=False)
+    assert store.load('BBB')['Close'].iloc[0] == 50.0
+    assert store.stats['readjusted_fetches'] == 1
+    print("✓ Re-adjusted history is re-fetched in full")
+
+
+@with_store
+def test_latest_quote_reads_last_bar(root):
+    """Price and volume come from the newest stored bar; average volume from the trailing sessions"""
+    remote = {'AAA': make_bars(100)}
+    remote['AAA']['Volume'] = np.arange(100, dtype=float)
+    store = FakeStore(remote, root=root, max_age=0)
+    assert store.latest_quote('AAA') is None
+
+    store.refresh(['AAA'])
+    quote = store.latest_quote('AAA')
+    assert quote['price'] == remote['AAA']['Close'].iloc[-1] and quote['volume'] == 99.0
+    assert quote['average_volume'] == np.arange(37, 100).mean()
+    assert quote['timestamp'] == remote['AAA'].index[-1]
+    print("✓ Latest quote reads the last stored bar")
+
+
+def main():
+    test_full_fetch_trims_to_history_period()
+    test_incremental_fetch_upserts_partial_session()
+    test_readjusted_history_is_refetched()
+    test_latest_quote_reads_last_bar()
+    print("\nAll OHLCV store tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Tests for the peer index, the peer scoreboard and the StockScore peer lookup (no network access needed).
+"""
+
+import os
+import sys
+import threading
+
+os.environ.setdefault('ENABLE_BACKGROUND_REFRESH', '0')
+from peer_scoreboard import PeerIndex, PeerScoreboard
+
+GROUPS = {
+    'Software': ['MSFT', 'ORCL', 'CRM', 'ADBE'],
+    'Internet': ['GOOGL', 'GOOG', 'META', 'AMZN'],
+    'Technology': ['AAPL', 'MSFT', 'NVDA', 'AMD']
+}
+
+
+def peer_entry(ticker):
+    return {'ticker': ticker, 'price': 100.0}
+
+
+def test_peer_index_groups_and_peers():
+    """Industries match by substring, fall back to sector, and exclude the stock's own share classes"""
+    index = PeerIndex(GROUPS)
+    assert index.group_for('Software - Infrastructure', 'Technology') == ('MSFT', 'ORCL', 'CRM', 'ADBE')
+    assert index.group_for('Semiconductors', 'Technology') == ('AAPL', 'MSFT', 'NVDA', 'AMD')
+    assert index.group_for('Unknown', 'Unknown') == ()
+    assert index.peers_for('GOOGL', 'Internet Content & Information', 'Communication Services') == ['META', 'AMZN']
+    assert index.peers_for('MSFT', 'Software', 'Technology') == ['ORCL', 'CRM', 'ADBE']
+    assert index.all_tickers() == ['MSFT', 'ORCL', 'CRM', 'ADBE', 'GOOGL', 'GOOG', 'META', 'AMZN',
+                                   'AAPL', 'NVDA', 'AMD']
+    print("✓ Peer index groups and peers")
+
+
+def test_scoreboard_build_and_lookup():
+    """build() analyzes each indexed ticker once after the prefetch; failed peers are left off the board"""
+    analyzed, prefetched = [], []
+    lock = threading.Lock()
+
+    def analyze(ticker):
+        with lock:
+            analyzed.append(ticker)
+        return None if ticker == 'CRM' else peer_entry(ticker)
+
+    index = PeerIndex(GROUPS)
+    board = PeerScoreboard(analyze, index=index, prefetch_fn=prefetched.append, max_workers=4).build()
+
+    assert prefetched == [index.all_tickers()]
+    assert sorted(analyzed) == sorted(index.all_tickers())
+    assert 'CRM' not in board and board['ORCL'] == peer_entry('ORCL')
+
+    peers = index.peers_for('MSFT', 'Software', 'Technology')
+    assert [p['ticker'] for p in PeerScoreboard.lookup(board, peers)] == ['ORCL', 'ADBE']
+    assert PeerScoreboard.missing(board, peers) == ['CRM']
+    assert PeerScoreboard.missing(board, ['TSLA', 'ORCL']) == ['TSLA']
+    print("✓ Peer scoreboard build and lookup")
+
+
+def test_scoreboard_survives_prefetch_failure():
+    """A failed prefetch is logged and the per-ticker analysis still runs"""
+    def prefetch(tickers):
+        raise RuntimeError("download failed")
+
+    board = PeerScoreboard(peer_entry, index=PeerIndex(GROUPS), prefetch_fn=prefetch).build()
+    assert len(board) == len(PeerIndex(GROUPS).all_tickers())
+    print("✓ Peer scoreboard survives a failed prefetch")
+
+
+def test_peers_missing_from_board_are_analyzed_live():
+    """collect_peer_analyses reads published peers and analyzes only the ones the board lacks"""
+    import app
+
+    analyzed = []
+
+    def analyze(ticker):
+        analyzed.append(ticker)
+        return dict(peer_entry(ticker), live=True)
+
+    original_analyze, original_index = app.analyze_peer, app.peer_index
+    original_snapshot = app.peer_scoreboard_scheduler.current()
+    app.analyze_peer = analyze
+    app.peer_index = PeerIndex(GROUPS)
+    try:
+        app.peer_scoreboard_scheduler.publish({'ORCL': peer_entry('ORCL'), 'ADBE': peer_entry('ADBE')})
+        result = app.collect_peer_analyses('MSFT', 'Technology', 'Software')
+        assert analyzed == ['CRM']
+        assert result['all_peers'] == [peer_entry('ORCL'), dict(peer_entry('CRM'), live=True), peer_entry('ADBE')]
+
+        # A peer that fails live analysis is left out rather than failing the section
+        app.analyze_peer = lambda ticker: None
+        result = app.collect_peer_analyses('MSFT', 'Technology', 'Software')
+        assert [p['ticker'] for p in result['all_peers']] == ['ORCL', 'ADBE']
+    finally:
+        app.analyze_peer, app.peer_index = original_analyze, original_index
+        app.peer_scoreboard_scheduler._snapshot = original_snapshot
+    print("✓ Peers missing from the scoreboard are analyzed live")
+
+
+def main():
+    test_peer_index_groups_and_peers()
+    test_scoreboard_build_and_lookup()
+    test_scoreboard_survives_prefetch_failure()
+    test_peers_missing_from_board_are_analyzed_live()
+    print("\nAll peer scoreboard tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
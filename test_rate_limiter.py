@@ -0,0 +1,112 @@
+"""
+Tests for the token-bucket rate limiters with a simulated clock (no network access needed).
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from rate_limiter import TokenBucket, SharedTokenBucket
+
+
+class FakeClock:
+    """Simulated time: sleeping advances the clock instead of blocking"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def assert_close(actual, expected):
+    assert abs(actual - expected) < 1e-9, f"{actual} != {expected}"
+
+
+def check_bucket(make_bucket):
+    """Burst, refill rate, debt for oversized requests and backoff() for any bucket"""
+    clock = FakeClock()
+    bucket = make_bucket(clock)
+
+    # The burst goes through immediately, then callers are paced at `rate`
+    assert [bucket.acquire() for _ in range(4)] == [0.0] * 4
+    assert_close(bucket.acquire(), 0.5)
+    assert_close(bucket.acquire(), 0.5)
+    assert clock.slept == [0.5, 0.5]
+
+    # Idle time refills the bucket, but never beyond the burst
+    clock.now += 100
+    assert [bucket.acquire() for _ in range(4)] == [0.0] * 4
+    assert_close(bucket.acquire(), 0.5)
+
+    # A batch larger than the burst still goes through, leaving debt for the next caller
+    clock.now += 100
+    assert_close(bucket.acquire(6), 1.0)
+    assert_close(bucket.acquire(), 0.5)
+
+    # backoff() holds every caller even while tokens are available
+    clock.now += 100
+    bucket.backoff(30)
+    assert_close(bucket.acquire(), 30.0)
+    assert bucket.acquire() == 0.0
+
+    stats = bucket.stats()
+    assert stats['acquisitions'] == 15 and stats['waits'] == 6
+    assert_close(stats['max_wait_seconds'], 30.0)
+    return stats
+
+
+def test_token_bucket_rate_burst_and_backoff():
+    """In-process bucket: rate 2/s, burst 4"""
+    stats = check_bucket(lambda clock: TokenBucket(2, 4, clock=clock, sleep=clock.sleep))
+    assert stats['shared'] is False
+    print("✓ Token bucket rate, burst and backoff")
+
+
+def test_shared_bucket_rate_burst_and_backoff():
+    """File-backed bucket follows the same rules"""
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, 'yahoo.lock')
+        stats = check_bucket(lambda clock: SharedTokenBucket(2, 4, path, clock=clock, sleep=clock.sleep))
+    assert stats['shared'] is True
+    print("✓ Shared token bucket rate, burst and backoff")
+
+
+def test_shared_bucket_is_shared_across_workers():
+    """Buckets on one lock file draw from one budget, including across processes"""
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, 'yahoo.lock')
+
+        # Two workers' limiters, one simulated clock
+        clock = FakeClock()
+        first = SharedTokenBucket(2, 4, path, clock=clock, sleep=clock.sleep)
+        second = SharedTokenBucket(2, 4, path, clock=clock, sleep=clock.sleep)
+        assert [first.acquire(), first.acquire(), second.acquire(), second.acquire()] == [0.0] * 4
+        assert_close(second.acquire(), 0.5)
+        first.backoff(10)
+        assert_close(second.acquire(), 10.0)
+
+        # A separate process drains the burst of a slow bucket; this process then has to wait
+        slow_path = os.path.join(root, 'slow.lock')
+        code = f"from rate_limiter import SharedTokenBucket; SharedTokenBucket(0.001, 5, {slow_path!r})._reserve(5)"
+        subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        wait = SharedTokenBucket(0.001, 5, slow_path)._reserve(1)
+        assert 990 < wait <= 1000, wait
+    print("✓ Shared token bucket budget spans workers and processes")
+
+
+def main():
+    test_token_bucket_rate_burst_and_backoff()
+    test_shared_bucket_rate_burst_and_backoff()
+    test_shared_bucket_is_shared_across_workers()
+    print("\nAll rate limiter tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
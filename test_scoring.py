@@ -0,0 +1,176 @@
+"""
+Tests for the vectorized batch scoring.
+Checks that scoring a universe in one batch gives the same scores, reasons
+and breakdowns as scoring each ticker on its own, and as the original scalar
+per-ticker rules (no network access needed).
+"""
+
+import sys
+import numpy as np
+from prediction_engine import StockPredictionEngine
+from scoring import score_universe, latest_rows, fundamentals_table, TECHNICAL_INPUTS
+from test_indicator_panel import make_history
+
+
+def make_inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    latest = {name: rng.uniform(0, 100, n) for name in TECHNICAL_INPUTS}
+    # Hit the RSI and P/E band edges exactly
+    latest['RSI'][:4] = [30.0, 70.0, 29.9, 70.1]
+    latest['SMA_200'][4] = np.nan
+    infos = [{'forwardPE': float(pe), 'profitMargins': 0.2, 'returnOnEquity': 0.1}
+             for pe in rng.uniform(-5, 40, n)]
+    infos[0]['forwardPE'] = 10
+    infos[1]['forwardPE'] = 25
+    infos[2] = {}
+    infos[3] = {'forwardPE': None, 'profitMargins': 'n/a'}
+    return latest, infos
+
+
+def test_batch_matches_single_rows():
+    """Each batch result equals scoring that ticker as a one-row batch"""
+    latest, infos = make_inputs(200)
+    batch = score_universe(latest, fundamentals_table(infos))
+
+    for i in range(len(batch)):
+        single = score_universe({k: v[i:i + 1] for k, v in latest.items()},
+                                fundamentals_table([infos[i]]))
+        assert batch.result(i) == single.result(0), f"row {i} differs"
+    print(f"✓ {len(batch)} batch results match single-row scoring")
+
+
+def test_band_edges_and_missing_fundamentals():
+    """Inclusive RSI/P/E bands; missing or non-numeric fundamentals score nothing"""
+    latest, infos = make_inputs(5)
+    batch = score_universe(latest, fundamentals_table(infos))
+
+    assert list(batch.points['rsi'][:4]) == [5, 5, 3, -3]
+    assert list(batch.points['pe'][:2]) == [10, 10]
+    assert batch.fundamental[2] == 0 and batch.fundamental[3] == 0
+    assert batch.points['sma_200'][4] == 0 and batch.points['golden_cross'][4] == 0
+
+    score, reasons, breakdown = batch.result(0)
+    assert score == breakdown['total'] == 50 + breakdown['technical'] + breakdown['fundamental']
+    assert len(breakdown['components']) == 9
+    assert len(reasons.split(" | ")) <= 5
+    print("✓ Band edges and missing fundamentals handled")
+
+
+def reference_score(df, info):
+    """The scalar calculate_prediction_score rules the batch replaced, kept as a test oracle"""
+    baseline_score = 50
+    technical_points = 0
+    fundamental_points = 0
+    reasons = []
+    components = []
+    latest = df.iloc[-1]
+
+    def technical(name, points, reason=None):
+        nonlocal technical_points
+        technical_points += points
+        if reason:
+            reasons.append(reason)
+        components.append({'name': name, 'points': points, 'max_points': 5, 'category': 'Technical'})
+
+    above_50 = latest['Close'] > latest['SMA_50']
+    technical('Price vs 50-day SMA', 5 if above_50 else 0, "Price above 50-day MA" if above_50 else None)
+    above_200 = latest['Close'] > latest['SMA_200']
+    technical('Price vs 200-day SMA', 5 if above_200 else 0, "Price above 200-day MA" if above_200 else None)
+    cross = latest['SMA_50'] > latest['SMA_200']
+    technical('Golden Cross (50>200)', 5 if cross else 0, "Golden cross formation" if cross else None)
+
+    rsi = latest['RSI']
+    if 30 <= rsi <= 70:
+        technical(f'RSI ({rsi:.1f})', 5, f"Healthy RSI ({rsi:.1f})")
+    elif rsi < 30:
+        technical(f'RSI ({rsi:.1f})', 3, "Oversold condition (potential bounce)")
+    elif rsi > 70:
+        technical(f'RSI ({rsi:.1f})', -3, "Overbought condition")
+    else:
+        technical(f'RSI ({rsi:.1f})', 0)
+
+    macd = latest['MACD'] > latest['Signal_Line']
+    technical('MACD Signal', 5 if macd else 0, "Bullish MACD crossover" if macd else None)
+    volume = latest['Volume'] > latest['Volume_SMA']
+    technical('Volume Trend', 5 if volume else 0, "Above-average volume" if volume else None)
+
+    pe_points = 0
+    try:
+        if 'forwardPE' in info and info['forwardPE'] is not None:
+            pe = info['forwardPE']
+            if 10 <= pe <= 25:
+                pe_points = 10
+                reasons.append(f"Reasonable P/E ratio ({pe:.1f})")
+            elif pe < 10:
+                pe_points = 5
+                reasons.append(f"Low P/E ratio ({pe:.1f})")
+    except Exception:
+        pass
+    fundamental_points += pe_points
+    components.append({'name': 'P/E Ratio Valuation', 'points': pe_points, 'max_points': 10, 'category': 'Fundamental'})
+
+    for key, name, label in (('profitMargins', 'Profit Margins', 'Strong profit margins'),
+                             ('returnOnEquity', 'Return on Equity (ROE)', 'High ROE')):
+        points = 0
+        try:
+            if key in info and info[key] is not None and info[key] > 0.15:
+                points = 5
+                reasons.append(f"{label} ({info[key]*100:.1f}%)")
+        except Exception:
+            pass
+        fundamental_points += points
+        components.append({'name': name, 'points': points, 'max_points': 5, 'category': 'Fundamental'})
+
+    final_score = min(max(baseline_score + technical_points + fundamental_points, 0), 100)
+    breakdown = {
+        'baseline': baseline_score,
+        'technical': technical_points,
+        'fundamental': fundamental_points,
+        'total': final_score,
+        'baseline_pct': round((baseline_score / final_score * 100) if final_score > 0 else 0, 1),
+        'technical_pct': round((technical_points / final_score * 100) if final_score > 0 else 0, 1),
+        'fundamental_pct': round((fundamental_points / final_score * 100) if final_score > 0 else 0, 1),
+        'components': components
+    }
+    return final_score, " | ".join(reasons[:5]), breakdown
+
+
+def random_info(rng):
+    info = {}
+    for key, low, high in (('forwardPE', -5, 40), ('profitMargins', -0.1, 0.4), ('returnOnEquity', -0.1, 0.4)):
+        roll = rng.uniform()
+        if roll < 0.1:
+            continue
+        info[key] = None if roll < 0.15 else 'n/a' if roll < 0.2 else float(rng.uniform(low, high))
+    if rng.uniform() < 0.1:
+        info['forwardPE'] = float(rng.choice([10, 25]))
+    return info
+
+
+def test_batch_matches_scalar_reference():
+    """Batch scores equal the original per-ticker rules on randomized histories"""
+    engine = StockPredictionEngine.__new__(StockPredictionEngine)
+    rng = np.random.default_rng(9)
+    frames, infos = [], []
+    for seed in range(300):
+        # Short histories leave SMA_200 undefined
+        hist = make_history(seed, int(rng.integers(50, 300)))
+        frames.append(engine.calculate_technical_indicators(hist))
+        infos.append(random_info(rng))
+
+    batch = score_universe(latest_rows(frames), fundamentals_table(infos))
+    diffs = [i for i in range(len(frames)) if batch.result(i) != reference_score(frames[i], infos[i])]
+    assert not diffs, f"{len(diffs)} tickers differ from the scalar rules, first {diffs[:5]}"
+    print(f"✓ {len(frames)} batch results match the scalar reference rules")
+
+
+def main():
+    test_batch_matches_single_rows()
+    test_band_edges_and_missing_fundamentals()
+    test_batch_matches_scalar_reference()
+    print("\nAll scoring tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Tests for the offline lexicon sentiment backend (no network access needed).
+"""
+
+import sys
+from sentiment_lexicon import LexiconSentimentBackend
+
+
+def top_label(result):
+    return max(result, key=lambda x: x['score'])['label']
+
+
+def test_polarity_and_label_shape():
+    """Returns the hosted model's label names, with sensible polarity"""
+    backend = LexiconSentimentBackend()
+    results = backend.classify_many([
+        "AAPL surged 4.2% today, showing strong bullish momentum",
+        "XYZ plummeted 5% today amid heavy selling and bearish sentiment",
+        "ABC traded relatively flat with minimal price action",
+        "The outlook is not bullish",
+    ])
+
+    assert [top_label(r) for r in results] == ['LABEL_2', 'LABEL_0', 'LABEL_1', 'LABEL_0']
+    for result in results:
+        assert sorted(r['label'] for r in result) == ['LABEL_0', 'LABEL_1', 'LABEL_2']
+        assert abs(sum(r['score'] for r in result) - 1.0) < 1e-9
+    print("✓ Polarity and label shape")
+
+
+def test_finbert_labels():
+    """FinBERT requests get positive/negative/neutral labels"""
+    result = LexiconSentimentBackend().classify("Strong rally on upgraded guidance", model='ProsusAI/finbert')
+    assert top_label(result) == 'positive'
+    print("✓ FinBERT label names")
+
+
+def main():
+    test_polarity_and_label_shape()
+    test_finbert_labels()
+    print("\nAll sentiment lexicon tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
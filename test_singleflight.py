@@ -0,0 +1,210 @@
+"""
+Tests for single-flight coalescing, the stampede-safe cache and broadcasts (no network access needed).
+"""
+
+import sys
+import threading
+import time
+from singleflight import SingleFlight, SingleFlightCache, Broadcast, BroadcastGroup
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def run_concurrently(flight, key, fn, n):
+    """Call flight.do from n threads once all followers are queued; returns results and errors"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+def test_single_flight_runs_once_for_concurrent_callers():
+    """N concurrent callers share one execution and its result"""
+    flight = SingleFlight()
+    runs = []
+
+    def compute():
+        runs.append(1)
+        # Hold the leader until every other caller is waiting on it
+        deadline = time.time() + 5
+        while flight.stats()['coalesced'] < 9 and time.time() < deadline:
+            time.sleep(0.005)
+        return object()
+
+    results, errors = run_concurrently(flight, 'AAPL', compute, 10)
+    assert len(runs) == 1 and not errors and len(results) == 10
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {'executions': 1, 'coalesced': 9, 'in_flight': 0}
+    print("✓ Single flight runs once for concurrent callers")
+
+
+def test_single_flight_propagates_errors_to_followers():
+    """Every waiting caller gets the leader's exception; the key is free afterwards"""
+    flight = SingleFlight()
+    error = ValueError('upstream failed')
+
+    def compute():
+        deadline = time.time() + 5
+        while flight.stats()['coalesced'] < 4 and time.time() < deadline:
+            time.sleep(0.005)
+        raise error
+
+    results, errors = run_concurrently(flight, 'AAPL', compute, 5)
+    assert not results and len(errors) == 5 and all(e is error for e in errors)
+    assert flight.do('AAPL', lambda: 'retried') == 'retried'
+    assert flight.stats()['executions'] == 2
+    print("✓ Single flight propagates errors to followers")
+
+
+def test_cache_ttl_expiry():
+    """Values are served until the TTL passes, then recomputed"""
+    clock = FakeClock()
+    cache = SingleFlightCache(ttl=60, beta=0, clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(clock.now)
+        return len(calls)
+
+    assert cache.get_or_compute('k', compute) == 1
+    clock.now += 59
+    assert cache.get_or_compute('k', compute) == 1
+    clock.now += 1
+    assert cache.get_or_compute('k', compute) == 2
+    assert calls == [1000.0, 1060.0]
+
+    # Rejected results reach the caller but are not kept
+    assert cache.get_or_compute('missing', lambda: None, should_cache=lambda value: value is not None) is None
+    assert cache.peek('missing') is None
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 3
+    print("✓ Cache entries expire after the TTL")
+
+
+def test_cache_xfetch_refreshes_early_once():
+    """Close to expiry one caller refreshes early while others keep the cached value"""
+    clock = FakeClock()
+    draws = [0.1]
+    cache = SingleFlightCache(ttl=60, clock=clock, rand=lambda: draws[0])
+    cache.put('k', 'old', compute_seconds=10)
+
+    # 55 s in, with 5 s left: a small draw (jitter ~1 s) serves the cached value...
+    clock.now += 55
+    assert cache.get_or_compute('k', lambda: 'new') == 'old'
+
+    # ...a large one (jitter ~6.9 s) refreshes early; callers meanwhile get the old value
+    draws[0] = 0.5
+    during = []
+
+    def refresh():
+        other = threading.Thread(target=lambda: during.append(cache.get_or_compute('k', lambda: 'dup')))
+        other.start()
+        other.join(5)
+        return 'new'
+
+    assert cache.get_or_compute('k', refresh) == 'new'
+    assert during == ['old'] and cache.peek('k') == 'new'
+    assert cache.stats()['early_refreshes'] == 1
+    print("✓ XFetch refreshes early exactly once")
+
+
+def test_cache_peek_and_put():
+    """put() stores values computed elsewhere; peek() never computes and ignores expired entries"""
+    clock = FakeClock()
+    cache = SingleFlightCache(ttl=30, clock=clock)
+    assert cache.peek('k') is None
+    cache.put('k', {'score': 71})
+    assert cache.peek('k') == {'score': 71}
+    assert cache.get_or_compute('k', lambda: 1 / 0) == {'score': 71}
+    clock.now += 30
+    assert cache.peek('k') is None
+    cache.invalidate()
+    assert cache.stats()['entries'] == 0
+    print("✓ Cache peek and put")
+
+
+def test_broadcast_group_shares_one_computation_per_key():
+    """Followers of a key share one run and each see every item, even when joining late"""
+    runs = []
+
+    def compute(progress):
+        runs.append(1)
+        for i in range(3):
+            progress.push(i)
+            time.sleep(0.05)
+        return 'done'
+
+    group = BroadcastGroup('test')
+    seen = []
+
+    def follow():
+        progress = group.join('AAPL', compute)
+        seen.append((list(progress.follow()), progress.result))
+
+    threads = [threading.Thread(target=follow) for _ in range(4)]
+    for i, thread in enumerate(threads):
+        thread.start()
+        time.sleep(0.03 * i)  # later followers join mid-run
+    for thread in threads:
+        thread.join(5)
+
+    assert len(runs) == 1 and seen == [([0, 1, 2], 'done')] * 4
+    assert group.stats() == {'executions': 1, 'joined': 3, 'in_flight': 0}
+
+    # The next join after completion starts a new run; errors reach the follower
+    progress = group.join('AAPL', lambda progress: 1 / 0)
+    try:
+        list(progress.follow())
+        assert False, "follower should see the error"
+    except ZeroDivisionError:
+        pass
+    assert group.stats()['executions'] == 2
+    print("✓ Broadcast group shares one computation per key")
+
+
+def test_broadcast_caps_replay_buffer():
+    """A capped broadcast keeps only recent items; an early follower skips what was dropped"""
+    progress = Broadcast(max_items=3)
+    early = progress.follow()
+    progress.push(0)
+    assert next(early) == 0
+
+    for i in range(1, 10):
+        progress.push(i)
+    assert len(progress._items) == 3
+    progress.close('done')
+
+    assert list(early) == [7, 8, 9]
+    assert list(progress.follow()) == [7, 8, 9] and progress.result == 'done'
+    print("✓ Broadcast caps its replay buffer")
+
+
+def main():
+    test_single_flight_runs_once_for_concurrent_callers()
+    test_single_flight_propagates_errors_to_followers()
+    test_cache_ttl_expiry()
+    test_cache_xfetch_refreshes_early_once()
+    test_cache_peek_and_put()
+    test_broadcast_group_shares_one_computation_per_key()
+    test_broadcast_caps_replay_buffer()
+    print("\nAll single-flight tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
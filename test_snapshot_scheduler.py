@@ -0,0 +1,156 @@
+"""
+Tests for the snapshot scheduler (no network access needed).
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from snapshot_scheduler import SnapshotScheduler, is_market_hours, MARKET_TZ
+
+
+def blocking_compute(release, computations, value='fresh'):
+    """A compute_fn that records each run and blocks until `release` is set"""
+    def compute():
+        computations.append(1)
+        release.wait(5)
+        return value
+    return compute
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+
+def test_stale_snapshot_served_during_refresh():
+    """While the background thread recomputes, readers get the previous snapshot at once"""
+    release, computations = threading.Event(), []
+    scheduler = SnapshotScheduler('test', blocking_compute(release, computations), market_interval=60, off_hours_interval=60)
+    stale = scheduler.publish('stale', generated_at=datetime.now() - timedelta(seconds=120))
+
+    scheduler.start()
+    try:
+        wait_for(lambda: computations)
+        start = time.time()
+        assert scheduler.get() is stale and scheduler.current() is stale
+        assert time.time() - start < 0.5
+
+        release.set()
+        wait_for(lambda: scheduler.current() is not stale)
+        assert scheduler.get().data == 'fresh' and scheduler.get().version == stale.version + 1
+    finally:
+        scheduler.stop()
+        release.set()
+
+    # A bundled warm-start snapshot is also served while its replacement is computed
+    release, computations = threading.Event(), []
+    scheduler = SnapshotScheduler('test', blocking_compute(release, computations), market_interval=60, off_hours_interval=60)
+    warm = scheduler.publish('warm', generated_at=datetime.now() - timedelta(hours=3), source='warm-start')
+    assert scheduler.get() is warm and scheduler.get() is warm
+    release.set()
+    scheduler._refresh_thread.join(5)
+    assert len(computations) == 1 and scheduler.current().data == 'fresh'
+    print("✓ Stale snapshot served during a refresh")
+
+
+def test_single_refresh_in_flight():
+    """Concurrent first requests and background triggers share one computation"""
+    release, computations = threading.Event(), []
+    scheduler = SnapshotScheduler('test', blocking_compute(release, computations), market_interval=60, off_hours_interval=60)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(scheduler.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: computations)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(computations) == 1 and len(results) == 8
+    assert all(snapshot is results[0] for snapshot in results)
+
+    release.clear()
+    started = [scheduler.refresh_in_background() for _ in range(5)]
+    assert started == [True, False, False, False, False]
+    release.set()
+    scheduler._refresh_thread.join(5)
+    assert len(computations) == 2 and scheduler.current().version == 2
+    print("✓ Single refresh in flight")
+
+
+def test_cadence_boundary():
+    """Market-hours edges pick the interval; a snapshot is reused until it reaches it, then refreshed in the background"""
+    monday = MARKET_TZ.localize(datetime(2024, 6, 3, 9, 30))
+    assert not is_market_hours(monday - timedelta(minutes=1))
+    assert is_market_hours(monday)
+    assert is_market_hours(monday.replace(hour=16, minute=0))
+    assert not is_market_hours(monday.replace(hour=16, minute=1))
+    assert not is_market_hours(monday + timedelta(days=5))  # Saturday
+
+    computations = []
+    scheduler = SnapshotScheduler('test', lambda: computations.append(1) or len(computations),
+                                  market_interval=60, off_hours_interval=60)
+    fresh = scheduler.publish('cached', generated_at=datetime.now() - timedelta(seconds=55))
+    assert scheduler.get() is fresh and not computations
+
+    stale = scheduler.publish('cached', generated_at=datetime.now() - timedelta(seconds=60))
+    assert scheduler.get() is stale
+    scheduler._refresh_thread.join(5)
+    assert computations == [1] and scheduler.get().data == 1
+    print("✓ Cadence boundary")
+
+
+def test_followers_share_one_streaming_computation():
+    """Concurrent followers tail one computation and all see every partial result"""
+    computations = []
+
+    def compute(progress):
+        computations.append(1)
+        for i in range(5):
+            time.sleep(0.02)
+            progress.push(i)
+        return 'ranked'
+
+    scheduler = SnapshotScheduler('test', compute, market_interval=60, off_hours_interval=60, streams=True)
+    results = []
+
+    def follow():
+        progress = scheduler.follow()
+        results.append((list(progress.follow()), progress.result.data))
+
+    threads = [threading.Thread(target=follow) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(computations) == 1
+    assert results == [([0, 1, 2, 3, 4], 'ranked')] * 8
+    assert scheduler.current().data == 'ranked' and scheduler._progress is None
+
+    # A failure reaches the followers, and the next follow() backs off while a snapshot exists
+    scheduler.compute_fn = lambda progress: 1 / 0
+    progress = scheduler.follow()
+    try:
+        list(progress.follow())
+        assert False, "follower should see the error"
+    except ZeroDivisionError:
+        pass
+    scheduler._refresh_thread.join(5)
+    assert scheduler.follow() is None and scheduler.current().data == 'ranked'
+    print("✓ Followers share one streaming computation")
+
+
+def main():
+    test_stale_snapshot_served_during_refresh()
+    test_single_refresh_in_flight()
+    test_cadence_boundary()
+    test_followers_share_one_streaming_computation()
+    print("\nAll snapshot scheduler tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Tests for the StockScore analysis wired onto the task graph.
+Sleeping fakes stand in for the inference calls (no network access needed).
+"""
+
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault('ENABLE_BACKGROUND_REFRESH', '0')
+import app
+from singleflight import Broadcast
+
+CONTEXT = {'ticker': 'AAA', 'company_name': 'Acme', 'current_price': 100.0,
+           'stock_context': 'Acme traded flat.', 'sector': 'Technology', 'industry': 'Software'}
+
+PEERS = {
+    'all_peers': [
+        {'ticker': 'BBB', 'name': 'Bee', 'price': 10.0, 'sentiment': 'positive', 'score': 0.62},
+        {'ticker': 'CCC', 'name': 'Sea', 'price': 20.0, 'sentiment': 'positive', 'score': 0.9},
+        {'ticker': 'DDD', 'name': 'Dee', 'price': 30.0, 'sentiment': 'negative', 'score': 0.95},
+        {'ticker': 'EEE', 'name': 'Eee', 'price': 40.0, 'sentiment': 'positive', 'score': 0.7},
+    ],
+    'sector': 'Technology',
+    'industry': 'Software'
+}
+
+
+def patch_sections(delay):
+    """Replace the inference-backed sections with fakes that sleep `delay` seconds"""
+    calls = []
+    lock = threading.Lock()
+
+    def fake(name, result):
+        def section(*args):
+            with lock:
+                calls.append((name, 'start', time.time()))
+            time.sleep(delay)
+            with lock:
+                calls.append((name, 'end', time.time()))
+            return result(*args) if callable(result) else result
+        return section
+
+    originals = {name: getattr(app, name) for name in (
+        'prepare_stockscore', 'call_fingpt_sentiment', 'call_finbert_news',
+        'call_finma_prediction', 'call_finllm_decision', 'collect_peer_analyses')}
+    app.prepare_stockscore = lambda ticker: dict(CONTEXT, ticker=ticker)
+    app.call_fingpt_sentiment = fake('fingpt', {'sentiment': 'positive', 'score': 0.8})
+    app.call_finbert_news = fake('finbert', {'sentiment': 'positive', 'score': 0.7})
+    app.call_finma_prediction = fake('finma', {'movement_direction': 'Upward',
+                                               'price_target_low': 98.0, 'price_target_high': 110.0})
+    app.call_finllm_decision = fake('finllm', lambda ticker, name, price, fingpt, finbert: {
+        'recommendation': 'BUY' if fingpt['sentiment'] == finbert['sentiment'] == 'positive' else 'HOLD',
+        'confidence': 'High'})
+    app.collect_peer_analyses = fake('peers', PEERS)
+    return calls, originals
+
+
+def test_sections_run_concurrently_and_stream_in_dependency_order():
+    """Independent sections overlap, FinLLM waits for its inputs, and every section is streamed"""
+    calls, originals = patch_sections(0.3)
+    progress = Broadcast()
+    try:
+        start = time.time()
+        result = app.build_stockscore('AAA', progress)
+        elapsed = time.time() - start
+    finally:
+        for name, fn in originals.items():
+            setattr(app, name, fn)
+
+    # Four independent 0.3 s sections, then FinLLM: two steps, not five
+    assert elapsed < 1.0, f"took {elapsed:.2f}s"
+    times = {(name, event): at for name, event, at in calls}
+    assert times[('finllm', 'start')] >= max(times[('fingpt', 'end')], times[('finbert', 'end')])
+    assert all(times[(name, 'start')] < times[('fingpt', 'end')] for name in ('finbert', 'finma', 'peers'))
+
+    progress.close(result)
+    streamed = list(progress.follow())
+    assert streamed[0] == ('meta', {key: result[key] for key in ('ticker', 'company_name', 'current_price', 'last_updated')})
+    sections = [item[1] for item in streamed[1:]]
+    assert sorted(sections) == sorted(app.STOCKSCORE_SECTIONS) and sections[-1] == 'consolidated_summary'
+    assert sections.index('finllm_decision') < sections.index('industry_alternatives')
+
+    assert result['finllm_decision']['recommendation'] == 'BUY'
+    alternatives = result['consolidated_summary']['industry_alternatives']
+    assert [peer['ticker'] for peer in alternatives['alternatives']] == ['CCC', 'EEE']
+    print(f"✓ StockScore sections ran concurrently in {elapsed:.2f}s and streamed in order")
+
+
+def test_select_peer_alternatives():
+    """Alternatives depend on the stock's recommendation; missing peer data passes through"""
+    buy = app.select_peer_alternatives(PEERS, 'BUY')
+    hold = app.select_peer_alternatives(PEERS, 'HOLD')
+    assert [peer['ticker'] for peer in buy['alternatives']] == ['CCC', 'EEE']
+    assert [peer['ticker'] for peer in hold['alternatives']] == ['CCC', 'EEE']
+    assert hold['has_alternatives'] and hold['all_peers'] is PEERS['all_peers']
+
+    weak = {**PEERS, 'all_peers': [PEERS['all_peers'][0]]}
+    assert [peer['ticker'] for peer in app.select_peer_alternatives(weak, 'SELL')['alternatives']] == ['BBB']
+    assert app.select_peer_alternatives(weak, 'BUY')['has_alternatives'] is False
+
+    missing = {'has_alternatives': False, 'message': 'Insufficient peer data'}
+    assert app.select_peer_alternatives(missing, 'BUY') is missing
+    print("✓ Peer alternatives follow the recommendation")
+
+
+def main():
+    test_sections_run_concurrently_and_stream_in_dependency_order()
+    test_select_peer_alternatives()
+    print("\nAll StockScore graph tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Tests for the StockScore task graph runner.
+Uses sleeping tasks in place of inference calls (no network access needed).
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from task_graph import TaskGraph
+
+
+def slow(seconds, value):
+    def task(*inputs):
+        time.sleep(seconds)
+        return (value,) + inputs
+    return task
+
+
+def test_independent_tasks_overlap():
+    """Latency follows the slowest chain, not the sum of all tasks"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        graph = TaskGraph(executor)
+        graph.add('a', slow(0.3, 'a'))
+        graph.add('b', slow(0.3, 'b'))
+        graph.add('c', slow(0.5, 'c'))
+        graph.add('ab', slow(0.1, 'ab'), deps=('a', 'b'))
+
+        start = time.time()
+        results = graph.results()
+        elapsed = time.time() - start
+
+    assert results['ab'] == ('ab', ('a',), ('b',))
+    assert elapsed < 0.8, f"took {elapsed:.2f}s"
+    print(f"✓ 4 tasks (1.2s of work) finished in {elapsed:.2f}s")
+
+
+def test_completion_order_and_validation():
+    """Results stream in completion order; unknown dependencies are rejected"""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        graph = TaskGraph(executor)
+        graph.add('slow', slow(0.2, 'slow'))
+        graph.add('fast', slow(0.0, 'fast'))
+        graph.add('after', slow(0.0, 'after'), deps=('slow',))
+        order = [name for name, _ in graph.run()]
+
+        try:
+            graph.add('broken', slow(0, 'x'), deps=('missing',))
+            raise AssertionError("unknown dependency accepted")
+        except ValueError:
+            pass
+
+    assert order == ['fast', 'slow', 'after'], order
+    print("✓ Completion order and dependency validation")
+
+
+def main():
+    test_independent_tasks_overlap()
+    test_completion_order_and_validation()
+    print("\nAll task graph tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Tests for universe loading, sharded top-N rankings and the bounded bar store (no network access needed).
+"""
+
+import os
+import random
+import sys
+import tempfile
+import pandas as pd
+import universe
+from ohlcv_store import OHLCVStore
+from rankings import RANK_KEYS, TopRankings
+
+
+def test_presets_and_files():
+    """Presets, text and CSV files load as normalized, de-duplicated tickers"""
+    assert universe.load('default') == universe.DEFAULT_UNIVERSE
+    assert 'NVDA' in universe.load('peers') and len(universe.load('peers')) == len(set(universe.load('peers')))
+
+    directory = tempfile.mkdtemp()
+    text_path = os.path.join(directory, 'mine.txt')
+    with open(text_path, 'w') as f:
+        f.write("# watchlist\naapl\nBRK.B  # class B\n\nAAPL\n")
+    assert universe.load(text_path) == ['AAPL', 'BRK-B']
+
+    csv_path = os.path.join(directory, 'index.csv')
+    with open(csv_path, 'w') as f:
+        f.write("Company,Symbol,Weight\nApple,AAPL,7.1\nBerkshire,BRK.B,1.7\n")
+    assert universe.load(csv_path) == ['AAPL', 'BRK-B']
+
+    try:
+        universe.load('no-such-universe')
+        assert False, "unknown universe should raise"
+    except ValueError as e:
+        assert 'default' in str(e)
+
+    assert universe.shards(list('abcde'), 2) == [(0, ['a', 'b']), (2, ['c', 'd']), (4, ['e'])]
+    print("✓ Universe presets and ticker files")
+
+
+def test_sharded_rankings_match_full_sort():
+    """Merged per-shard top-N heaps give the same lists as sorting every stock"""
+    rng = random.Random(3)
+    stocks = []
+    for i in range(500):
+        price = rng.uniform(10, 500)
+        stocks.append({
+            'ticker': f'T{i:03d}',
+            'prediction_score': rng.randint(40, 60),  # many ties
+            'current_price': price,
+            'mid_term': {'predicted_price': round(price * rng.uniform(0.9, 1.2), 0)},
+            'long_term': {'predicted_price': None if i % 7 == 0 else price * rng.uniform(0.8, 1.5)}
+        })
+
+    rankings = TopRankings()
+    for offset, shard in universe.shards(stocks, 37):
+        rankings.merge(TopRankings(offset=offset).extend(shard))
+
+    assert rankings.count == len(stocks)
+    for timeframe, key in RANK_KEYS.items():
+        expected = sorted(stocks, key=key, reverse=True)[:20]
+        assert [s['ticker'] for s in rankings.ranked(timeframe)] == [s['ticker'] for s in expected], timeframe
+    print("✓ Sharded rankings match a full sort, ties included")
+
+
+def test_store_evicts_without_losing_bars():
+    """Evicted frames are re-read from disk, and merges keep the stored history"""
+    store = OHLCVStore(root=tempfile.mkdtemp(), history_period='max', max_frames=2)
+    index = pd.date_range('2024-01-01', periods=10, freq='B', tz='America/New_York')
+    bars = pd.DataFrame({'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': range(10), 'Volume': 1.0}, index=index)
+
+    for ticker in ('AAA', 'BBB', 'CCC'):
+        store._merge(ticker, bars.iloc[:8])
+    assert list(store._frames) == ['BBB', 'CCC'] and store.stats['evictions'] == 1
+
+    store._merge('AAA', bars.iloc[7:])
+    assert len(store.load('AAA')) == 10
+    assert len(store._frames) == 2
+    print("✓ Bar store stays bounded and keeps evicted history")
+
+
+def main():
+    test_presets_and_files()
+    test_sharded_rankings_match_full_sort()
+    test_store_evicts_without_losing_bars()
+    print("\nAll universe tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Tests for the warm-start snapshot file and its use by the scheduler (no network access needed).
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+import numpy as np
+import warm_snapshot
+from fundamentals import FundamentalsCache
+from snapshot_scheduler import SnapshotScheduler
+
+
+def sample_payload(generated_at):
+    return {
+        'format': warm_snapshot.FORMAT_VERSION,
+        'generated_at': generated_at.astimezone().isoformat(),
+        'universe': ['AAA'],
+        'top_stocks': {'short_term': [{'ticker': 'AAA', 'prediction_score': np.int64(70)}],
+                       'mid_term': [], 'long_term': []},
+        'indicators': {'AAA': {'RSI': np.float64(55.5), 'SMA_200': float('nan')}},
+        'fundamentals': {'AAA': {'longName': 'Alpha', 'forwardPE': 12.5}}
+    }
+
+
+def test_round_trip_and_seeding():
+    """The file round-trips through mmap and primes the fundamentals cache"""
+    path = os.path.join(tempfile.mkdtemp(), 'snapshots', 'top_stocks.json')
+    warm_snapshot.write(sample_payload(datetime.now() - timedelta(minutes=5)), path)
+
+    payload = warm_snapshot.load(path)
+    assert payload['top_stocks']['short_term'][0]['prediction_score'] == 70
+    assert payload['indicators']['AAA'] == {'RSI': 55.5, 'SMA_200': None}
+    assert abs((datetime.now() - warm_snapshot.generated_at(payload)).total_seconds() - 300) < 5
+
+    cache = FundamentalsCache(ttl=3600)
+    assert warm_snapshot.seed_fundamentals(cache, payload) == 1
+    assert cache.get('AAA').get('forwardPE') == 12.5 and cache.stats()['hits'] == 1
+
+    with open(path, 'w') as f:
+        f.write('{"format": 0}')
+    assert warm_snapshot.load(path) is None
+    assert warm_snapshot.load(path + '.missing') is None
+    print("✓ Snapshot file round trip and fundamentals seeding")
+
+
+def test_stale_warm_start_refreshes_in_background():
+    """A stale bundled snapshot is served immediately while a fresh one is computed"""
+    def compute():
+        time.sleep(0.2)
+        return {'short_term': ['fresh']}
+
+    scheduler = SnapshotScheduler('test', compute, market_interval=60, off_hours_interval=60)
+    scheduler.publish({'short_term': ['bundled']}, generated_at=datetime.now() - timedelta(hours=2),
+                      source='warm-start')
+
+    start = time.time()
+    assert scheduler.get().data == {'short_term': ['bundled']}
+    assert time.time() - start < 0.1
+
+    scheduler._refresh_thread.join(5)
+    assert scheduler.get().data == {'short_term': ['fresh']} and scheduler.get().source == 'computed'
+    print("✓ Stale warm start served while refreshing")
+
+
+def main():
+    test_round_trip_and_seeding()
+    test_stale_warm_start_refreshes_in_background()
+    print("\nAll warm snapshot tests passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Stock universes: named presets and ticker files.
+
+STOCK_UNIVERSE selects the universe the engine ranks. It is either a preset
+name or a path to a ticker file:
+
+- `default`: the built-in mix of large caps across sectors
+- `peers`: every ticker in the industry peer groups
+- any `<name>.txt` or `<name>.csv` in `universes/` (e.g. `sp1500`)
+
+Text files list one ticker per line (`#` starts a comment). CSV files use
+the first column named Symbol, Ticker or Code, so index constituent exports
+work as they are.
+"""
+
+import csv
+import os
+
+UNIVERSE_DIR = os.environ.get(
+    'UNIVERSE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'universes')
+)
+
+# Tickers per shard when ranking; each shard's bars and indicators are freed before the next
+SHARD_SIZE = int(os.environ.get('UNIVERSE_SHARD_SIZE', 250))
+# Shards processed at once (peak memory grows with this, not with the universe)
+SHARD_WORKERS = int(os.environ.get('UNIVERSE_SHARD_WORKERS', 1))
+
+# Popular stocks to analyze (mix of sectors)
+DEFAULT_UNIVERSE = [
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B',
+    'JPM', 'JNJ', 'V', 'WMT', 'PG', 'MA', 'UNH', 'HD', 'DIS', 'BAC',
+    'ADBE', 'CRM', 'NFLX', 'CSCO', 'PEP', 'KO', 'INTC', 'AMD', 'NKE',
+    'PYPL', 'CMCSA', 'XOM', 'CVX', 'LLY', 'PFE', 'ABBV', 'TMO', 'COST',
+    'MRK', 'AVGO', 'ORCL', 'ACN', 'TXN', 'DHR', 'NEE', 'VZ', 'PM',
+    'UNP', 'RTX', 'BMY', 'HON', 'QCOM', 'LOW', 'IBM', 'SBUX', 'AMT'
+]
+
+TICKER_COLUMNS = ('symbol', 'ticker', 'code')
+
+
+def _peer_universe():
+    from peer_scoreboard import INDUSTRY_GROUPS
+    return [ticker for members in INDUSTRY_GROUPS.values() for ticker in members]
+
+
+PRESETS = {
+    'default': lambda: DEFAULT_UNIVERSE,
+    'peers': _peer_universe
+}
+
+
+def normalize(tickers):
+    """Uppercase, Yahoo-style (BRK.B -> BRK-B), de-duplicated tickers in their original order"""
+    seen = set()
+    result = []
+    for ticker in tickers:
+        ticker = ticker.strip().upper().replace('.', '-')
+        if ticker and ticker not in seen:
+            seen.add(ticker)
+            result.append(ticker)
+    return result
+
+
+def read_file(path):
+    """Tickers from a .txt (one per line) or .csv (Symbol/Ticker/Code column) file"""
+    with open(path, newline='') as f:
+        if not path.lower().endswith('.csv'):
+            return normalize(line.split('#', 1)[0] for line in f)
+
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        column = next((header.index(name) for name in TICKER_COLUMNS if name in header), None)
+        if column is None:
+            raise ValueError(f"{path} has no Symbol, Ticker or Code column")
+        return normalize(row[column] for row in reader if len(row) > column)
+
+
+def available():
+    """Preset names, including ticker files in UNIVERSE_DIR"""
+    names = set(PRESETS)
+    if os.path.isdir(UNIVERSE_DIR):
+        names.update(os.path.splitext(name)[0] for name in os.listdir(UNIVERSE_DIR)
+                     if name.endswith(('.txt', '.csv')))
+    return sorted(names)
+
+
+def load(spec=None):
+    """Tickers for a preset name, file path or list (default: STOCK_UNIVERSE, else `default`)"""
+    if isinstance(spec, (list, tuple)):
+        return normalize(spec)
+    spec = spec or os.environ.get('STOCK_UNIVERSE') or 'default'
+
+    if spec in PRESETS:
+        return normalize(PRESETS[spec]())
+    for extension in ('.txt', '.csv'):
+        path = os.path.join(UNIVERSE_DIR, spec + extension)
+        if os.path.exists(path):
+            return read_file(path)
+    if os.path.exists(spec):
+        return read_file(spec)
+
+    raise ValueError(f"Unknown stock universe '{spec}'; available: {', '.join(available())}")
+
+
+def shards(tickers, size=None):
+    """(offset, tickers) slices of at most `size` tickers"""
+    size = max(int(size or SHARD_SIZE), 1)
+    return [(start, tickers[start:start + size]) for start in range(0, len(tickers), size)]
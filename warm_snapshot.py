@@ -0,0 +1,137 @@
+"""
+Prebuilt top-stocks snapshot for warm starts.
+
+Run at build or cron time to compute the ranking and write it, with the
+latest indicators and fundamentals of every ranked ticker, to a compact
+JSON file that ships with the deployment:
+
+    python warm_snapshot.py [--output snapshots/top_stocks.json]
+
+At startup the app memory-maps the file and serves its ranking right away;
+a fresh ranking is computed in the background once the bundled one is
+older than the refresh cadence.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+from datetime import datetime
+from json_response import ORJSON_AVAILABLE, to_json_bytes
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+# Bumped whenever the payload layout changes; older files are ignored
+FORMAT_VERSION = 1
+
+WARM_SNAPSHOT_PATH = os.environ.get(
+    'WARM_SNAPSHOT_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'snapshots', 'top_stocks.json')
+)
+
+
+def build(engine):
+    """Run the ranking pipeline and return the snapshot payload"""
+    from indicator_panel import IndicatorPanel
+
+    start = time.time()
+    rankings = engine.rank_universe()
+    top_stocks = rankings.result()
+    tickers = rankings.tickers()
+
+    # Bars were refreshed by the ranking run, so this reads the local store
+    panel = IndicatorPanel(engine.get_bulk_stock_data(tickers))
+    indicator_tickers = list(panel.frames_with_indicators())
+    latest = panel.latest(indicator_tickers)
+    indicators = {
+        ticker: {name: round(float(values[i]), 4) for name, values in latest.items()}
+        for i, ticker in enumerate(indicator_tickers)
+    }
+
+    return {
+        'format': FORMAT_VERSION,
+        'generated_at': datetime.now().astimezone().isoformat(),
+        'build_seconds': round(time.time() - start, 1),
+        'universe': list(engine.stock_universe),
+        'top_stocks': top_stocks,
+        'indicators': indicators,
+        'fundamentals': {ticker: engine.fundamentals.get(ticker).to_dict() for ticker in tickers}
+    }
+
+
+def write(payload, path=None):
+    """Write the payload atomically as compact JSON; returns the byte size"""
+    path = path or WARM_SNAPSHOT_PATH
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    data = to_json_bytes(payload)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def load(path=None):
+    """Memory-map and parse a snapshot file; None if missing, unreadable or outdated"""
+    path = path or WARM_SNAPSHOT_PATH
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if ORJSON_AVAILABLE:
+                    view = memoryview(mapped)
+                    try:
+                        payload = orjson.loads(view)
+                    finally:
+                        view.release()
+                else:
+                    payload = json.loads(mapped.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring warm-start snapshot {path}: {e}")
+        return None
+
+    if not isinstance(payload, dict) or payload.get('format') != FORMAT_VERSION:
+        print(f"Ignoring warm-start snapshot {path}: unsupported format")
+        return None
+    return payload
+
+
+def generated_at(payload):
+    """Build time as a naive local datetime, like Snapshot.generated_at"""
+    return datetime.fromisoformat(payload['generated_at']).astimezone().replace(tzinfo=None)
+
+
+def seed_fundamentals(cache, payload):
+    """Prime a FundamentalsCache with the snapshot's records; returns how many were added"""
+    from fundamentals import Fundamentals
+
+    records = {ticker: Fundamentals.from_info(info) for ticker, info in payload.get('fundamentals', {}).items()}
+    return cache.seed(records, generated_at(payload).timestamp())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the warm-start top-stocks snapshot")
+    parser.add_argument('--output', default=WARM_SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    from prediction_engine import StockPredictionEngine
+
+    payload = build(StockPredictionEngine())
+    if not payload['top_stocks']['short_term']:
+        print("No stocks could be analyzed; keeping the existing snapshot")
+        return 1
+
+    size = write(payload, args.output)
+    print(f"Wrote {args.output}: {len(payload['universe'])} stocks, {size / 1024:.0f} KB, "
+          f"built in {payload['build_seconds']}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())